@@ -0,0 +1,69 @@
+"""
+ASGI용 비동기 조회 View 기반 클래스
+
+DRF 3.14의 APIView/ViewSet은 동기 전용이므로 ASGI 서버에서는 요청마다 스레드로 옮겨 실행된다.
+AsyncAPIView는 Django 비동기 View(async def 핸들러)로 동작하여, DB 응답을 기다리는 동안
+이벤트 루프가 다른 요청을 처리한다. DB 조회는 Django 비동기 ORM(aget, async for 등)을 사용한다.
+
+DRF와 같은 권한 클래스(has_permission)와 오류 응답 형식({'detail': ...})을 사용하며,
+응답은 JSONRenderer로 렌더링한다. 조회 전용(GET/HEAD/OPTIONS)이다.
+"""
+from django.http import Http404, HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound, PermissionDenied
+from rest_framework.renderers import JSONRenderer
+
+from .db_routing import ais_pinned_to_primary, read_context, replica_alias
+
+
+class AsyncAPIView(View):
+    """
+    비동기 조회 API View
+
+    하위 클래스는 async def get()을 구현하고 dict/list를 render()로 반환한다.
+    조회는 ReplicaReadMixin과 같은 규칙으로 복제본 또는 primary에서 실행된다.
+    """
+
+    http_method_names = ['get', 'head', 'options']
+    permission_classes = ()
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            self.check_permissions(request)
+
+            profile = getattr(request, 'user_profile', None)
+            pinned = replica_alias() is not None and await ais_pinned_to_primary(getattr(profile, 'id', None))
+            with read_context(pinned):
+                return await super().dispatch(request, *args, **kwargs)
+
+        except Http404:
+            return self.handle_exception(NotFound())
+        except APIException as exc:
+            return self.handle_exception(exc)
+
+    def get_permissions(self) -> list:
+        return [permission() for permission in self.permission_classes]
+
+    def check_permissions(self, request) -> None:
+        """
+        권한 확인 (DRF 권한 클래스 재사용)
+
+        Raises:
+            PermissionDenied: 권한 없음 (DRF 인증 클래스를 사용하지 않으므로 401 대신 403)
+        """
+        for permission in self.get_permissions():
+            if not permission.has_permission(request, self):
+                raise PermissionDenied(getattr(permission, 'message', None))
+
+    def handle_exception(self, exc: APIException) -> HttpResponse:
+        """DRF 예외를 DRF 기본 예외 처리와 같은 형식의 응답으로 변환"""
+        if isinstance(exc.detail, (list, dict)):
+            data = exc.detail
+        else:
+            data = {'detail': exc.detail}
+        return self.render(data, status=exc.status_code)
+
+    @staticmethod
+    def render(data, status: int = 200) -> HttpResponse:
+        """JSON 응답 생성 (DRF Response + JSONRenderer와 같은 본문)"""
+        return HttpResponse(JSONRenderer().render(data), status=status, content_type='application/json')
@@ -0,0 +1,317 @@
+from collections import defaultdict
+from typing import Dict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import ProtectedError, RestrictedError
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    미리 조회한 관계 객체를 사용하는 PrimaryKeyRelatedField
+
+    serializer context['related_objects'][모델]에 {pk: 객체}가 있으면
+    항목마다 queryset.get()을 호출하지 않고 그 객체를 사용한다 (대량 검증용).
+    """
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get('related_objects', {}).get(self.get_queryset().model)
+        if prefetched is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if pk not in prefetched:
+            self.fail('does_not_exist', pk_value=data)
+        return prefetched[pk]
+
+
+class BulkWriteMixin:
+    """
+    대량 생성/수정/삭제 API (/<resource>/bulk/)
+
+    POST   [{...}, ...]              -> bulk_create
+    PATCH  [{"id": 1, ...}, ...]     -> bulk_update (부분 수정)
+    DELETE {"ids": [1, 2, ...]}      -> DELETE ... WHERE id IN (...)
+
+    전체 항목을 한 번에 검증하고(관계 객체/고유값은 IN 쿼리 한 번으로 확인)
+    하나라도 오류가 있으면 아무것도 반영하지 않고 항목별 오류를 400으로 반환한다.
+    모든 항목이 유효하면 하나의 트랜잭션으로 반영하고 항목별 결과를 반환한다.
+
+    반영 후 처리는 after_bulk_write(instances), 삭제 방식은 perform_bulk_delete(queryset)를 구현한다.
+    """
+
+    bulk_batch_size = 500
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        if request.method == 'DELETE':
+            payload = request.data.get('ids') if isinstance(request.data, dict) else None
+        else:
+            payload = request.data
+
+        if not isinstance(payload, list) or not payload:
+            return Response(
+                {'error': '비어 있지 않은 목록을 전달해야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        max_items = getattr(settings, 'DASHBOARD_BULK_MAX_ITEMS', 5000)
+        if len(payload) > max_items:
+            return Response(
+                {'error': f'한 번에 최대 {max_items}건까지 처리할 수 있습니다.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        handler = {
+            'POST': self._bulk_create,
+            'PATCH': self._bulk_update,
+            'DELETE': self._bulk_delete,
+        }[request.method]
+
+        try:
+            return handler(payload)
+        except (ProtectedError, RestrictedError):
+            return Response(
+                {'error': '다른 데이터에서 참조 중인 항목이 있어 삭제할 수 없습니다.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except IntegrityError:
+            return Response(
+                {'error': '데이터 무결성 제약 조건을 위반했습니다.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+    def after_bulk_write(self, instances: list) -> None:
+        """대량 반영 후 처리 (트랜잭션 안에서 호출, 삭제 시 삭제 전 인스턴스)"""
+
+    def perform_bulk_delete(self, queryset) -> None:
+        """대량 삭제 실행 (트랜잭션 안에서 호출)"""
+        queryset.delete()
+
+    # ----- 생성 -----
+
+    def _bulk_create(self, items: list) -> Response:
+        serializer = self._get_bulk_serializer(items)
+        errors = self._validate_items(serializer, items)
+        if errors:
+            return self._error_response(errors)
+
+        model = serializer.child.Meta.model
+        objects = [model(**data) for data in serializer.validated_data]
+        with transaction.atomic():
+            created = model.objects.bulk_create(objects, batch_size=self.bulk_batch_size)
+            self.after_bulk_write(created)
+
+        return Response(
+            {
+                'count': len(created),
+                'results': [
+                    {'index': index, 'status': 'created', 'id': obj.pk}
+                    for index, obj in enumerate(created)
+                ],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    # ----- 수정 -----
+
+    def _bulk_update(self, items: list) -> Response:
+        errors: Dict[int, dict] = {}
+        ids = []
+        for index, item in enumerate(items):
+            item_id = item.get('id') if isinstance(item, dict) else None
+            if not isinstance(item_id, int) or isinstance(item_id, bool):
+                errors[index] = {'id': ['수정할 항목의 id가 필요합니다.']}
+            ids.append(item_id)
+
+        instances = self.get_queryset().in_bulk([item_id for item_id in ids if item_id is not None])
+        for index, item_id in enumerate(ids):
+            if index not in errors and item_id not in instances:
+                errors[index] = {'id': [f'존재하지 않는 항목입니다: {item_id}']}
+        if len(set(ids)) != len(ids):
+            seen = set()
+            for index, item_id in enumerate(ids):
+                if item_id in seen:
+                    errors.setdefault(index, {'id': [f'중복된 id입니다: {item_id}']})
+                seen.add(item_id)
+        if errors:
+            return self._error_response(errors)
+
+        serializer = self._get_bulk_serializer(items, partial=True)
+        errors = self._validate_items(serializer, items, exclude_ids=ids)
+        if errors:
+            return self._error_response(errors)
+
+        model = serializer.child.Meta.model
+        # bulk_update는 save()를 거치지 않으므로 auto_now 필드(updated_at 등)를 직접 갱신
+        auto_now_fields = [
+            field for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)
+        ]
+
+        updated = []
+        update_fields = set()
+        for item_id, data in zip(ids, serializer.validated_data):
+            instance = instances[item_id]
+            for attr, value in data.items():
+                setattr(instance, attr, value)
+            for field in auto_now_fields:
+                field.pre_save(instance, add=False)
+            update_fields.update(data.keys())
+            updated.append(instance)
+        if update_fields:
+            update_fields.update(field.name for field in auto_now_fields)
+
+        with transaction.atomic():
+            before = list(self.get_queryset().filter(pk__in=ids))
+            if update_fields:
+                model.objects.bulk_update(
+                    updated, sorted(update_fields), batch_size=self.bulk_batch_size
+                )
+            self.after_bulk_write(before + updated)
+
+        return Response({
+            'count': len(updated),
+            'results': [
+                {'index': index, 'status': 'updated', 'id': item_id}
+                for index, item_id in enumerate(ids)
+            ],
+        })
+
+    # ----- 삭제 -----
+
+    def _bulk_delete(self, ids: list) -> Response:
+        errors: Dict[int, dict] = {}
+        for index, item_id in enumerate(ids):
+            if not isinstance(item_id, int) or isinstance(item_id, bool):
+                errors[index] = {'id': [f'유효하지 않은 id입니다: {item_id}']}
+        if errors:
+            return self._error_response(errors)
+
+        queryset = self.get_queryset().filter(pk__in=ids)
+        instances = list(queryset)
+        existing = {instance.pk for instance in instances}
+        for index, item_id in enumerate(ids):
+            if item_id not in existing:
+                errors[index] = {'id': [f'존재하지 않는 항목입니다: {item_id}']}
+        if errors:
+            return self._error_response(errors)
+
+        with transaction.atomic():
+            self.perform_bulk_delete(queryset.model.objects.filter(pk__in=existing))
+            self.after_bulk_write(instances)
+
+        return Response({
+            'count': len(existing),
+            'results': [
+                {'index': index, 'status': 'deleted', 'id': item_id}
+                for index, item_id in enumerate(ids)
+            ],
+        })
+
+    # ----- 검증 -----
+
+    def _get_bulk_serializer(self, items: list, partial: bool = False):
+        """관계 객체를 미리 조회한 context로 many=True Serializer 생성"""
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        context['related_objects'] = self._prefetch_related_objects(serializer_class(), items)
+
+        serializer = serializer_class(data=items, many=True, partial=partial, context=context)
+        # 고유값 검증은 _find_unique_conflicts에서 IN 쿼리 한 번으로 수행
+        for field in serializer.child.fields.values():
+            field.validators = [
+                validator for validator in field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        if partial:
+            # 부분 수정은 인스턴스 없이 검증하므로 복합 고유 조건은 DB 제약 조건으로 확인
+            serializer.child.validators = [
+                validator for validator in serializer.child.validators
+                if not isinstance(validator, UniqueTogetherValidator)
+            ]
+        return serializer
+
+    def _prefetch_related_objects(self, serializer, items: list) -> dict:
+        """PrefetchedPrimaryKeyRelatedField 값을 모델별 in_bulk로 한 번에 조회"""
+        related_objects = {}
+        for name, field in serializer.fields.items():
+            if field.read_only or not isinstance(field, PrefetchedPrimaryKeyRelatedField):
+                continue
+            pks = set()
+            for item in items:
+                value = item.get(name) if isinstance(item, dict) else None
+                if isinstance(value, (int, str)) and not isinstance(value, bool) and str(value).isdigit():
+                    pks.add(int(value))
+            queryset = field.get_queryset()
+            related_objects.setdefault(queryset.model, {}).update(queryset.in_bulk(pks))
+        return related_objects
+
+    def _validate_items(self, serializer, items: list, exclude_ids=None) -> Dict[int, dict]:
+        """항목별 필드 검증 + 고유값 충돌 검사 (index -> 오류)"""
+        errors: Dict[int, dict] = {}
+        if not serializer.is_valid():
+            for index, item_errors in enumerate(serializer.errors):
+                if item_errors:
+                    errors[index] = item_errors
+            return errors
+
+        for index, item_errors in self._find_unique_conflicts(
+            serializer.child, serializer.validated_data, exclude_ids
+        ).items():
+            errors[index] = item_errors
+        return errors
+
+    def _find_unique_conflicts(self, serializer, validated_items: list, exclude_ids=None) -> Dict[int, dict]:
+        """고유 필드 값의 요청 내 중복 및 기존 데이터 충돌 검사 (필드당 쿼리 1회)"""
+        model = serializer.Meta.model
+        errors: Dict[int, dict] = defaultdict(dict)
+
+        unique_fields = [
+            field.name for field in model._meta.fields
+            if field.unique and not field.primary_key and field.name in serializer.fields
+        ]
+        for name in unique_fields:
+            values_by_index = {
+                index: data[name] for index, data in enumerate(validated_items)
+                if data.get(name) is not None
+            }
+            if not values_by_index:
+                continue
+
+            seen = {}
+            for index, value in values_by_index.items():
+                if value in seen:
+                    errors[index][name] = [f'요청 안에서 중복된 값입니다: {value}']
+                seen.setdefault(value, index)
+
+            existing = model.objects.filter(**{f'{name}__in': set(values_by_index.values())})
+            if exclude_ids:
+                existing = existing.exclude(pk__in=exclude_ids)
+            conflicts = set(existing.values_list(name, flat=True))
+            for index, value in values_by_index.items():
+                if value in conflicts:
+                    errors[index][name] = [f'이미 존재하는 값입니다: {value}']
+
+        return dict(errors)
+
+    @staticmethod
+    def _error_response(errors: Dict[int, dict]) -> Response:
+        return Response(
+            {
+                'error': '유효하지 않은 항목이 있어 반영하지 않았습니다.',
+                'results': [
+                    {'index': index, 'status': 'error', 'errors': item_errors}
+                    for index, item_errors in sorted(errors.items())
+                ],
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
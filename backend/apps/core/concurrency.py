@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Dict
+
+from django.db import connections
+
+
+def _run_with_own_connection(func: Callable[[], Any]) -> Any:
+    """
+    워커 스레드에서 함수 실행 후 스레드 전용 DB 연결 정리
+
+    Django의 DB 연결은 스레드별로 생성되므로, 작업이 끝나면 직접 닫지 않으면
+    스레드가 재사용/종료될 때까지 연결이 남는다.
+    """
+    try:
+        return func()
+    finally:
+        connections.close_all()
+
+
+def run_concurrently(tasks: Dict[str, Callable[[], Any]], max_workers: int) -> Dict[str, Any]:
+    """
+    서로 독립적인 작업들을 제한된 스레드 풀에서 동시에 실행
+
+    Args:
+        tasks: 결과 키 -> 인자 없는 함수
+        max_workers: 최대 동시 실행 스레드 수
+
+    Returns:
+        결과 키 -> 함수 반환값 (하나라도 실패하면 해당 예외를 그대로 발생)
+    """
+    if not tasks:
+        return {}
+
+    workers = max(1, min(max_workers, len(tasks)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # 호출한 쪽의 컨텍스트(DB 라우팅, 요청 계측 등)를 작업 스레드에서도 유지
+        futures = {
+            key: executor.submit(copy_context().run, _run_with_own_connection, func)
+            for key, func in tasks.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
@@ -0,0 +1,158 @@
+"""
+읽기 복제본(replica) DB 라우팅
+
+DATABASE_READ_REPLICA가 설정되면 read_from_replica() 안에서 실행한 조회만 복제본으로 보내고,
+그 외 조회(관리 명령, 엑셀 Import, 인증 등)와 모든 쓰기는 기본(primary) DB를 사용한다.
+조회 API는 ReplicaReadMixin으로 복제본을 사용하며, 쓰기 직후 DATABASE_REPLICA_PIN_SECONDS 동안은
+쓰기를 한 사용자만 복제 지연으로 방금 쓴 데이터가 보이지 않는 일이 없도록 primary에서 읽는다.
+다른 사용자의 조회는 계속 복제본을 사용하고, 데이터 버전 캐시에 저장할 결과 계산만
+같은 시간 동안 primary에서 실행한다 (cache_build_context).
+"""
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+
+PRIMARY_DB = 'default'
+PIN_KEY_PREFIX = 'db:primary-pin'
+# 데이터 변경 직후 캐시 결과 계산만 primary에서 하도록 표시하는 키 (복제 지연된 결과가 새 버전으로 캐시되는 것 방지)
+CACHE_BUILD_PIN_KEY = f'{PIN_KEY_PREFIX}:cache-build'
+
+_read_db: ContextVar[Optional[str]] = ContextVar('db_read_alias', default=None)
+
+
+def replica_alias() -> Optional[str]:
+    """조회를 보낼 복제본 DB 별칭 (설정되지 않았으면 None)"""
+    return settings.DATABASE_READ_REPLICA or None
+
+
+@contextmanager
+def read_from_replica():
+    """블록 안의 조회를 복제본으로 보냄 (복제본이 없으면 primary)"""
+    token = _read_db.set(replica_alias() or PRIMARY_DB)
+    try:
+        yield
+    finally:
+        _read_db.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """블록(또는 데코레이트한 함수) 안의 조회를 primary로 고정"""
+    token = _read_db.set(PRIMARY_DB)
+    try:
+        yield
+    finally:
+        _read_db.reset(token)
+
+
+def _pin_key(user_id) -> str:
+    return f'{PIN_KEY_PREFIX}:{user_id}'
+
+
+def _pin_window() -> int:
+    """primary 고정 시간 (초, 복제본이 없거나 0 이하이면 고정하지 않음)"""
+    if replica_alias() is None:
+        return 0
+    return settings.DATABASE_REPLICA_PIN_SECONDS
+
+
+def pin_to_primary(user_id) -> None:
+    """
+    쓰기 직후 일정 시간 해당 사용자의 조회를 primary로 고정
+
+    Args:
+        user_id: 쓰기를 수행한 사용자 ID (다른 사용자의 조회에는 영향 없음)
+    """
+    window = _pin_window()
+    if window > 0:
+        cache.set(_pin_key(user_id), True, timeout=window)
+
+
+def is_pinned_to_primary(user_id) -> bool:
+    """사용자가 최근 쓰기로 primary에 고정되어 있는지 여부 (익명 요청은 고정하지 않음)"""
+    return user_id is not None and bool(cache.get(_pin_key(user_id)))
+
+
+async def ais_pinned_to_primary(user_id) -> bool:
+    """is_pinned_to_primary의 비동기 버전 (ASGI View용)"""
+    return user_id is not None and bool(await cache.aget(_pin_key(user_id)))
+
+
+def pin_cache_builds_to_primary() -> None:
+    """데이터 변경 직후 일정 시간 캐시 결과 계산을 primary에서 실행 (데이터 버전 증가 시 호출)"""
+    window = _pin_window()
+    if window > 0:
+        cache.set(CACHE_BUILD_PIN_KEY, True, timeout=window)
+
+
+def cache_build_context():
+    """
+    데이터 버전 캐시에 저장할 결과를 계산하는 블록의 DB 컨텍스트
+
+    데이터 변경 직후 복제본에서 계산하면 이전 데이터가 새 버전 키로 캐시되어 다음 변경까지
+    모든 사용자에게 보이므로, 고정 시간 동안은 캐시 미스 계산만 primary에서 실행한다.
+    캐시하지 않는 조회는 요청 사용자 기준 고정(ReplicaReadMixin)만 따른다.
+    """
+    if _pin_window() > 0 and cache.get(CACHE_BUILD_PIN_KEY):
+        return use_primary()
+    return nullcontext()
+
+
+def read_context(pinned: bool):
+    """
+    조회 요청의 DB 선택 컨텍스트 (복제본이 없거나 primary 고정이면 primary)
+
+    비동기 View에서도 사용한다. 컨텍스트 변수로 지정하므로 블록 안에서 실행한
+    Django 비동기 ORM 조회(sync_to_async로 실행)에도 그대로 적용된다.
+    """
+    if replica_alias() is None or pinned:
+        return use_primary()
+    return read_from_replica()
+
+
+class PrimaryReplicaRouter:
+    """
+    DB 라우터 (settings.DATABASE_ROUTERS)
+
+    조회는 현재 컨텍스트가 지정한 DB(read_from_replica/use_primary), 지정이 없으면 primary.
+    쓰기와 마이그레이션은 항상 primary (복제본은 DB 차원에서 복제된다).
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_db.get() or PRIMARY_DB
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DB
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_DB
+
+
+class ReplicaReadMixin:
+    """
+    DRF View Mixin: 조회(GET/HEAD/OPTIONS)는 복제본, 성공한 쓰기 후에는 요청 사용자를 primary에 고정
+
+    SupabaseAuthMiddleware가 설정한 request.user_profile 기준으로 사용자를 구분한다.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        profile = getattr(request, 'user_profile', None)
+        user_id = getattr(profile, 'id', None)
+
+        if request.method not in SAFE_METHODS:
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code < 400 and user_id is not None:
+                pin_to_primary(user_id)
+            return response
+
+        pinned = replica_alias() is not None and is_pinned_to_primary(user_id)
+        with read_context(pinned):
+            return super().dispatch(request, *args, **kwargs)
@@ -0,0 +1,34 @@
+from django.db.models import Aggregate, BigIntegerField, FloatField, Func
+
+
+class RunningSum(Func):
+    """
+    집계 결과에 대한 누적 합계 (Window 전용)
+
+    Django의 Sum은 다른 집계를 인자로 받을 수 없으므로
+    Window(RunningSum(Sum('amount')), order_by=...) 형태로
+    SUM(SUM(...)) OVER (...) 를 생성한다.
+    """
+
+    function = 'SUM'
+    window_compatible = True
+    output_field = BigIntegerField()
+
+
+class PercentileCont(Aggregate):
+    """
+    연속 백분위수 집계 (PostgreSQL 전용)
+
+    percentile_cont(<분위>) WITHIN GROUP (ORDER BY <식>) 를 생성한다.
+    NULL 값은 제외되며, 값 사이는 선형 보간한다.
+    """
+
+    function = 'percentile_cont'
+    template = '%(function)s(%(fraction)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+    output_field = FloatField()
+
+    def __init__(self, expression, fraction: float, **extra):
+        fraction = float(fraction)
+        if not 0 <= fraction <= 1:
+            raise ValueError('백분위 분위는 0과 1 사이여야 합니다.')
+        super().__init__(expression, fraction=fraction, **extra)
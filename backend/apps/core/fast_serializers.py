@@ -0,0 +1,128 @@
+from datetime import date
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .instrumentation import timed
+
+
+# to_representation이 값을 그대로 반환하는 필드 (values() 결과를 변환 없이 사용)
+IDENTITY_FIELD_TYPES = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+# values() 값을 필드의 to_representation으로 변환하는 필드
+CONVERTED_FIELD_TYPES = (
+    serializers.DateTimeField,
+    serializers.DateField,
+    serializers.DecimalField,
+    serializers.FloatField,
+)
+
+
+def _iso_datetime_converter(field: serializers.DateTimeField) -> Callable:
+    """
+    ISO 8601 DateTimeField.to_representation과 같은 결과의 변환 함수
+
+    필드 시간대(요청 시점의 현재 시간대)를 한 번만 조회하고 aware datetime은
+    astimezone()만 수행한다. 그 외 값은 필드의 to_representation을 사용한다.
+    """
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if isinstance(value, str) or timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+    return convert
+
+
+def _converter_for(field) -> Callable:
+    """응답 생성 시점의 변환 함수 (ISO 8601 날짜/일시는 전용 함수 사용)"""
+    if isinstance(field, serializers.DateTimeField):
+        if getattr(field, 'format', api_settings.DATETIME_FORMAT) == ISO_8601:
+            return _iso_datetime_converter(field)
+    elif isinstance(field, serializers.DateField):
+        if getattr(field, 'format', api_settings.DATE_FORMAT) == ISO_8601:
+            return date.isoformat
+    return field.to_representation
+
+
+_compiled_cache: Dict[tuple, Optional['ValuesSerializer']] = {}
+
+
+class ValuesSerializer:
+    """
+    읽기 전용 목록 직렬화 고속 경로
+
+    ModelSerializer의 필드 정의를 (출력 키, values() 경로, 변환 함수) 목록으로
+    한 번만 컴파일해 두고, queryset.values() 행(dict)에서 바로 응답 dict를 만든다.
+    모델 인스턴스 생성과 필드별 get_attribute/to_representation 호출을 건너뛰며
+    출력 형식은 ModelSerializer와 동일하다.
+    """
+
+    def __init__(self, accessors: List[Tuple[str, str, Optional[serializers.Field]]]):
+        # (출력 키, values() 경로, 변환이 필요한 필드 또는 None)
+        self.accessors = accessors
+        self.value_paths = list(dict.fromkeys(path for _, path, _ in accessors))
+
+    @classmethod
+    def for_serializer(cls, serializer: serializers.Serializer) -> Optional['ValuesSerializer']:
+        """
+        Serializer 인스턴스(필드 제한 반영)에 대한 고속 직렬화기 반환
+
+        values()로 표현할 수 없는 필드(SerializerMethodField, 중첩 Serializer 등)가
+        있으면 None을 반환하며, 이 경우 기존 Serializer 경로를 사용해야 한다.
+        """
+        key = (type(serializer), tuple(serializer.fields.keys()))
+        if key not in _compiled_cache:
+            _compiled_cache[key] = cls._compile(serializer)
+        return _compiled_cache[key]
+
+    @classmethod
+    def _compile(cls, serializer) -> Optional['ValuesSerializer']:
+        accessors = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if '*' in field.source_attrs or not field.source_attrs:
+                return None
+            if isinstance(field, IDENTITY_FIELD_TYPES):
+                converted_field = None
+            elif isinstance(field, CONVERTED_FIELD_TYPES):
+                converted_field = field
+            else:
+                return None
+            accessors.append((name, '__'.join(field.source_attrs), converted_field))
+        return cls(accessors)
+
+    def to_representation(self, rows) -> List[dict]:
+        """values() 행 목록 -> 응답 dict 목록"""
+        with timed('serialize'):
+            return list(self.iter_representation(rows))
+
+    def iter_representation(self, rows) -> Iterator[dict]:
+        """values() 행 이터레이터 -> 응답 dict 제너레이터 (내보내기 스트리밍용)"""
+        accessors = [
+            (name, path, _converter_for(field) if field is not None else None)
+            for name, path, field in self.accessors
+        ]
+        for row in rows:
+            item = {}
+            for name, path, converter in accessors:
+                value = row[path]
+                if converter is not None and value is not None:
+                    value = converter(value)
+                item[name] = value
+            yield item
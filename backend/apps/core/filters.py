@@ -0,0 +1,71 @@
+from datetime import date
+from typing import Callable, Dict, Mapping, Tuple
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+def parse_int(value: str) -> int:
+    """정수 파라미터"""
+    return int(value)
+
+
+def parse_date(value: str) -> date:
+    """YYYY-MM-DD 날짜 파라미터"""
+    return date.fromisoformat(value)
+
+
+def parse_str(value: str) -> str:
+    """문자열 파라미터 (앞뒤 공백 제거)"""
+    value = value.strip()
+    if not value:
+        raise ValueError
+    return value
+
+
+def parse_filter_params(
+    filter_params: Dict[str, Tuple[str, Callable]], query_params: Mapping[str, str]
+) -> Tuple[dict, dict]:
+    """
+    filter_params 선언에 따라 쿼리 파라미터를 ORM 조건으로 변환
+
+    빈 값은 무시한다.
+
+    Returns:
+        (ORM 조건, 파라미터 -> 오류 메시지)
+    """
+    conditions = {}
+    errors = {}
+    for param, (lookup, parser) in filter_params.items():
+        raw = query_params.get(param)
+        if raw is None or raw == '':
+            continue
+        try:
+            conditions[lookup] = parser(raw)
+        except (TypeError, ValueError):
+            errors[param] = f'유효하지 않은 값입니다: {raw}'
+    return conditions, errors
+
+
+class QueryParamFilterBackend(BaseFilterBackend):
+    """
+    쿼리 파라미터 -> ORM 조건 필터
+
+    View에 선언한 filter_params만 허용한다.
+
+        filter_params = {
+            'department': ('department_id', parse_int),
+            'date_from': ('publication_date__gte', parse_date),
+        }
+
+    값 변환에 실패하면 400 응답(ValidationError)을 반환한다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filter_params: Dict[str, Tuple[str, Callable]] = getattr(view, 'filter_params', {})
+
+        conditions, errors = parse_filter_params(filter_params, request.query_params)
+        if errors:
+            raise ValidationError(errors)
+
+        return queryset.filter(**conditions) if conditions else queryset
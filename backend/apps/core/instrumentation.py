@@ -0,0 +1,95 @@
+"""
+요청 단위 성능 계측 (Server-Timing)
+
+RequestTimingMiddleware가 샘플링한 요청마다 RequestTimings를 만들고, 요청 처리 중
+각 단계가 timed()로 구간 시간을 기록한다. 샘플링되지 않은 요청에서 timed()는
+contextvar 조회 한 번만 하는 no-op이다.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+
+_current_timings: ContextVar[Optional['RequestTimings']] = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """
+    요청 1건의 단계별 소요 시간
+
+    - sections: 구간 이름 -> 누적 시간(초) (auth, view, serialize, render 등, 구간은 겹칠 수 있음)
+    - db_queries/db_seconds: 실행한 SQL 수와 누적 실행 시간
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sections: Dict[str, float] = {}
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+    def add(self, name: str, seconds: float) -> None:
+        self.sections[name] = self.sections.get(name, 0.0) + seconds
+
+    def db_wrapper(self, execute, sql, params, many, context):
+        """connection.execute_wrapper용 SQL 실행 시간 측정"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - started
+            self.db_queries += 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def as_dict(self, total_seconds: float) -> dict:
+        """구조화 로그용 값 (밀리초)"""
+        return {
+            'total_ms': round(total_seconds * 1000, 2),
+            'db_ms': round(self.db_seconds * 1000, 2),
+            'db_queries': self.db_queries,
+            **{f'{name}_ms': round(seconds * 1000, 2) for name, seconds in self.sections.items()},
+        }
+
+    def server_timing(self, total_seconds: float) -> str:
+        """Server-Timing 헤더 값 (예: 'auth;dur=0.4, db;dur=3.1;desc="5 queries", total;dur=9.8')"""
+        metrics = [f'{name};dur={seconds * 1000:.2f}' for name, seconds in self.sections.items()]
+        metrics.append(f'db;dur={self.db_seconds * 1000:.2f};desc="{self.db_queries} queries"')
+        metrics.append(f'total;dur={total_seconds * 1000:.2f}')
+        return ', '.join(metrics)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """현재 요청의 계측 객체 (샘플링되지 않았으면 None)"""
+    return _current_timings.get()
+
+
+def activate(timings: Optional[RequestTimings]):
+    """현재 컨텍스트의 계측 객체 설정 (반환한 토큰으로 deactivate)"""
+    return _current_timings.set(timings)
+
+
+def deactivate(token) -> None:
+    _current_timings.reset(token)
+
+
+@contextmanager
+def timed(name: str):
+    """
+    구간 시간 기록 (계측 중인 요청에서만)
+
+    사용 예:
+        with timed('auth'):
+            ...
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
@@ -0,0 +1,39 @@
+"""
+무거운 모듈의 지연 import
+
+pandas 등은 엑셀 업로드에서만 사용하므로 워커 부팅/URL 로딩 시점이 아니라
+처음 속성에 접근할 때 import 한다.
+"""
+import importlib
+from types import ModuleType
+
+
+class LazyModule:
+    """
+    첫 속성 접근 시 실제 모듈을 import 하는 프록시
+
+    사용 예:
+        pd = LazyModule('pandas')
+        pd.read_excel(...)  # 이 시점에 pandas import
+
+    타입 힌트(pd.DataFrame)가 정의 시점에 평가되지 않도록
+    사용하는 모듈에서 `from __future__ import annotations`를 함께 사용한다.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__['_module']
+        if module is None:
+            module = importlib.import_module(self.__dict__['_name'])
+            self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_module'] is not None else 'not loaded'
+        return f"<LazyModule '{self.__dict__['_name']}' ({state})>"
@@ -0,0 +1,95 @@
+"""
+미들웨어 체인 요청당 오버헤드 측정
+
+뷰를 빈 응답으로 고정하고 기존 미들웨어 구성(LEGACY_MIDDLEWARE)과 현재 settings.MIDDLEWARE의
+요청 1건당 처리 시간을 API 경로와 SPA 경로로 나누어 비교한다.
+"""
+import time
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import re_path
+
+
+# 경로 기반 단축 실행 적용 전 미들웨어 구성
+LEGACY_MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.users.middleware.SupabaseAuthMiddleware',
+]
+
+BENCHMARK_PATHS = {
+    'api': '/api/v1/benchmark/',
+    'spa': '/dashboard/students/',
+}
+
+
+def _empty_view(request, *args, **kwargs):
+    return HttpResponse(b'')
+
+
+# 측정 전용 URLConf (ROOT_URLCONF로 이 모듈을 사용)
+urlpatterns = [
+    re_path(r'^.*$', _empty_view),
+]
+
+
+class Command(BaseCommand):
+    help = '기존/현재 미들웨어 구성의 요청당 처리 시간(µs)을 API 경로와 SPA 경로별로 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=5000, help='구성·경로별 요청 수 (기본 5000)')
+
+    def handle(self, *args, **options):
+        count = max(options['requests'], 1)
+        configs = {'legacy': LEGACY_MIDDLEWARE, 'current': list(settings.MIDDLEWARE)}
+
+        results = {}
+        for name, middleware in configs.items():
+            results[name] = {
+                kind: self._measure(middleware, path, count)
+                for kind, path in BENCHMARK_PATHS.items()
+            }
+
+        self.stdout.write(f'요청 {count}건 기준 요청당 평균 처리 시간 (빈 뷰, µs)')
+        for kind in BENCHMARK_PATHS:
+            before = results['legacy'][kind]
+            after = results['current'][kind]
+            change = (after - before) / before * 100 if before else 0.0
+            self.stdout.write(f'  {kind:<4} legacy {before:8.1f}  current {after:8.1f}  ({change:+.1f}%)')
+
+        self.stdout.write(self.style.SUCCESS('✅ 미들웨어 오버헤드 측정 완료'))
+
+    def _measure(self, middleware, path, count) -> float:
+        """미들웨어 구성 하나로 path를 count번 처리한 요청당 평균 시간(µs)"""
+        with override_settings(
+            MIDDLEWARE=middleware,
+            ROOT_URLCONF=__name__,
+            ALLOWED_HOSTS=['testserver'],
+            SECURE_SSL_REDIRECT=False,
+        ):
+            handler = BaseHandler()
+            handler.load_middleware()
+            factory = RequestFactory()
+            # 브라우저처럼 세션/CSRF 쿠키를 함께 전송
+            factory.cookies['sessionid'] = 'benchmark-session'
+            factory.cookies[settings.CSRF_COOKIE_NAME] = 'b' * 32
+
+            handler.get_response(factory.get(path))  # 워밍업 (URL resolver 등 초기화)
+            elapsed = 0.0
+            for _ in range(count):
+                request = factory.get(path)
+                started = time.perf_counter()
+                handler.get_response(request)
+                elapsed += time.perf_counter() - started
+        return elapsed / count * 1_000_000
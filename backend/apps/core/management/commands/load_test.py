@@ -0,0 +1,153 @@
+"""
+로컬 부하 테스트 (처리량/지연 시간 비교용)
+
+실행 중인 서버에 인증된 GET 요청을 동시에 보내고 처리량과 p50/p95/p99 지연 시간을 출력한다.
+네트워크 없이 인증하려면 서버를 AUTH_PROVIDER=local로 띄우고 create_local_auth_user로 만든
+계정(--email/--password) 또는 발급한 토큰(--token)을 사용한다.
+
+예시 (서버 구성별 비교):
+    python manage.py load_test http://127.0.0.1:8000 --email perf@test.com --password ... \\
+        --label sync --output /tmp/load.jsonl
+    python manage.py load_test ... --label gthread --output /tmp/load.jsonl
+    python manage.py load_test --compare /tmp/load.jsonl
+"""
+import json
+import math
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+DEFAULT_PATHS = (
+    '/api/v1/dashboard/summary/',
+    '/api/v1/dashboard/students/',
+    '/api/v1/dashboard/publications/',
+)
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class Command(BaseCommand):
+    help = '실행 중인 서버에 동시 GET 요청을 보내 처리량(req/s)과 p50/p95/p99 지연 시간(ms)을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('base_url', nargs='?', help='서버 주소 (예: http://127.0.0.1:8000)')
+        parser.add_argument('--path', action='append', dest='paths', help=f'요청 경로 (반복 지정, 기본: {", ".join(DEFAULT_PATHS)})')
+        parser.add_argument('--requests', type=int, default=500, help='전체 요청 수 (기본 500)')
+        parser.add_argument('--concurrency', type=int, default=20, help='동시 요청 수 (기본 20)')
+        parser.add_argument('--warmup', type=int, default=10, help='측정 전 워밍업 요청 수 (기본 10)')
+        parser.add_argument('--timeout', type=float, default=30.0, help='요청 타임아웃 (초)')
+        parser.add_argument('--token', help='Bearer 토큰')
+        parser.add_argument('--email', help='로그인 이메일 (토큰 대신 /auth/login/ 사용)')
+        parser.add_argument('--password', help='로그인 비밀번호')
+        parser.add_argument('--label', default='run', help='결과 이름 (예: sync, gthread)')
+        parser.add_argument('--output', help='결과를 JSON 한 줄로 추가할 파일')
+        parser.add_argument('--compare', help='--output 파일의 결과 비교표 출력 (부하를 보내지 않음)')
+
+    def handle(self, *args, **options):
+        if options['compare']:
+            self._print_comparison(options['compare'])
+            return
+
+        base_url = (options['base_url'] or '').rstrip('/')
+        if not base_url:
+            raise CommandError('서버 주소(base_url)가 필요합니다.')
+
+        token = options['token'] or self._login(base_url, options)
+        paths = options['paths'] or list(DEFAULT_PATHS)
+        timeout = options['timeout']
+
+        for index in range(options['warmup']):
+            self._request(base_url + paths[index % len(paths)], token, timeout)
+
+        total = max(options['requests'], 1)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(options['concurrency'], 1)) as executor:
+            results = list(executor.map(
+                lambda index: self._request(base_url + paths[index % len(paths)], token, timeout),
+                range(total),
+            ))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for latency, ok in results if ok)
+        result = {
+            'label': options['label'],
+            'requests': total,
+            'concurrency': options['concurrency'],
+            'errors': sum(1 for _, ok in results if not ok),
+            'throughput_rps': round(total / elapsed, 1),
+            'p50_ms': round(percentile(latencies, 0.50), 1),
+            'p95_ms': round(percentile(latencies, 0.95), 1),
+            'p99_ms': round(percentile(latencies, 0.99), 1),
+            'max_ms': round(latencies[-1], 1) if latencies else 0.0,
+        }
+
+        self.stdout.write(json.dumps(result, ensure_ascii=False))
+        if options['output']:
+            with open(options['output'], 'a', encoding='utf-8') as f:
+                f.write(json.dumps(result, ensure_ascii=False) + '\n')
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {result['label']}: {result['throughput_rps']} req/s, p99 {result['p99_ms']}ms, 오류 {result['errors']}건"
+        ))
+
+    @staticmethod
+    def _request(url: str, token: Optional[str], timeout: float):
+        """GET 요청 1건 -> (지연 시간 ms, 성공 여부)"""
+        request = urllib.request.Request(url)
+        if token:
+            request.add_header('Authorization', f'Bearer {token}')
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                response.read()
+                ok = response.status < 400
+        except (urllib.error.URLError, OSError):
+            ok = False
+        return (time.perf_counter() - started) * 1000, ok
+
+    @staticmethod
+    def _login(base_url: str, options) -> Optional[str]:
+        """--email/--password로 로그인해 access token 발급 (지정하지 않으면 인증 없이 요청)"""
+        if not options['email']:
+            return None
+
+        body = json.dumps({'email': options['email'], 'password': options['password'] or ''}).encode('utf-8')
+        request = urllib.request.Request(
+            f'{base_url}/api/v1/auth/login/', data=body, headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=options['timeout']) as response:
+                return json.loads(response.read())['access_token']
+        except (urllib.error.URLError, OSError, KeyError, ValueError) as e:
+            raise CommandError(f'로그인 실패: {e}')
+
+    def _print_comparison(self, path: str) -> None:
+        try:
+            with open(path, encoding='utf-8') as f:
+                results = [json.loads(line) for line in f if line.strip()]
+        except OSError as e:
+            raise CommandError(f'결과 파일을 읽을 수 없습니다: {e}')
+        if not results:
+            raise CommandError('비교할 결과가 없습니다.')
+
+        baseline = results[0]
+        self.stdout.write(f"{'label':<12} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>7}  (기준: {baseline['label']})")
+        for result in results:
+            change = (
+                (result['throughput_rps'] - baseline['throughput_rps']) / baseline['throughput_rps'] * 100
+                if baseline['throughput_rps'] else 0.0
+            )
+            self.stdout.write(
+                f"{result['label']:<12} {result['throughput_rps']:>8} {result['p50_ms']:>8} "
+                f"{result['p95_ms']:>8} {result['p99_ms']:>8} {result['errors']:>7}  ({change:+.1f}% req/s)"
+            )
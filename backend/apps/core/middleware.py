@@ -0,0 +1,265 @@
+"""
+공통 미들웨어
+
+- 경로 기반 단축 실행: API(/api/...)는 Supabase JWT로 인증하고 세션/메시지/CSRF 쿠키를
+  사용하지 않으며, SPA 화면과 관리자 페이지는 JWT를 사용하지 않는다. 경로에 필요 없는
+  미들웨어는 요청 처리 없이 다음 단계로 넘긴다.
+- 요청 성능 계측: RequestTimingMiddleware (Server-Timing 헤더 + 구조화 로그)
+- ASGI: 프로젝트 미들웨어는 모두 동기/비동기 겸용이다. 동기 전용 미들웨어가 하나라도 있으면
+  Django가 그 지점에서 요청을 스레드로 옮기고(sync_to_async) 안쪽 처리가 끝날 때까지 스레드를
+  점유하므로, 비동기 View를 써도 동시 요청 수만큼 스레드가 필요해진다.
+  동기 process_view/process_template_response hook도 비동기 모드에서는 호출마다 스레드로
+  옮겨 실행되므로, 프로젝트 미들웨어는 코루틴 hook(AsyncHooksMixin)을 등록한다.
+"""
+import json
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.db import connections
+from django.middleware.csrf import CsrfViewMiddleware
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from . import instrumentation
+
+
+logger = logging.getLogger('apps.core.request_timing')
+
+
+def is_api_request(request) -> bool:
+    """API 경로(API_PATH_PREFIXES) 요청 여부"""
+    return request.path_info.startswith(tuple(settings.API_PATH_PREFIXES))
+
+
+class AsyncCapableMiddleware:
+    """
+    동기/비동기 겸용 미들웨어 기반 클래스
+
+    get_response가 코루틴 함수(ASGI)이면 async_mode가 True가 된다.
+    하위 클래스의 __call__은 async_mode이면 __acall__(request)를 반환한다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+class AsyncHooksMixin:
+    """
+    비동기 모드에서 process_view 등 hook을 코루틴 버전(a + hook 이름)으로 교체하는 Mixin
+
+    Django는 동기 hook을 비동기 핸들러에 등록할 때 sync_to_async로 감싸 요청마다 스레드에서
+    실행한다. 미들웨어 로드 시 hook을 인스턴스 속성으로 바꿔 두면 코루틴 그대로 등록된다.
+    """
+
+    async_hooks = ()
+
+    def _use_async_hooks(self, get_response) -> None:
+        if iscoroutinefunction(get_response):
+            for name in self.async_hooks:
+                setattr(self, name, getattr(self, f'a{name}'))
+
+
+class SkipForApiMixin:
+    """
+    API 경로 요청이면 미들웨어를 실행하지 않는 Mixin (MiddlewareMixin 기반 미들웨어용)
+
+    원래 미들웨어 클래스를 상속하므로 관리자 페이지 등의 미들웨어 설정 검사는 그대로 통과한다.
+    """
+
+    def __call__(self, request):
+        if is_api_request(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise 정적 파일 서빙의 동기/비동기 겸용 버전 (WhiteNoiseMiddleware는 동기 전용)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            # 파일 열기/stat은 블로킹 I/O이므로 스레드에서 실행 (API 요청은 해당 없음)
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+class NonApiSessionMiddleware(SkipForApiMixin, SessionMiddleware):
+    """API 경로를 제외한 세션 미들웨어"""
+
+
+class NonApiCsrfViewMiddleware(AsyncHooksMixin, SkipForApiMixin, CsrfViewMiddleware):
+    """
+    API 경로를 제외한 CSRF 미들웨어 (API는 쿠키 대신 Bearer 토큰을 사용)
+
+    비동기 모드의 process_view는 API 경로이면 스레드 전환 없이 바로 반환하고,
+    그 외 경로(관리자 페이지 등)만 CSRF 검사를 스레드에서 실행한다 (세션 CSRF는 DB 조회).
+    """
+
+    async_hooks = ('process_view',)
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self._use_async_hooks(get_response)
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_api_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+    async def aprocess_view(self, request, callback, callback_args, callback_kwargs):
+        if is_api_request(request):
+            return None
+        return await sync_to_async(super().process_view, thread_sensitive=True)(
+            request, callback, callback_args, callback_kwargs
+        )
+
+
+class NonApiAuthenticationMiddleware(SkipForApiMixin, AuthenticationMiddleware):
+    """API 경로를 제외한 Django 세션 인증 미들웨어 (관리자 페이지용)"""
+
+
+class NonApiMessageMiddleware(SkipForApiMixin, MessageMiddleware):
+    """API 경로를 제외한 메시지 미들웨어"""
+
+
+class RequestTimingMiddleware(AsyncHooksMixin, AsyncCapableMiddleware):
+    """
+    요청별 성능 계측 (REQUEST_TIMING_ENABLED일 때 REQUEST_TIMING_SAMPLE_RATE 비율로 샘플링)
+
+    샘플링한 요청은 DB 쿼리 수/시간, 인증(auth), 뷰(view), 직렬화(serialize),
+    렌더링(render) 시간을 Server-Timing 헤더와 'apps.core.request_timing' 로그(JSON)로 남긴다.
+    view는 뷰 안의 DB/직렬화 시간을 포함한다. 가장 바깥(MIDDLEWARE 첫 번째)에 두어야
+    전체 시간(total)에 다른 미들웨어가 포함된다.
+
+    ASGI 비동기 처리에서는 DB 쿼리가 sync_to_async 스레드의 연결에서 실행되어
+    요청 단위로 감쌀 수 없으므로 db 항목을 측정하지 않는다. 뷰 시작/종료 hook은
+    비동기 모드에서 코루틴 버전으로 등록되어 스레드로 옮겨지지 않는다.
+    """
+
+    async_hooks = ('process_view', 'process_template_response')
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self._use_async_hooks(get_response)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+
+        timings, token = self._start(request)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings.db_wrapper))
+                response = self.get_response(request)
+        finally:
+            instrumentation.deactivate(token)
+        return self._finish(request, response, timings)
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+
+        timings, token = self._start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            instrumentation.deactivate(token)
+        return self._finish(request, response, timings)
+
+    @staticmethod
+    def _start(request):
+        """요청 계측 시작 (RequestTimings와 컨텍스트 복원 토큰 반환)"""
+        timings = instrumentation.RequestTimings()
+        request.request_timings = timings
+        return timings, instrumentation.activate(timings)
+
+    @staticmethod
+    def _finish(request, response, timings):
+        """Server-Timing 헤더와 구조화 로그 기록"""
+        if getattr(request, '_view_started', None) is not None:
+            # 렌더링 단계가 없는 응답(HttpResponse 등)은 응답 반환까지를 뷰 시간으로 기록
+            timings.add('view', time.perf_counter() - request._view_started)
+        total = timings.elapsed()
+        response['Server-Timing'] = timings.server_timing(total)
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            **timings.as_dict(total),
+        }, ensure_ascii=False))
+        return response
+
+    @staticmethod
+    def _sampled() -> bool:
+        if not settings.REQUEST_TIMING_ENABLED:
+            return False
+        rate = settings.REQUEST_TIMING_SAMPLE_RATE
+        return rate >= 1 or random.random() < rate
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self._view_start(request)
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self._view_start(request)
+        return None
+
+    def process_template_response(self, request, response):
+        return self._view_end(request, response)
+
+    async def aprocess_template_response(self, request, response):
+        return self._view_end(request, response)
+
+    @staticmethod
+    def _view_start(request) -> None:
+        """뷰 시작 시각 기록"""
+        if getattr(request, 'request_timings', None) is not None:
+            request._view_started = time.perf_counter()
+
+    @staticmethod
+    def _view_end(request, response):
+        """뷰 종료 시각 기록 후 렌더링(DRF Response 등) 시간 측정"""
+        timings = getattr(request, 'request_timings', None)
+        view_started = getattr(request, '_view_started', None)
+        if timings is None or view_started is None:
+            return response
+
+        view_ended = time.perf_counter()
+        timings.add('view', view_ended - view_started)
+        request._view_started = None
+        response.add_post_render_callback(
+            lambda rendered: timings.add('render', time.perf_counter() - view_ended)
+        )
+        return response
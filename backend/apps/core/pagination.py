@@ -0,0 +1,179 @@
+import base64
+import datetime
+import json
+from collections import OrderedDict
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    커서용 JSON 인코더
+
+    DjangoJSONEncoder는 datetime/time을 밀리초까지만 남기므로 커서 위치가
+    실제 행보다 앞서게 되어 같은 밀리초 안의 행을 건너뛴다. 마이크로초까지 유지한다.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 기반 페이지네이션
+
+    (정렬 필드, id) 쌍의 마지막 값을 커서로 사용하여 다음 페이지를
+    WHERE 조건으로 조회한다. OFFSET이나 COUNT(*)를 사용하지 않으므로
+    (정렬 필드, id) 복합 인덱스가 있으면 깊은 페이지도 첫 페이지와 같은 비용이다.
+
+    View에서 keyset_ordering = ('-created_at', '-id') 형태로 정렬을 지정하거나
+    요청별 정렬이 필요하면 get_keyset_ordering()을 구현한다.
+    정렬 필드는 NULL이 없어야 하고 마지막 필드는 고유해야 한다.
+
+    응답의 next는 호스트 없는 상대 경로이고 next_cursor는 커서 값만 담는다.
+    TLS 종료 프록시 뒤에서 절대 URL을 만들면 http://로 내려가므로 scheme/host를 넣지 않으며,
+    클라이언트는 같은 목록 요청에 ?cursor=next_cursor를 붙여 다음 페이지를 조회한다.
+    """
+
+    page_size = 100
+    max_page_size = 1000
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    ordering = ('-created_at', '-id')
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        rows = list(self._page_queryset(queryset, request, view))
+        return self._set_page(rows)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset의 비동기 버전 (Django 비동기 ORM으로 조회, ASGI View용)"""
+        rows = [row async for row in self._page_queryset(queryset, request, view)]
+        return self._set_page(rows)
+
+    def _page_queryset(self, queryset, request, view):
+        """커서 위치 이후 페이지 크기 + 1건을 조회하는 QuerySet (실행하지 않음)"""
+        self.request = request
+        self.ordering = self.get_ordering(view)
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self._build_after_filter(position))
+
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        return queryset[:self.page_size + 1]
+
+    def _set_page(self, rows: list) -> list:
+        """조회한 행으로 다음 페이지 여부/커서 위치 설정 후 현재 페이지 행 반환"""
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_position = self._get_position(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('next_cursor', self.get_next_cursor()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri-reference'},
+                'next_cursor': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_ordering(self, view) -> tuple:
+        """View의 커서 정렬 (get_keyset_ordering() 또는 keyset_ordering)"""
+        if hasattr(view, 'get_keyset_ordering'):
+            return tuple(view.get_keyset_ordering())
+        return tuple(getattr(view, 'keyset_ordering', self.ordering))
+
+    def get_page_size(self, request) -> int:
+        """요청 파라미터의 페이지 크기 (1 ~ max_page_size)"""
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_next_cursor(self):
+        """다음 페이지 커서 (마지막 페이지면 None)"""
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.next_position)
+
+    def get_next_link(self):
+        """다음 페이지 상대 경로 (현재 요청 경로/파라미터에 cursor만 교체)"""
+        cursor = self.get_next_cursor()
+        if cursor is None:
+            return None
+        return replace_query_param(self.request.get_full_path(), self.cursor_query_param, cursor)
+
+    def encode_cursor(self, position: list) -> str:
+        """정렬 필드 값 목록 -> URL 안전 문자열"""
+        raw = json.dumps(position, cls=CursorJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request, model):
+        """커서 문자열 -> 정렬 필드 값 목록 (없으면 None)"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                model._meta.get_field(self._field_name(order)).to_python(value)
+                for order, value in zip(self.ordering, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def _build_after_filter(self, position: list) -> Q:
+        """
+        (f1, f2, ...) 가 커서 위치 이후인 행 조건
+
+        예: 정렬 (-created_at, -id), 커서 (t, 7) ->
+            created_at <= t AND (created_at < t OR (created_at = t AND id < 7))
+        첫 조건은 중복이지만 첫 정렬 필드 인덱스 범위 검색을 가능하게 한다.
+        """
+        first_field = self._field_name(self.ordering[0])
+        first_lookup = 'lte' if self.ordering[0].startswith('-') else 'gte'
+
+        condition = Q()
+        equal_prefix = Q()
+        for order, value in zip(self.ordering, position):
+            field = self._field_name(order)
+            lookup = 'lt' if order.startswith('-') else 'gt'
+            condition |= equal_prefix & Q(**{f'{field}__{lookup}': value})
+            equal_prefix &= Q(**{field: value})
+
+        return Q(**{f'{first_field}__{first_lookup}': position[0]}) & condition
+
+    def _get_position(self, row) -> list:
+        """행에서 정렬 필드 값 추출 (모델 인스턴스 또는 dict)"""
+        fields = [self._field_name(order) for order in self.ordering]
+        if isinstance(row, dict):
+            return [row[field] for field in fields]
+        return [getattr(row, field) for field in fields]
+
+    @staticmethod
+    def _field_name(order: str) -> str:
+        return order.lstrip('-')
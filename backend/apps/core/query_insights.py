@@ -0,0 +1,189 @@
+"""
+Repository 메서드 단위 쿼리 계측
+
+REPOSITORY_INSTRUMENTATION_ENABLED이면 BaseRepository(및 하위 클래스)의 public 메서드 호출마다
+- 메서드별 호출 수/누적·최대 시간을 기록하고 (method_stats)
+- 메서드 안에서 실행한 SQL 끝에 `/* repository='StudentRepository.get_by_id' */` 주석을 붙여
+  pg_stat_statements, DB 로그에서 호출 메서드를 알 수 있게 하며
+- REPOSITORY_SLOW_QUERY_MS를 넘은 SELECT는 REPOSITORY_EXPLAIN_SAMPLE_RATE 비율로 실행 계획
+  (PostgreSQL: EXPLAIN (ANALYZE, BUFFERS))을 떠서 최근 N건 링 버퍼(slow_query_log)에 보관한다.
+
+메서드가 반환한 QuerySet을 호출한 쪽에서 나중에 평가하면 그 쿼리는 메서드 밖에서 실행되므로
+태그/측정 대상이 아니다. 모든 기록은 워커 프로세스 단위다.
+"""
+import functools
+import random
+import threading
+import time
+import types
+from collections import deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.utils import timezone
+
+
+# 벤더별 실행 계획 조회 구문 (ANALYZE는 쿼리를 한 번 더 실행하므로 SELECT에만 사용)
+EXPLAIN_PREFIXES = {
+    'postgresql': 'EXPLAIN (ANALYZE, BUFFERS) ',
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+}
+
+MAX_SQL_LENGTH = 4000
+
+_current_method: ContextVar[Optional[str]] = ContextVar('repository_method', default=None)
+_explaining: ContextVar[bool] = ContextVar('repository_explaining', default=False)
+
+
+class SlowQueryLog:
+    """느린 쿼리 링 버퍼 (최근 REPOSITORY_SLOW_QUERY_BUFFER_SIZE건, 스레드 안전)"""
+
+    def __init__(self):
+        self._entries = deque()
+        self._lock = threading.Lock()
+
+    def add(self, entry: dict) -> None:
+        with self._lock:
+            if self._entries.maxlen != settings.REPOSITORY_SLOW_QUERY_BUFFER_SIZE:
+                self._entries = deque(self._entries, maxlen=settings.REPOSITORY_SLOW_QUERY_BUFFER_SIZE)
+            self._entries.append(entry)
+
+    def entries(self) -> List[dict]:
+        """최근 항목부터"""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class MethodStats:
+    """Repository 메서드별 호출 수/누적 시간/최대 시간"""
+
+    def __init__(self):
+        self._stats: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(method, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def top(self, limit: int = 20) -> List[dict]:
+        """누적 시간이 큰 순서"""
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        return [
+            {
+                'method': method,
+                'calls': calls,
+                'total_ms': round(total * 1000, 2),
+                'avg_ms': round(total / calls * 1000, 3),
+                'max_ms': round(maximum * 1000, 2),
+            }
+            for method, (calls, total, maximum) in items
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# 프로세스 단위 기록 (워커마다 별도)
+slow_query_log = SlowQueryLog()
+method_stats = MethodStats()
+
+
+def _explain(connection, sql: str, params) -> Optional[str]:
+    """실행 계획 텍스트 (지원하지 않는 DB면 None, 실패하면 오류 메시지)"""
+    prefix = EXPLAIN_PREFIXES.get(connection.vendor)
+    if prefix is None:
+        return None
+
+    token = _explaining.set(True)
+    try:
+        # 실패해도 진행 중인 트랜잭션이 중단되지 않도록 savepoint 안에서 실행
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(prefix + sql, params)
+                rows = cursor.fetchall()
+    except DatabaseError as e:
+        return f'EXPLAIN 실패: {e}'
+    finally:
+        _explaining.reset(token)
+    return '\n'.join(' '.join(str(column) for column in row) for row in rows)
+
+
+def _tag_and_capture(execute, sql, params, many, context):
+    """connection.execute_wrapper: SQL에 호출 메서드 주석을 붙이고 느린 쿼리 기록"""
+    method = _current_method.get()
+    if method is None or _explaining.get():
+        return execute(sql, params, many, context)
+
+    tagged_sql = f"{sql} /* repository='{method}' */"
+    started = time.perf_counter()
+    try:
+        return execute(tagged_sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        if duration * 1000 >= settings.REPOSITORY_SLOW_QUERY_MS:
+            _record_slow_query(context['connection'], method, sql, tagged_sql, params, many, duration)
+
+
+def _record_slow_query(connection, method, sql, tagged_sql, params, many, duration) -> None:
+    plan = None
+    is_select = not many and sql.lstrip().upper().startswith('SELECT')
+    if is_select and random.random() < settings.REPOSITORY_EXPLAIN_SAMPLE_RATE:
+        plan = _explain(connection, sql, params)
+
+    slow_query_log.add({
+        'method': method,
+        'database': connection.alias,
+        'duration_ms': round(duration * 1000, 2),
+        'sql': tagged_sql[:MAX_SQL_LENGTH],
+        'plan': plan,
+        'captured_at': timezone.now().isoformat(),
+    })
+
+
+def instrument_method(func):
+    """Repository 메서드 계측 데코레이터 (REPOSITORY_INSTRUMENTATION_ENABLED일 때만 동작)"""
+    if getattr(func, '_repository_instrumented', False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not settings.REPOSITORY_INSTRUMENTATION_ENABLED:
+            return func(self, *args, **kwargs)
+
+        method = f'{type(self).__name__}.{func.__name__}'
+        outermost = _current_method.get() is None
+        token = _current_method.set(method)
+        started = time.perf_counter()
+        try:
+            if not outermost:
+                return func(self, *args, **kwargs)
+            # 가장 바깥 Repository 호출에서만 연결별 SQL 래퍼 설치 (중첩 호출은 태그만 변경)
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_tag_and_capture))
+                return func(self, *args, **kwargs)
+        finally:
+            _current_method.reset(token)
+            method_stats.record(method, time.perf_counter() - started)
+
+    wrapper._repository_instrumented = True
+    return wrapper
+
+
+def instrument_class(cls) -> None:
+    """클래스에 직접 정의된 public 인스턴스 메서드에 instrument_method 적용"""
+    for name, value in list(vars(cls).items()):
+        if not name.startswith('_') and isinstance(value, types.FunctionType):
+            setattr(cls, name, instrument_method(value))
@@ -1,16 +1,26 @@
-from typing import Generic, TypeVar, Type, List, Optional
+from typing import Dict, Generic, TypeVar, Type, List, Optional, Sequence
 from django.db import models
 
+from .query_insights import instrument_class
+
 
 T = TypeVar('T', bound=models.Model)
 
 
 class BaseRepository(Generic[T]):
-    """모든 Repository의 기본 클래스"""
+    """
+    모든 Repository의 기본 클래스
+
+    하위 클래스의 public 메서드는 자동으로 계측된다 (apps.core.query_insights).
+    """
 
     def __init__(self, model_class: Type[T]):
         self.model_class = model_class
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
+
     def get_by_id(self, id: int) -> Optional[T]:
         """ID로 단일 객체 조회"""
         try:
@@ -56,3 +66,35 @@ class BaseRepository(Generic[T]):
     def exists(self, **kwargs) -> bool:
         """조건에 맞는 객체 존재 여부"""
         return self.model_class.objects.filter(**kwargs).exists()
+
+    def aggregate_by(
+        self,
+        group_paths: Sequence[str],
+        metrics: Dict[str, models.Aggregate],
+        conditions: Optional[dict] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        조건에 맞는 객체를 그룹별로 집계 (GROUP BY 쿼리 한 번)
+
+        Args:
+            group_paths: GROUP BY 할 ORM 경로 (예: 'department_id', 'publication_date__year').
+                         비어 있으면 전체를 한 행으로 집계
+            metrics: 결과 키 -> 집계 식 (예: {'count': Count('id')})
+            conditions: filter() 조건
+            limit: 최대 그룹 수
+
+        Returns:
+            [{<ORM 경로>: 값, ..., <결과 키>: 집계값}, ...] (그룹 경로 오름차순)
+        """
+        queryset = self.model_class.objects.filter(**(conditions or {}))
+        if not group_paths:
+            return [queryset.aggregate(**metrics)]
+
+        queryset = queryset.values(*group_paths).annotate(**metrics).order_by(*group_paths)
+        if limit is not None:
+            queryset = queryset[:limit]
+        return list(queryset)
+
+
+instrument_class(BaseRepository)
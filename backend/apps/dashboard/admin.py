@@ -8,51 +8,62 @@ from .models import (
     ResearchProject,
     ProjectExpense,
 )
+from .services.sync import DeltaSyncService
+
+
+class SyncTrackedAdmin(admin.ModelAdmin):
+    """삭제 시 증분 동기화 삭제 기록을 남기는 ModelAdmin"""
+
+    def delete_model(self, request, obj):
+        DeltaSyncService().delete(type(obj).objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        DeltaSyncService().delete(queryset)
 
 
 @admin.register(College)
-class CollegeAdmin(admin.ModelAdmin):
+class CollegeAdmin(SyncTrackedAdmin):
     list_display = ['id', 'name', 'created_at']
     search_fields = ['name']
 
 
 @admin.register(Department)
-class DepartmentAdmin(admin.ModelAdmin):
+class DepartmentAdmin(SyncTrackedAdmin):
     list_display = ['id', 'name', 'college', 'created_at']
     list_filter = ['college']
     search_fields = ['name', 'college__name']
 
 
 @admin.register(Student)
-class StudentAdmin(admin.ModelAdmin):
+class StudentAdmin(SyncTrackedAdmin):
     list_display = ['student_id_number', 'name', 'department', 'program_level', 'status']
     list_filter = ['status', 'program_level', 'department__college']
     search_fields = ['student_id_number', 'name', 'email']
 
 
 @admin.register(DepartmentKPI)
-class DepartmentKPIAdmin(admin.ModelAdmin):
+class DepartmentKPIAdmin(SyncTrackedAdmin):
     list_display = ['department', 'evaluation_year', 'employment_rate', 'full_time_faculty_count']
     list_filter = ['evaluation_year', 'department__college']
     search_fields = ['department__name']
 
 
 @admin.register(Publication)
-class PublicationAdmin(admin.ModelAdmin):
+class PublicationAdmin(SyncTrackedAdmin):
     list_display = ['publication_id_str', 'title', 'department', 'publication_date', 'primary_author']
     list_filter = ['publication_date', 'department__college']
     search_fields = ['title', 'primary_author', 'publication_id_str']
 
 
 @admin.register(ResearchProject)
-class ResearchProjectAdmin(admin.ModelAdmin):
+class ResearchProjectAdmin(SyncTrackedAdmin):
     list_display = ['project_number', 'name', 'department', 'principal_investigator', 'total_funding_amount']
     list_filter = ['department__college']
     search_fields = ['project_number', 'name', 'principal_investigator']
 
 
 @admin.register(ProjectExpense)
-class ProjectExpenseAdmin(admin.ModelAdmin):
+class ProjectExpenseAdmin(SyncTrackedAdmin):
     list_display = ['execution_id', 'project', 'item', 'amount', 'status', 'execution_date']
     list_filter = ['status', 'execution_date']
     search_fields = ['execution_id', 'item', 'project__project_number']
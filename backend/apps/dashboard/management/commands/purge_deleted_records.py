@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services.sync import DeltaSyncService
+
+
+class Command(BaseCommand):
+    help = '보관 기간(DASHBOARD_SYNC_TOMBSTONE_RETENTION_DAYS)이 지난 삭제 기록(deleted_records)을 정리합니다.'
+
+    def handle(self, *args, **options):
+        count = DeltaSyncService().purge_expired()
+
+        self.stdout.write(self.style.SUCCESS(f'✅ 삭제 기록 {count}개 정리 완료'))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.dashboard.services.cache import bump_data_version
+from apps.dashboard.services.rollup import DepartmentYearRollupService
+
+
+class Command(BaseCommand):
+    help = '학과×연도 집계 테이블(department_year_rollups)을 원본 데이터로 전체 재계산합니다.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = DepartmentYearRollupService().rebuild_all()
+            transaction.on_commit(bump_data_version)
+
+        self.stdout.write(self.style.SUCCESS(f'✅ 학과×연도 집계 {count}개 재계산 완료'))
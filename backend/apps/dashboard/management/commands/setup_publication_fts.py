@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.dashboard.repositories import PublicationRepository
+
+
+class Command(BaseCommand):
+    help = 'SQLite(로컬/테스트) DB에 논문 전문 검색용 FTS5 테이블과 동기화 트리거를 생성합니다. (PostgreSQL은 Supabase 마이그레이션 사용)'
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError(
+                'SQLite 전용 명령입니다. PostgreSQL은 20261019000500_publication_full_text_search.sql 마이그레이션을 적용하세요.'
+            )
+
+        PublicationRepository().ensure_sqlite_fts()
+
+        self.stdout.write(self.style.SUCCESS('✅ 논문 전문 검색 색인 생성 완료'))
@@ -8,11 +8,16 @@ class College(models.Model):
     id = models.BigAutoField(primary_key=True)
     name = models.CharField(max_length=255, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'colleges'
         verbose_name = 'College'
         verbose_name_plural = 'Colleges'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
+        ]
 
     def __str__(self):
         return self.name
@@ -24,6 +29,7 @@ class Department(models.Model):
     college = models.ForeignKey(College, on_delete=models.CASCADE, related_name='departments')
     name = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'departments'
@@ -32,6 +38,8 @@ class Department(models.Model):
         unique_together = [['college', 'name']]
         indexes = [
             models.Index(fields=['college']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
         ]
 
     def __str__(self):
@@ -74,6 +82,7 @@ class Student(models.Model):
     advisor_name = models.CharField(max_length=100, null=True, blank=True)
     email = models.EmailField(unique=True, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'students'
@@ -82,6 +91,12 @@ class Student(models.Model):
         indexes = [
             models.Index(fields=['department']),
             models.Index(fields=['status']),
+            models.Index(fields=['created_at', 'id']),
+            # 목록 API 필터 + 커서 정렬
+            models.Index(fields=['department', 'created_at', 'id'], name='idx_students_dept_created'),
+            models.Index(fields=['status', 'program_level'], name='idx_students_status_level'),
+            models.Index(fields=['admission_year'], name='idx_students_admission_year'),
+            models.Index(fields=['updated_at', 'id']),
         ]
 
     def __str__(self):
@@ -101,6 +116,7 @@ class DepartmentKPI(models.Model):
     )
     international_conferences_count = models.IntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'department_kpis'
@@ -109,6 +125,8 @@ class DepartmentKPI(models.Model):
         unique_together = [['department', 'evaluation_year']]
         indexes = [
             models.Index(fields=['department', 'evaluation_year']),
+            models.Index(fields=['evaluation_year', 'id']),
+            models.Index(fields=['updated_at', 'id']),
         ]
 
     def __str__(self):
@@ -131,6 +149,7 @@ class Publication(models.Model):
     impact_factor = models.DecimalField(max_digits=6, decimal_places=3, null=True, blank=True)
     is_project_linked = models.BooleanField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'publications'
@@ -138,7 +157,11 @@ class Publication(models.Model):
         verbose_name_plural = 'Publications'
         indexes = [
             models.Index(fields=['department']),
-            models.Index(fields=['publication_date']),
+            models.Index(fields=['publication_date', 'id']),
+            # 목록 API 필터 + 커서 정렬
+            models.Index(fields=['department', 'publication_date', 'id'], name='idx_pubs_dept_date'),
+            models.Index(fields=['journal_rank', 'publication_date'], name='idx_pubs_rank_date'),
+            models.Index(fields=['updated_at', 'id']),
         ]
 
     def __str__(self):
@@ -157,6 +180,7 @@ class ResearchProject(models.Model):
     funding_agency = models.CharField(max_length=255, null=True, blank=True)
     total_funding_amount = models.BigIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'research_projects'
@@ -164,6 +188,8 @@ class ResearchProject(models.Model):
         verbose_name_plural = 'Research Projects'
         indexes = [
             models.Index(fields=['department']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
         ]
 
     def __str__(self):
@@ -183,6 +209,7 @@ class ProjectExpense(models.Model):
     status = models.CharField(max_length=20, choices=ProjectStatus.choices)
     notes = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'project_expenses'
@@ -191,7 +218,67 @@ class ProjectExpense(models.Model):
         indexes = [
             models.Index(fields=['project']),
             models.Index(fields=['status']),
+            models.Index(fields=['execution_date', 'id']),
+            # 목록 API 필터 + 커서 정렬
+            models.Index(fields=['status', 'execution_date', 'id'], name='idx_expenses_status_date'),
+            models.Index(fields=['updated_at', 'id']),
+            # 과제 하위 집행내역 목록 커서 정렬 / 과제 목록 상태별 집행 금액 집계
+            # (번다운 집계의 project, execution_date 조건도 이 인덱스 앞부분 사용)
+            models.Index(fields=['project', 'execution_date', 'id'], name='idx_expenses_project_date_id'),
+            models.Index(fields=['project', 'status', 'amount'], name='idx_expenses_project_status'),
         ]
 
     def __str__(self):
         return f"{self.execution_id} - {self.item}"
+
+
+# ============= Rollup (Fact) Tables =============
+
+class DepartmentYearRollup(models.Model):
+    """학과 × 연도 집계 (Import 시 갱신되는 추이 차트용 팩트 테이블)"""
+    id = models.BigAutoField(primary_key=True)
+    department = models.ForeignKey(
+        Department, on_delete=models.CASCADE, related_name='year_rollups'
+    )
+    year = models.IntegerField()
+    publication_count = models.IntegerField(default=0)
+    avg_impact_factor = models.DecimalField(max_digits=6, decimal_places=3, null=True, blank=True)
+    students_admitted = models.IntegerField(default=0)
+    project_count = models.IntegerField(default=0)
+    total_funding = models.BigIntegerField(default=0)
+    total_expenses = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'department_year_rollups'
+        verbose_name = 'Department Year Rollup'
+        verbose_name_plural = 'Department Year Rollups'
+        unique_together = [['department', 'year']]
+        indexes = [
+            models.Index(fields=['year']),
+        ]
+
+    def __str__(self):
+        return f"{self.department_id} - {self.year}"
+
+
+# ============= Sync (Tombstone) Tables =============
+
+class DeletedRecord(models.Model):
+    """삭제 기록 (목록 API 증분 동기화 ?since= 용)"""
+    id = models.BigAutoField(primary_key=True)
+    table_name = models.CharField(max_length=100)
+    # NULL이면 테이블 전체 삭제 (Import) -> 클라이언트 전체 재동기화
+    record_id = models.BigIntegerField(null=True, blank=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'deleted_records'
+        verbose_name = 'Deleted Record'
+        verbose_name_plural = 'Deleted Records'
+        indexes = [
+            models.Index(fields=['table_name', 'deleted_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.table_name} - {self.record_id}"
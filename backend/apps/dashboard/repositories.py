@@ -1,6 +1,12 @@
-from typing import List, Dict, Optional
-from django.db.models import Count, Sum
-from django.db.models.functions import ExtractYear
+from collections import defaultdict
+from typing import List, Dict, Iterable, Optional, Sequence
+from django.db import NotSupportedError, connection, transaction
+from django.db.models import (
+    Avg, Case, Count, DecimalField, FloatField, Sum, F, Q, QuerySet, Value, When, Window,
+    OuterRef, Subquery, IntegerField,
+)
+from django.db.models.functions import Cast, Coalesce, ExtractYear, TruncMonth
+from apps.core.expressions import PercentileCont, RunningSum
 from apps.core.repositories import BaseRepository
 from .models import (
     College,
@@ -11,6 +17,8 @@ from .models import (
     ResearchProject,
     ProjectExpense,
     ProjectStatus,
+    DepartmentYearRollup,
+    DeletedRecord,
 )
 
 
@@ -35,6 +43,23 @@ class DepartmentRepository(BaseRepository[Department]):
         )
         return department
 
+    def lock(self, department_ids: Iterable[int]) -> List[int]:
+        """
+        학과 행 잠금 (트랜잭션 안에서 호출, 종료 시 해제)
+
+        FOR NO KEY UPDATE는 학생/논문 등의 FK 참조 잠금(FOR KEY SHARE)과 충돌하지 않으므로
+        같은 학과를 참조하는 쓰기는 막지 않고 같은 학과의 집계 갱신끼리만 순서대로 실행한다.
+        교착 상태를 피하기 위해 ID 순서로 잠근다.
+        """
+        return list(
+            self.model_class.objects.select_for_update(no_key=True)
+            .filter(id__in=list(department_ids)).order_by('id').values_list('id', flat=True)
+        )
+
+    def get_all_with_college(self) -> List[Department]:
+        """단과대학을 함께 조회한 전체 학과 (학과마다 단과대학 조회 방지)"""
+        return list(self.model_class.objects.select_related('college').order_by('id'))
+
     def get_by_name(self, name: str) -> Optional[Department]:
         """이름으로 조회"""
         try:
@@ -53,6 +78,11 @@ class StudentRepository(BaseRepository[Student]):
         """특정 학과의 학생 수 조회"""
         return self.model_class.objects.filter(department_id=department_id).count()
 
+    def count_all_by_department(self) -> Dict[int, int]:
+        """학과별 학생 수 (GROUP BY 한 번)"""
+        result = self.model_class.objects.values('department_id').annotate(count=Count('id'))
+        return {item['department_id']: item['count'] for item in result}
+
     def count_by_status(self) -> Dict[str, int]:
         """학적 상태별 학생 수 집계"""
         result = self.model_class.objects.values('status').annotate(count=Count('id'))
@@ -64,6 +94,25 @@ class StudentRepository(BaseRepository[Student]):
             department_id=department_id, status=status
         ).count()
 
+    def count_admitted_by_department_and_year(
+        self, department_ids: Iterable[int]
+    ) -> List[Dict]:
+        """학과 × 입학년도별 학생 수"""
+        return list(
+            self.model_class.objects.filter(
+                department_id__in=department_ids, admission_year__isnull=False
+            )
+            .values('department_id', year=F('admission_year'))
+            .annotate(students_admitted=Count('id'))
+            .order_by()
+        )
+
+    def get_department_ids(self) -> List[int]:
+        """학생이 존재하는 학과 ID 목록"""
+        return list(
+            self.model_class.objects.values_list('department_id', flat=True).distinct()
+        )
+
 
 class DepartmentKPIRepository(BaseRepository[DepartmentKPI]):
     """학과 KPI 데이터 접근 레이어"""
@@ -99,6 +148,27 @@ class PublicationRepository(BaseRepository[Publication]):
         """특정 학과의 논문 수 조회"""
         return self.model_class.objects.filter(department_id=department_id).count()
 
+    def count_all_by_department(self) -> Dict[int, int]:
+        """학과별 논문 수 (GROUP BY 한 번)"""
+        result = self.model_class.objects.values('department_id').annotate(count=Count('id')).order_by()
+        return {item['department_id']: item['count'] for item in result}
+
+    def stats_by_department_and_year(self, department_ids: Iterable[int]) -> List[Dict]:
+        """학과 × 연도별 논문 수 및 평균 Impact Factor"""
+        return list(
+            self.model_class.objects.filter(department_id__in=department_ids)
+            .annotate(year=ExtractYear('publication_date'))
+            .values('department_id', 'year')
+            .annotate(publication_count=Count('id'), avg_impact_factor=Avg('impact_factor'))
+            .order_by()
+        )
+
+    def get_department_ids(self) -> List[int]:
+        """논문이 존재하는 학과 ID 목록"""
+        return list(
+            self.model_class.objects.values_list('department_id', flat=True).distinct()
+        )
+
     def get_by_department_and_year(
         self, department_id: int, year: int
     ) -> List[Publication]:
@@ -109,6 +179,252 @@ class PublicationRepository(BaseRepository[Publication]):
             )
         )
 
+    # ----- Impact Factor 분석 -----
+
+    def impact_stats_by_department_and_year(
+        self, conditions: Optional[dict] = None, percentiles: Sequence[float] = ()
+    ) -> List[Dict]:
+        """
+        학과 × 연도별 논문 수, Impact Factor 통계, 과제 연계 논문 수 (GROUP BY 한 번)
+
+        PostgreSQL은 백분위수도 같은 쿼리에서 percentile_cont로 계산하고,
+        그 외 DB는 Impact Factor 값만 정렬 조회하여 같은 방식(선형 보간)으로 계산한다.
+
+        Args:
+            conditions: filter() 조건
+            percentiles: 계산할 분위 목록 (0~1, 예: (0.5, 0.9))
+
+        Returns:
+            [{'department_id', 'department_name', 'year', 'publication_count',
+              'impact_factor_count', 'impact_factor_sum', 'impact_factor_avg',
+              'project_linked_count', 'impact_factor_percentiles': [분위별 값 또는 None]}, ...]
+            (학과 ID, 연도 오름차순)
+        """
+        queryset = self.model_class.objects.filter(**(conditions or {}))
+        metrics = {
+            'publication_count': Count('id'),
+            'impact_factor_count': Count('impact_factor'),
+            'impact_factor_sum': Sum('impact_factor'),
+            'impact_factor_avg': Avg('impact_factor'),
+            'project_linked_count': Count('id', filter=Q(is_project_linked=True)),
+        }
+        use_percentile_cont = connection.vendor == 'postgresql'
+        if use_percentile_cont:
+            for index, fraction in enumerate(percentiles):
+                metrics[f'impact_factor_p{index}'] = PercentileCont('impact_factor', fraction)
+
+        rows = list(
+            queryset.annotate(year=ExtractYear('publication_date'))
+            .values('department_id', 'year')
+            .annotate(department_name=F('department__name'), **metrics)
+            .order_by('department_id', 'year')
+        )
+
+        if use_percentile_cont:
+            for row in rows:
+                row['impact_factor_percentiles'] = [
+                    row.pop(f'impact_factor_p{index}') for index in range(len(percentiles))
+                ]
+        else:
+            values = self._impact_factors_by_department_and_year(queryset) if percentiles else {}
+            for row in rows:
+                ordered = values.get((row['department_id'], row['year']), [])
+                row['impact_factor_percentiles'] = [
+                    self._interpolate_percentile(ordered, fraction) for fraction in percentiles
+                ]
+        return rows
+
+    def count_by_department_year_rank_and_journal(
+        self, conditions: Optional[dict] = None
+    ) -> List[Dict]:
+        """
+        학과 × 연도 × 저널 등급 × 저널명별 논문 수 (GROUP BY 한 번)
+
+        등급 분포와 저널 순위를 모두 이 결과에서 계산한다.
+
+        Returns:
+            [{'department_id', 'year', 'journal_rank', 'journal_name', 'count'}, ...]
+        """
+        return list(
+            self.model_class.objects.filter(**(conditions or {}))
+            .annotate(year=ExtractYear('publication_date'))
+            .values('department_id', 'year', 'journal_rank', 'journal_name')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+
+    @staticmethod
+    def _impact_factors_by_department_and_year(queryset) -> Dict[tuple, List[float]]:
+        """(학과 ID, 연도) -> 정렬된 Impact Factor 목록 (percentile_cont 미지원 DB용)"""
+        values = defaultdict(list)
+        rows = (
+            queryset.filter(impact_factor__isnull=False)
+            .annotate(year=ExtractYear('publication_date'))
+            .order_by('department_id', 'year', 'impact_factor')
+            .values_list('department_id', 'year', 'impact_factor')
+        )
+        for department_id, year, impact_factor in rows:
+            values[(department_id, year)].append(float(impact_factor))
+        return values
+
+    @staticmethod
+    def _interpolate_percentile(ordered: List[float], fraction: float) -> Optional[float]:
+        """정렬된 값의 연속 백분위수 (percentile_cont와 같은 선형 보간)"""
+        if not ordered:
+            return None
+        position = fraction * (len(ordered) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    # ----- 전문 검색 -----
+
+    # SQLite FTS5 대체 인덱스 (로컬/테스트용)
+    SQLITE_FTS_TABLE = 'publications_fts'
+
+    def search_full_text(
+        self,
+        terms: List[str],
+        limit: int,
+        department_id: Optional[int] = None,
+        highlight_start: str = '<mark>',
+        highlight_end: str = '</mark>',
+    ) -> List[Dict]:
+        """
+        제목/저널명/저자 전문 검색 (관련도 내림차순)
+
+        모든 검색어가 (접두어로) 포함된 논문만 반환한다.
+        PostgreSQL은 search_vector(tsvector 생성 컬럼, GIN 인덱스),
+        SQLite는 FTS5 가상 테이블을 사용한다.
+
+        Returns:
+            [{'id', 'rank', 'title_highlight', 'journal_highlight'}, ...]
+
+        Raises:
+            NotSupportedError: 전문 검색을 지원하지 않는 DB이거나 SQLite 색인이 없는 경우
+        """
+        if connection.vendor == 'postgresql':
+            rows = self._search_postgresql(terms, limit, department_id, highlight_start, highlight_end)
+        elif connection.vendor == 'sqlite':
+            rows = self._search_sqlite(terms, limit, department_id, highlight_start, highlight_end)
+        else:
+            raise NotSupportedError(f'전문 검색을 지원하지 않는 DB입니다: {connection.vendor}')
+
+        return [
+            {
+                'id': row[0],
+                'rank': float(row[1]),
+                'title_highlight': row[2] or '',
+                'journal_highlight': row[3] or '',
+            }
+            for row in rows
+        ]
+
+    def _search_postgresql(self, terms, limit, department_id, start, end) -> list:
+        table = self.model_class._meta.db_table
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        department_filter = 'AND p.department_id = %s' if department_id is not None else ''
+        headline_options = f'StartSel="{start}", StopSel="{end}", HighlightAll=TRUE'
+
+        # 순위 계산 후 상위 limit건에만 ts_headline 적용
+        sql = f"""
+            WITH q AS (SELECT to_tsquery('simple', %s) AS query),
+            ranked AS (
+                SELECT p.id, p.title, p.journal_name,
+                       ts_rank_cd(p.search_vector, q.query) AS rank
+                FROM {table} p, q
+                WHERE p.search_vector @@ q.query {department_filter}
+                ORDER BY rank DESC, p.id DESC
+                LIMIT %s
+            )
+            SELECT r.id, r.rank,
+                   ts_headline('simple', r.title, q.query, %s),
+                   ts_headline('simple', COALESCE(r.journal_name, ''), q.query, %s)
+            FROM ranked r, q
+            ORDER BY r.rank DESC, r.id DESC
+        """
+        params = [tsquery]
+        if department_id is not None:
+            params.append(department_id)
+        params += [limit, headline_options, headline_options]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def _search_sqlite(self, terms, limit, department_id, start, end) -> list:
+        table = self.model_class._meta.db_table
+        fts = self.SQLITE_FTS_TABLE
+        if fts not in connection.introspection.table_names():
+            raise NotSupportedError(
+                '전문 검색 색인이 없습니다. python manage.py setup_publication_fts 를 실행하세요.'
+            )
+        match = ' '.join(f'"{term}"*' for term in terms)
+        department_filter = 'AND p.department_id = %s' if department_id is not None else ''
+
+        # bm25는 낮을수록 관련도가 높으므로 부호 반전 (제목 > 저널명 > 저자 가중치)
+        sql = f"""
+            SELECT f.rowid, -bm25({fts}, 10.0, 5.0, 1.0) AS rank,
+                   highlight({fts}, 0, %s, %s),
+                   highlight({fts}, 1, %s, %s)
+            FROM {fts} f
+            JOIN {table} p ON p.id = f.rowid
+            WHERE {fts} MATCH %s {department_filter}
+            ORDER BY rank DESC, f.rowid DESC
+            LIMIT %s
+        """
+        params = [start, end, start, end, match]
+        if department_id is not None:
+            params.append(department_id)
+        params.append(limit)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def ensure_sqlite_fts(self) -> None:
+        """
+        SQLite FTS5 테이블과 동기화 트리거 생성 (로컬/테스트 DB 설정용, 검색 요청에서는 호출하지 않음)
+
+        트리거가 없으면(최초 실행 또는 publications 테이블 재생성) 만들고 색인을 다시 채운다.
+        """
+        table = self.model_class._meta.db_table
+        fts = self.SQLITE_FTS_TABLE
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = %s",
+                [f'{fts}_ai'],
+            )
+            if cursor.fetchone():
+                return
+
+            columns = "title, journal_name, authors"
+            values = (
+                "{row}.title, COALESCE({row}.journal_name, ''), "
+                "COALESCE({row}.primary_author, '') || ' ' || COALESCE({row}.contributing_authors, '')"
+            )
+            cursor.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns})")
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {fts} (rowid, {columns}) VALUES (new.id, {values.format(row='new')});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                    DELETE FROM {fts} WHERE rowid = old.id;
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+                    DELETE FROM {fts} WHERE rowid = old.id;
+                    INSERT INTO {fts} (rowid, {columns}) VALUES (new.id, {values.format(row='new')});
+                END
+            """)
+            cursor.execute(f"DELETE FROM {fts}")
+            cursor.execute(
+                f"INSERT INTO {fts} (rowid, {columns}) SELECT id, {values.format(row=table)} FROM {table}"
+            )
+
 
 class ResearchProjectRepository(BaseRepository[ResearchProject]):
     """연구 과제 데이터 접근 레이어"""
@@ -127,6 +443,81 @@ class ResearchProjectRepository(BaseRepository[ResearchProject]):
         )
         return result['total'] or 0
 
+    def totals_by_department(self) -> Dict[int, Dict]:
+        """학과별 과제 수와 총 연구비 (GROUP BY 한 번)"""
+        result = self.model_class.objects.values('department_id').annotate(
+            project_count=Count('id'), total_funding=Sum('total_funding_amount'),
+        ).order_by()
+        return {item['department_id']: item for item in result}
+
+    def stats_by_department_and_year(self, department_ids: Iterable[int]) -> List[Dict]:
+        """
+        학과 × 연도별 과제 수 및 총 연구비
+
+        과제 연도는 첫 집행일의 연도이며, 집행 내역이 없는 과제는 등록 연도를 사용한다.
+        """
+        first_execution_year = Subquery(
+            ProjectExpense.objects.filter(project=OuterRef('pk'))
+            .order_by('execution_date')
+            .annotate(execution_year=ExtractYear('execution_date'))
+            .values('execution_year')[:1],
+            output_field=IntegerField(),
+        )
+        return list(
+            self.model_class.objects.filter(department_id__in=department_ids)
+            .annotate(year=Coalesce(first_execution_year, ExtractYear('created_at')))
+            .values('department_id', 'year')
+            .annotate(project_count=Count('id'), total_funding=Sum('total_funding_amount'))
+            .order_by()
+        )
+
+    def get_department_ids(self) -> List[int]:
+        """연구 과제가 존재하는 학과 ID 목록"""
+        return list(
+            self.model_class.objects.values_list('department_id', flat=True).distinct()
+        )
+
+    def get_total_funding_by_project(self, project_id: int) -> int:
+        """특정 과제의 총 연구비"""
+        result = self.model_class.objects.filter(pk=project_id).aggregate(
+            total=Sum('total_funding_amount')
+        )
+        return result['total'] or 0
+
+    def with_expense_totals(self, queryset: Optional[QuerySet] = None) -> QuerySet:
+        """
+        과제별 집행 금액 주석 추가 (과제마다 조회하지 않고 집행내역 JOIN + GROUP BY 한 번)
+
+        executed_amount: 집행완료 금액
+        pending_amount: 처리중 금액
+        remaining_amount: 총 연구비 - 집행완료 금액
+        execution_rate: 집행완료 금액 / 총 연구비 × 100 (소수점 둘째 자리, 연구비가 없으면 0)
+        """
+        if queryset is None:
+            queryset = self.model_class.objects.all()
+
+        executed = Coalesce(
+            Sum('expenses__amount', filter=Q(expenses__status=ProjectStatus.COMPLETED)), 0
+        )
+        return queryset.annotate(
+            executed_amount=executed,
+            pending_amount=Coalesce(
+                Sum('expenses__amount', filter=Q(expenses__status=ProjectStatus.PROCESSING)), 0
+            ),
+            remaining_amount=Coalesce(F('total_funding_amount'), 0) - executed,
+            execution_rate=Case(
+                When(
+                    total_funding_amount__gt=0,
+                    then=Cast(
+                        Cast(executed, FloatField()) * 100 / F('total_funding_amount'),
+                        DecimalField(max_digits=12, decimal_places=2),
+                    ),
+                ),
+                default=Value(0),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            ),
+        )
+
 
 class ProjectExpenseRepository(BaseRepository[ProjectExpense]):
     """연구 과제 집행 데이터 접근 레이어"""
@@ -169,3 +560,128 @@ class ProjectExpenseRepository(BaseRepository[ProjectExpense]):
             total=Sum('amount')
         )
         return result['total'] or 0
+
+    def get_queryset_by_project(self, project_id: int, conditions: Optional[dict] = None) -> QuerySet:
+        """특정 과제의 집행 내역 QuerySet (과제 하위 목록 API 페이지네이션용)"""
+        return self.model_class.objects.filter(project_id=project_id, **(conditions or {}))
+
+    def sum_executed_by_department_and_year(
+        self, department_ids: Iterable[int]
+    ) -> List[Dict]:
+        """학과 × 연도별 집행 완료 금액"""
+        return list(
+            self.model_class.objects.filter(
+                status=ProjectStatus.COMPLETED, project__department_id__in=department_ids
+            )
+            .annotate(year=ExtractYear('execution_date'))
+            .values('year', department_id=F('project__department_id'))
+            .annotate(total_expenses=Sum('amount'))
+            .order_by()
+        )
+
+    def monthly_burn_down(
+        self,
+        project_id: Optional[int] = None,
+        department_id: Optional[int] = None,
+        status: str = ProjectStatus.COMPLETED,
+    ) -> List[Dict]:
+        """
+        월별 집행 금액 및 누적 집행 금액 (번다운 차트용)
+
+        월 단위 집계와 누적 합계를 모두 데이터베이스에서 계산한다.
+
+        Returns:
+            [{'month': date, 'monthly_amount': int, 'cumulative_amount': int}, ...]
+        """
+        queryset = self.model_class.objects.filter(status=status)
+        if project_id is not None:
+            queryset = queryset.filter(project_id=project_id)
+        if department_id is not None:
+            queryset = queryset.filter(project__department_id=department_id)
+
+        return list(
+            queryset.annotate(month=TruncMonth('execution_date'))
+            .values('month')
+            .annotate(monthly_amount=Sum('amount'))
+            .annotate(
+                cumulative_amount=Window(
+                    RunningSum(Sum('amount')), order_by=F('month').asc()
+                )
+            )
+            .order_by('month')
+        )
+
+
+class DepartmentYearRollupRepository(BaseRepository[DepartmentYearRollup]):
+    """학과 × 연도 집계 데이터 접근 레이어"""
+
+    def __init__(self):
+        super().__init__(DepartmentYearRollup)
+
+    def replace_for_departments(
+        self, department_ids: Iterable[int], rollups: List[DepartmentYearRollup]
+    ) -> None:
+        """특정 학과들의 집계를 새로 계산된 값으로 교체 (삭제와 삽입을 한 트랜잭션으로)"""
+        with transaction.atomic():
+            self.model_class.objects.filter(department_id__in=department_ids).delete()
+            self.bulk_create(rollups)
+
+    def publications_by_year(self) -> List[Dict]:
+        """연도별 논문 수 집계"""
+        return list(
+            self.model_class.objects.values('year')
+            .annotate(count=Sum('publication_count'))
+            .filter(count__gt=0)
+            .order_by('year')
+        )
+
+    def totals_by_department(self) -> Dict[int, Dict]:
+        """학과별 전체 기간 합계 (논문 수, 과제 수, 총 연구비)"""
+        result = self.model_class.objects.values('department_id').annotate(
+            publication_count=Sum('publication_count'),
+            project_count=Sum('project_count'),
+            total_funding=Sum('total_funding'),
+        )
+        return {item['department_id']: item for item in result}
+
+
+class DeletedRecordRepository(BaseRepository[DeletedRecord]):
+    """삭제 기록 (증분 동기화 tombstone) 데이터 접근 레이어"""
+
+    def __init__(self):
+        super().__init__(DeletedRecord)
+
+    def record_deletions(self, table_name: str, record_ids: Iterable[int]) -> None:
+        """삭제된 행 ID 기록"""
+        self.bulk_create([
+            self.model_class(table_name=table_name, record_id=record_id)
+            for record_id in record_ids
+        ])
+
+    def record_resets(self, table_names: Iterable[str]) -> None:
+        """테이블 전체 삭제 기록 (record_id = NULL)"""
+        self.bulk_create([
+            self.model_class(table_name=table_name, record_id=None)
+            for table_name in table_names
+        ])
+
+    def has_reset_after(self, table_name: str, after) -> bool:
+        """after 이후 테이블 전체 삭제가 있었는지 여부"""
+        return self.model_class.objects.filter(
+            table_name=table_name, record_id__isnull=True, deleted_at__gt=after
+        ).exists()
+
+    def get_deleted_ids(self, table_name: str, after, until=None) -> List[int]:
+        """(after, until] 구간에 삭제된 행 ID (중복 제거, 삭제 순)"""
+        queryset = self.model_class.objects.filter(
+            table_name=table_name, record_id__isnull=False, deleted_at__gt=after
+        )
+        if until is not None:
+            queryset = queryset.filter(deleted_at__lte=until)
+        record_ids = queryset.order_by('deleted_at', 'id').values_list('record_id', flat=True)
+        return list(dict.fromkeys(record_ids))
+
+    def delete_before(self, cutoff) -> int:
+        """보관 기간이 지난 삭제 기록 정리"""
+        deleted, _ = self.model_class.objects.filter(deleted_at__lt=cutoff).delete()
+        return deleted
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+
+from apps.core.bulk import PrefetchedPrimaryKeyRelatedField
 from .models import (
     College, Department, Student, DepartmentKPI,
     Publication, ResearchProject, ProjectExpense
@@ -7,25 +9,40 @@ from .models import (
 
 # ============= CRUD Serializers =============
 
-class CollegeSerializer(serializers.ModelSerializer):
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """fields 인자로 출력 필드를 제한할 수 있는 ModelSerializer (?fields= 지원)"""
+
+    # 대량 처리 시 관계 객체를 미리 조회해 사용
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class CollegeSerializer(DynamicFieldsModelSerializer):
     """단과대학 Serializer"""
     class Meta:
         model = College
-        fields = ['id', 'name', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = ['id', 'name', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentSerializer(DynamicFieldsModelSerializer):
     """학과 Serializer"""
     college_name = serializers.CharField(source='college.name', read_only=True)
 
     class Meta:
         model = Department
-        fields = ['id', 'college', 'college_name', 'name', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = ['id', 'college', 'college_name', 'name', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(DynamicFieldsModelSerializer):
     """학생 Serializer"""
     department_name = serializers.CharField(source='department.name', read_only=True)
     college_name = serializers.CharField(source='department.college.name', read_only=True)
@@ -35,12 +52,12 @@ class StudentSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'student_id_number', 'name', 'department', 'department_name',
             'college_name', 'grade', 'program_level', 'status', 'gender',
-            'admission_year', 'advisor_name', 'email', 'created_at'
+            'admission_year', 'advisor_name', 'email', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class DepartmentKPISerializer(serializers.ModelSerializer):
+class DepartmentKPISerializer(DynamicFieldsModelSerializer):
     """학과 KPI Serializer"""
     department_name = serializers.CharField(source='department.name', read_only=True)
 
@@ -49,12 +66,12 @@ class DepartmentKPISerializer(serializers.ModelSerializer):
         fields = [
             'id', 'department', 'department_name', 'evaluation_year',
             'employment_rate', 'full_time_faculty_count', 'visiting_faculty_count',
-            'tech_transfer_income', 'international_conferences_count', 'created_at'
+            'tech_transfer_income', 'international_conferences_count', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class PublicationSerializer(serializers.ModelSerializer):
+class PublicationSerializer(DynamicFieldsModelSerializer):
     """논문 Serializer"""
     department_name = serializers.CharField(source='department.name', read_only=True)
 
@@ -64,26 +81,32 @@ class PublicationSerializer(serializers.ModelSerializer):
             'id', 'publication_id_str', 'publication_date', 'department',
             'department_name', 'title', 'primary_author', 'contributing_authors',
             'journal_name', 'journal_rank', 'impact_factor', 'is_project_linked',
-            'created_at'
+            'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class ResearchProjectSerializer(serializers.ModelSerializer):
+class ResearchProjectSerializer(DynamicFieldsModelSerializer):
     """연구과제 Serializer"""
     department_name = serializers.CharField(source='department.name', read_only=True)
+    # 조회 시 ResearchProjectRepository.with_expense_totals() 주석 값 (없으면 생략)
+    executed_amount = serializers.IntegerField(read_only=True)
+    pending_amount = serializers.IntegerField(read_only=True)
+    remaining_amount = serializers.IntegerField(read_only=True)
+    execution_rate = serializers.FloatField(read_only=True)
 
     class Meta:
         model = ResearchProject
         fields = [
             'id', 'project_number', 'name', 'principal_investigator',
             'department', 'department_name', 'funding_agency',
-            'total_funding_amount', 'created_at'
+            'total_funding_amount', 'executed_amount', 'pending_amount',
+            'remaining_amount', 'execution_rate', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class ProjectExpenseSerializer(serializers.ModelSerializer):
+class ProjectExpenseSerializer(DynamicFieldsModelSerializer):
     """과제집행내역 Serializer"""
     project_name = serializers.CharField(source='project.name', read_only=True)
     project_number = serializers.CharField(source='project.project_number', read_only=True)
@@ -92,9 +115,9 @@ class ProjectExpenseSerializer(serializers.ModelSerializer):
         model = ProjectExpense
         fields = [
             'id', 'execution_id', 'project', 'project_name', 'project_number',
-            'execution_date', 'item', 'amount', 'status', 'notes', 'created_at'
+            'execution_date', 'item', 'amount', 'status', 'notes', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
 
 # ============= Dashboard Serializers =============
@@ -115,6 +138,24 @@ class DashboardSummarySerializer(serializers.Serializer):
     budget_execution = serializers.DictField(required=False)
 
 
+class BurnDownPointSerializer(serializers.Serializer):
+    """월별 번다운 데이터 Serializer"""
+
+    month = serializers.CharField()
+    monthly_amount = serializers.IntegerField()
+    cumulative_amount = serializers.IntegerField()
+    remaining_budget = serializers.IntegerField()
+
+
+class BurnDownSerializer(serializers.Serializer):
+    """연구비 번다운 응답 Serializer"""
+
+    scope = serializers.ChoiceField(choices=['project', 'department'])
+    scope_id = serializers.IntegerField()
+    total_budget = serializers.IntegerField()
+    series = BurnDownPointSerializer(many=True)
+
+
 class FileUploadSerializer(serializers.Serializer):
     """파일 업로드 요청 Serializer"""
 
@@ -0,0 +1,278 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+from django.conf import settings
+from django.db.models import Aggregate, Avg, Count, Max, Min, Sum
+
+from apps.core.filters import parse_date, parse_filter_params, parse_int, parse_str
+from apps.core.repositories import BaseRepository
+from apps.dashboard.repositories import (
+    StudentRepository,
+    PublicationRepository,
+    DepartmentKPIRepository,
+    ResearchProjectRepository,
+    ProjectExpenseRepository,
+)
+from .cache import cached_by_data_version
+
+
+# 한 번에 묶을 수 있는 최대 그룹 기준 수
+MAX_GROUP_BY = 3
+
+
+@dataclass(frozen=True)
+class AggregateDataset:
+    """
+    집계 API에서 허용하는 데이터셋 정의
+
+    group_by: 그룹 기준 이름 -> ORM 경로
+    metrics: 지표 이름 -> 집계 식
+    filters: 필터 파라미터 -> (ORM 조회 조건, 값 변환 함수) (목록 API filter_params와 같은 형식)
+    cache_datasets: 결과가 의존하는 데이터 종류 (services.cache.DATASETS)
+    """
+    repository_class: Type[BaseRepository]
+    group_by: Dict[str, str]
+    metrics: Dict[str, Aggregate]
+    filters: Dict[str, Tuple[str, Callable]]
+    cache_datasets: Tuple[str, ...]
+
+
+AGGREGATE_DATASETS = {
+    'students': AggregateDataset(
+        repository_class=StudentRepository,
+        group_by={
+            'department': 'department_id',
+            'college': 'department__college_id',
+            'status': 'status',
+            'program_level': 'program_level',
+            'admission_year': 'admission_year',
+            'grade': 'grade',
+            'gender': 'gender',
+        },
+        metrics={
+            'count': Count('id'),
+        },
+        filters={
+            'department': ('department_id', parse_int),
+            'college': ('department__college_id', parse_int),
+            'status': ('status', parse_str),
+            'program_level': ('program_level', parse_str),
+            'admission_year': ('admission_year', parse_int),
+        },
+        cache_datasets=('departments', 'students'),
+    ),
+    'kpis': AggregateDataset(
+        repository_class=DepartmentKPIRepository,
+        group_by={
+            'department': 'department_id',
+            'college': 'department__college_id',
+            'evaluation_year': 'evaluation_year',
+        },
+        metrics={
+            'count': Count('id'),
+            'avg_employment_rate': Avg('employment_rate'),
+            'sum_full_time_faculty': Sum('full_time_faculty_count'),
+            'sum_visiting_faculty': Sum('visiting_faculty_count'),
+            'sum_tech_transfer_income': Sum('tech_transfer_income'),
+            'sum_international_conferences': Sum('international_conferences_count'),
+        },
+        filters={
+            'department': ('department_id', parse_int),
+            'college': ('department__college_id', parse_int),
+            'evaluation_year': ('evaluation_year', parse_int),
+        },
+        cache_datasets=('departments', 'kpis'),
+    ),
+    'publications': AggregateDataset(
+        repository_class=PublicationRepository,
+        group_by={
+            'department': 'department_id',
+            'college': 'department__college_id',
+            'year': 'publication_date__year',
+            'journal_rank': 'journal_rank',
+            'is_project_linked': 'is_project_linked',
+        },
+        metrics={
+            'count': Count('id'),
+            'avg_impact_factor': Avg('impact_factor'),
+            'max_impact_factor': Max('impact_factor'),
+            'sum_impact_factor': Sum('impact_factor'),
+        },
+        filters={
+            'department': ('department_id', parse_int),
+            'college': ('department__college_id', parse_int),
+            'journal_rank': ('journal_rank', parse_str),
+            'date_from': ('publication_date__gte', parse_date),
+            'date_to': ('publication_date__lte', parse_date),
+        },
+        cache_datasets=('departments', 'publications'),
+    ),
+    'projects': AggregateDataset(
+        repository_class=ResearchProjectRepository,
+        group_by={
+            'department': 'department_id',
+            'college': 'department__college_id',
+            'funding_agency': 'funding_agency',
+        },
+        metrics={
+            'count': Count('id'),
+            'sum_funding': Sum('total_funding_amount'),
+            'avg_funding': Avg('total_funding_amount'),
+        },
+        filters={
+            'department': ('department_id', parse_int),
+            'college': ('department__college_id', parse_int),
+        },
+        cache_datasets=('departments', 'projects'),
+    ),
+    'expenses': AggregateDataset(
+        repository_class=ProjectExpenseRepository,
+        group_by={
+            'project': 'project_id',
+            'department': 'project__department_id',
+            'college': 'project__department__college_id',
+            'status': 'status',
+            'year': 'execution_date__year',
+            'month': 'execution_date__month',
+        },
+        metrics={
+            'count': Count('id'),
+            'sum_amount': Sum('amount'),
+            'avg_amount': Avg('amount'),
+            'min_execution_date': Min('execution_date'),
+            'max_execution_date': Max('execution_date'),
+        },
+        filters={
+            'project': ('project_id', parse_int),
+            'department': ('project__department_id', parse_int),
+            'college': ('project__department__college_id', parse_int),
+            'status': ('status', parse_str),
+            'date_from': ('execution_date__gte', parse_date),
+            'date_to': ('execution_date__lte', parse_date),
+        },
+        cache_datasets=('departments', 'projects', 'expenses'),
+    ),
+}
+AGGREGATE_DATASET_NAMES = tuple(AGGREGATE_DATASETS)
+
+
+class AggregationService:
+    """허용 목록 기반 범용 집계 (차트별 전용 메서드 없이 GROUP BY 쿼리 한 번)"""
+
+    def get_dataset(self, name: str) -> AggregateDataset:
+        """
+        데이터셋 정의 조회
+
+        Raises:
+            ValueError: 허용되지 않은 데이터셋
+        """
+        try:
+            return AGGREGATE_DATASETS[name]
+        except KeyError:
+            raise ValueError(f"알 수 없는 데이터셋입니다: {name}")
+
+    def aggregate(
+        self,
+        dataset: str,
+        group_by: Sequence[str] = (),
+        metrics: Sequence[str] = ('count',),
+        filters: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """
+        데이터셋을 그룹 기준별로 집계 (데이터 버전 기준 캐싱)
+
+        Args:
+            dataset: 데이터셋 이름 (AGGREGATE_DATASETS)
+            group_by: 그룹 기준 이름 목록 (최대 MAX_GROUP_BY개, 비어 있으면 전체 합계 한 행)
+            metrics: 지표 이름 목록
+            filters: 필터 파라미터 -> 원본 문자열 값
+
+        Returns:
+            {
+                'dataset': str,
+                'group_by': [str],
+                'metrics': [str],
+                'rows': [{<그룹 기준>: 값, ..., <지표>: 값}],
+                'truncated': bool  # DASHBOARD_AGGREGATE_MAX_ROWS를 넘어 잘렸는지 여부
+            }
+
+        Raises:
+            ValueError: 허용되지 않은 데이터셋/그룹 기준/지표/필터 또는 잘못된 필터 값
+        """
+        spec = self.get_dataset(dataset)
+        group_by = list(dict.fromkeys(group_by))
+        metrics = list(dict.fromkeys(metrics))
+
+        unknown = [name for name in group_by if name not in spec.group_by]
+        if unknown:
+            raise ValueError(f"허용되지 않은 그룹 기준입니다: {', '.join(unknown)}")
+        if len(group_by) > MAX_GROUP_BY:
+            raise ValueError(f"그룹 기준은 최대 {MAX_GROUP_BY}개까지 지정할 수 있습니다.")
+        if not metrics:
+            raise ValueError('지표를 하나 이상 지정해야 합니다.')
+        unknown = [name for name in metrics if name not in spec.metrics]
+        if unknown:
+            raise ValueError(f"허용되지 않은 지표입니다: {', '.join(unknown)}")
+
+        filters = {param: value for param, value in (filters or {}).items() if value != ''}
+        unknown = [param for param in filters if param not in spec.filters]
+        if unknown:
+            raise ValueError(f"허용되지 않은 필터입니다: {', '.join(unknown)}")
+        conditions, errors = parse_filter_params(spec.filters, filters)
+        if errors:
+            raise ValueError(' '.join(f"{param}: {message}" for param, message in errors.items()))
+
+        params = {
+            'dataset': dataset,
+            'group_by': group_by,
+            'metrics': metrics,
+            'filters': sorted(filters.items()),
+        }
+        return cached_by_data_version(
+            'aggregate',
+            params,
+            lambda: self._build_aggregate(dataset, spec, group_by, metrics, conditions),
+            datasets=spec.cache_datasets,
+        )
+
+    def _build_aggregate(
+        self,
+        dataset: str,
+        spec: AggregateDataset,
+        group_by: List[str],
+        metrics: List[str],
+        conditions: dict,
+    ) -> dict:
+        """집계 쿼리 실행 (행 수 상한 + 1건을 조회해 잘림 여부 판단)"""
+        max_rows = settings.DASHBOARD_AGGREGATE_MAX_ROWS
+        group_paths = [spec.group_by[name] for name in group_by]
+
+        rows = spec.repository_class().aggregate_by(
+            group_paths,
+            {metric: spec.metrics[metric] for metric in metrics},
+            conditions=conditions,
+            limit=max_rows + 1,
+        )
+        truncated = len(rows) > max_rows
+
+        return {
+            'dataset': dataset,
+            'group_by': group_by,
+            'metrics': metrics,
+            'rows': [
+                {
+                    **{name: row[path] for name, path in zip(group_by, group_paths)},
+                    **{metric: self._to_number(row[metric]) for metric in metrics},
+                }
+                for row in rows[:max_rows]
+            ],
+            'truncated': truncated,
+        }
+
+    @staticmethod
+    def _to_number(value):
+        """Decimal 집계값 -> float (JSON 응답에서 문자열이 되지 않도록)"""
+        if isinstance(value, Decimal):
+            return float(value)
+        return value
@@ -0,0 +1,114 @@
+import hashlib
+import json
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.db_routing import cache_build_context, pin_cache_builds_to_primary
+
+
+DATA_VERSION_KEY = 'dashboard:data_version'
+
+# 캐시 무효화 단위가 되는 데이터 종류
+DATASETS = (
+    'departments',
+    'students',
+    'kpis',
+    'publications',
+    'projects',
+    'expenses',
+)
+
+# ViewSet/Import 데이터 종류 -> 무효화할 데이터 종류
+IMPORT_DATASETS = {
+    'students': ('students',),
+    'kpis': ('kpis',),
+    'publications': ('publications',),
+    'projects': ('projects', 'expenses'),
+}
+
+
+def _version_key(dataset: Optional[str]) -> str:
+    return f"{DATA_VERSION_KEY}:{dataset}" if dataset else DATA_VERSION_KEY
+
+
+def get_data_version(dataset: Optional[str] = None) -> int:
+    """
+    현재 데이터 버전 조회 (없으면 1로 초기화)
+
+    Args:
+        dataset: 데이터 종류 (None이면 전체 데이터 버전)
+    """
+    key = _version_key(dataset)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def _incr(key: str) -> int:
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # 키가 없거나 만료된 경우
+        cache.set(key, 2, timeout=None)
+        return 2
+
+
+def bump_data_version(*datasets: str) -> int:
+    """
+    데이터 버전 증가
+
+    데이터가 변경되면 호출하여 이전 버전으로 캐시된 결과가
+    더 이상 조회되지 않도록 한다. 전체 데이터 버전은 항상 증가하며,
+    데이터 종류를 지정하지 않으면 모든 데이터 종류의 버전도 증가한다.
+    """
+    for dataset in datasets or DATASETS:
+        _incr(_version_key(dataset))
+    # 복제 지연 동안 새 버전 캐시가 복제본의 이전 데이터로 채워지지 않도록 잠시 캐시 계산만 primary에서 실행
+    pin_cache_builds_to_primary()
+    return _incr(_version_key(None))
+
+
+def build_cache_key(
+    namespace: str, params: Optional[dict] = None, datasets: Optional[Iterable[str]] = None
+) -> str:
+    """데이터 버전과 파라미터를 포함한 캐시 키 생성"""
+    params_digest = hashlib.md5(
+        json.dumps(params or {}, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    if datasets:
+        version = '.'.join(f"{name}{get_data_version(name)}" for name in sorted(datasets))
+    else:
+        version = str(get_data_version())
+    return f"dashboard:{namespace}:v{version}:{params_digest}"
+
+
+def cached_by_data_version(
+    namespace: str,
+    params: Optional[dict],
+    builder: Callable[[], Any],
+    timeout: Optional[int] = None,
+    datasets: Optional[Iterable[str]] = None,
+) -> Any:
+    """
+    데이터 버전 기준으로 결과 캐싱
+
+    Args:
+        namespace: 캐시 구분자 (예: 'burn_down')
+        params: 결과에 영향을 주는 조회 조건
+        builder: 캐시 미스 시 결과를 계산하는 함수
+        timeout: 캐시 유지 시간 (초, 기본값: DASHBOARD_CACHE_TIMEOUT)
+        datasets: 결과가 의존하는 데이터 종류 (지정 시 해당 데이터 변경에만 무효화)
+    """
+    key = build_cache_key(namespace, params, datasets)
+    result = cache.get(key)
+    if result is None:
+        with cache_build_context():
+            result = builder()
+        if timeout is None:
+            timeout = getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', 300)
+        cache.set(key, result, timeout=timeout)
+    return result
@@ -1,8 +1,11 @@
-import pandas as pd
+from __future__ import annotations
+
 from typing import Dict
 from django.db import transaction
 from rest_framework.exceptions import ValidationError
 
+from apps.core.db_routing import use_primary
+from apps.core.lazy import LazyModule
 from apps.dashboard.repositories import (
     CollegeRepository,
     DepartmentRepository,
@@ -20,6 +23,12 @@ from apps.dashboard.models import (
     ProjectExpense,
 )
 from .validators import DataSchemaValidator
+from .cache import IMPORT_DATASETS, bump_data_version
+from .rollup import DepartmentYearRollupService
+from .sync import DeltaSyncService, IMPORT_SYNC_MODELS, SYNC_MODELS
+
+# pandas는 엑셀 import 시점에 로드 (URL 로딩/워커 부팅 시간 단축)
+pd = LazyModule('pandas')
 
 
 class ExcelImportService:
@@ -34,7 +43,10 @@ class ExcelImportService:
         self.project_repo = ResearchProjectRepository()
         self.expense_repo = ProjectExpenseRepository()
         self.validator = DataSchemaValidator()
+        self.rollup_service = DepartmentYearRollupService()
+        self.sync_service = DeltaSyncService()
 
+    @use_primary()
     @transaction.atomic
     def import_from_excel(self, file_path: str) -> Dict[str, int]:
         """
@@ -63,8 +75,13 @@ class ExcelImportService:
         # CSV 파일인 경우: 해당 테이블만 삭제
         # Excel 파일인 경우: 모든 데이터 삭제
         is_csv = file_path.lower().endswith('.csv')
+        touched_department_ids = set()
         if is_csv:
             print(f"[ExcelImporter] CSV 모드: {list(dataframes.keys())} 테이블만 삭제...")
+            # 삭제되는 데이터의 학과도 집계 갱신 대상
+            touched_department_ids = self.rollup_service.collect_department_ids(
+                dataframes.keys()
+            )
             self._delete_specific_data(dataframes.keys())
         else:
             print("[ExcelImporter] Excel 모드: 기존 데이터 전체 삭제...")
@@ -118,9 +135,32 @@ class ExcelImportService:
             result['project_expenses'] = expenses_count
             print(f"[ExcelImporter] 프로젝트 {projects_count}개, 지출 {expenses_count}개 저장 완료")
 
+        # 6. 변경된 학과의 연도별 집계 갱신
+        touched_department_ids.update(department_mapping.values())
+        rollup_count = self.rollup_service.refresh_departments(touched_department_ids)
+        print(f"[ExcelImporter] 학과×연도 집계 {rollup_count}개 갱신 완료")
+
+        # 커밋 이후 캐시된 대시보드 집계 무효화 (CSV는 해당 데이터 종류만)
+        if is_csv:
+            datasets = ['departments']
+            for data_type in dataframes.keys():
+                datasets.extend(IMPORT_DATASETS.get(data_type, ()))
+            transaction.on_commit(lambda: bump_data_version(*datasets))
+            reset_models = [
+                model for data_type in dataframes.keys()
+                for model in IMPORT_SYNC_MODELS.get(data_type, ())
+            ]
+        else:
+            transaction.on_commit(bump_data_version)
+            reset_models = SYNC_MODELS
+
+        # 커밋 이후 교체된 테이블 기록 (증분 동기화 클라이언트는 전체 재동기화)
+        transaction.on_commit(lambda: self.sync_service.record_resets(reset_models))
+
         print(f"[ExcelImporter] ✅ Import 완료: {result}")
         return result
 
+    @use_primary()
     @transaction.atomic
     def import_from_multiple_files(self, file_paths: list) -> Dict[str, int]:
         """
@@ -214,6 +254,14 @@ class ExcelImportService:
             result['project_expenses'] = expenses_count
             print(f"[ExcelImporter] 프로젝트 {projects_count}개, 지출 {expenses_count}개 저장 완료")
 
+        # 6. 학과의 연도별 집계 갱신 (기존 학과는 전체 삭제 시 함께 삭제됨)
+        rollup_count = self.rollup_service.refresh_departments(department_mapping.values())
+        print(f"[ExcelImporter] 학과×연도 집계 {rollup_count}개 갱신 완료")
+
+        # 커밋 이후 캐시된 대시보드 집계 무효화 및 교체된 테이블 기록
+        transaction.on_commit(bump_data_version)
+        transaction.on_commit(lambda: self.sync_service.record_resets(SYNC_MODELS))
+
         print(f"[ExcelImporter] ✅ 배치 Import 완료: {result}")
         return result
 
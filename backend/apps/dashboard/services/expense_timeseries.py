@@ -0,0 +1,75 @@
+from typing import Optional
+
+from apps.dashboard.repositories import (
+    ProjectExpenseRepository,
+    ResearchProjectRepository,
+)
+from .cache import cached_by_data_version
+
+
+class ExpenseBurnDownService:
+    """연구비 월별 번다운 시계열 생성"""
+
+    def __init__(self):
+        self.expense_repo = ProjectExpenseRepository()
+        self.project_repo = ResearchProjectRepository()
+
+    def generate_burn_down(
+        self, project_id: Optional[int] = None, department_id: Optional[int] = None
+    ) -> dict:
+        """
+        과제 또는 학과 단위 번다운 데이터 생성 (데이터 버전 기준 캐싱)
+
+        Returns:
+            {
+                'scope': 'project' | 'department',
+                'scope_id': int,
+                'total_budget': int,
+                'series': [
+                    {
+                        'month': 'YYYY-MM',
+                        'monthly_amount': int,
+                        'cumulative_amount': int,
+                        'remaining_budget': int,
+                    },
+                ]
+            }
+        """
+        if (project_id is None) == (department_id is None):
+            raise ValueError('project_id 또는 department_id 중 하나만 지정해야 합니다.')
+
+        params = {'project_id': project_id, 'department_id': department_id}
+        return cached_by_data_version(
+            'burn_down',
+            params,
+            lambda: self._build_burn_down(project_id, department_id),
+            datasets=('projects', 'expenses'),
+        )
+
+    def _build_burn_down(
+        self, project_id: Optional[int], department_id: Optional[int]
+    ) -> dict:
+        """번다운 데이터 계산"""
+        if project_id is not None:
+            total_budget = self.project_repo.get_total_funding_by_project(project_id)
+        else:
+            total_budget = self.project_repo.get_total_funding_by_department(department_id)
+
+        rows = self.expense_repo.monthly_burn_down(
+            project_id=project_id, department_id=department_id
+        )
+
+        return {
+            'scope': 'project' if project_id is not None else 'department',
+            'scope_id': project_id if project_id is not None else department_id,
+            'total_budget': total_budget,
+            'series': [
+                {
+                    'month': row['month'].strftime('%Y-%m'),
+                    'monthly_amount': row['monthly_amount'],
+                    'cumulative_amount': row['cumulative_amount'],
+                    'remaining_budget': total_budget - row['cumulative_amount'],
+                }
+                for row in rows
+            ],
+        }
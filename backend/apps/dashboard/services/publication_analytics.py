@@ -0,0 +1,151 @@
+from collections import defaultdict
+from typing import Optional
+
+from apps.dashboard.repositories import PublicationRepository
+from .cache import cached_by_data_version
+
+
+# 계산할 Impact Factor 백분위 (응답 키: p25, p50, ...)
+IMPACT_PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+
+# 저널 등급이 없는 논문의 등급 분포 키
+UNRANKED = '미분류'
+
+# 학과 × 연도별 최대 저널 순위 수
+MAX_TOP_JOURNALS = 20
+
+
+class PublicationImpactService:
+    """학과 × 연도별 논문 Impact Factor 분석"""
+
+    def __init__(self):
+        self.publication_repo = PublicationRepository()
+
+    def generate_impact_analytics(
+        self,
+        department_id: Optional[int] = None,
+        college_id: Optional[int] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        top_journals: int = 5,
+    ) -> dict:
+        """
+        학과 × 연도별 논문 Impact Factor 분석 (데이터 버전 기준 캐싱)
+
+        원본 논문 행을 조회하지 않고 GROUP BY 쿼리 두 번으로 계산한다.
+
+        Args:
+            department_id: 학과 ID
+            college_id: 단과대학 ID
+            year_from: 시작 연도 (포함)
+            year_to: 종료 연도 (포함)
+            top_journals: 학과 × 연도별 저널 순위 수 (1~MAX_TOP_JOURNALS)
+
+        Returns:
+            {
+                'percentiles': ['p25', 'p50', ...],
+                'results': [
+                    {
+                        'department_id': int,
+                        'department_name': str,
+                        'year': int,
+                        'publication_count': int,
+                        'impact_factor': {
+                            'count': int,  # Impact Factor가 있는 논문 수
+                            'sum': float,
+                            'mean': float | None,
+                            'percentiles': {'p25': float | None, ...},
+                        },
+                        'journal_rank_distribution': {'SCIE': int, 'KCI': int, ...},
+                        'project_linked_ratio': float,
+                        'top_journals': [{'journal_name': str, 'count': int}],
+                    },
+                ]
+            }
+
+        Raises:
+            ValueError: top_journals 범위 오류
+        """
+        if not 1 <= top_journals <= MAX_TOP_JOURNALS:
+            raise ValueError(f'top_journals는 1에서 {MAX_TOP_JOURNALS} 사이여야 합니다.')
+
+        params = {
+            'department_id': department_id,
+            'college_id': college_id,
+            'year_from': year_from,
+            'year_to': year_to,
+            'top_journals': top_journals,
+        }
+        return cached_by_data_version(
+            'publication_impact',
+            params,
+            lambda: self._build_impact_analytics(
+                department_id, college_id, year_from, year_to, top_journals
+            ),
+            datasets=('departments', 'publications'),
+        )
+
+    def _build_impact_analytics(
+        self,
+        department_id: Optional[int],
+        college_id: Optional[int],
+        year_from: Optional[int],
+        year_to: Optional[int],
+        top_journals: int,
+    ) -> dict:
+        """Impact Factor 분석 계산"""
+        conditions = {}
+        if department_id is not None:
+            conditions['department_id'] = department_id
+        if college_id is not None:
+            conditions['department__college_id'] = college_id
+        if year_from is not None:
+            conditions['publication_date__year__gte'] = year_from
+        if year_to is not None:
+            conditions['publication_date__year__lte'] = year_to
+
+        percentile_keys = [f'p{round(fraction * 100)}' for fraction in IMPACT_PERCENTILES]
+        stats = self.publication_repo.impact_stats_by_department_and_year(
+            conditions, percentiles=IMPACT_PERCENTILES
+        )
+
+        rank_distribution = defaultdict(dict)
+        journal_counts = defaultdict(lambda: defaultdict(int))
+        for row in self.publication_repo.count_by_department_year_rank_and_journal(conditions):
+            key = (row['department_id'], row['year'])
+            rank = row['journal_rank'] or UNRANKED
+            rank_distribution[key][rank] = rank_distribution[key].get(rank, 0) + row['count']
+            if row['journal_name']:
+                journal_counts[key][row['journal_name']] += row['count']
+
+        results = []
+        for row in stats:
+            key = (row['department_id'], row['year'])
+            count = row['publication_count']
+            impact_sum = row['impact_factor_sum']
+            impact_avg = row['impact_factor_avg']
+            journals = sorted(journal_counts[key].items(), key=lambda item: (-item[1], item[0]))
+
+            results.append({
+                'department_id': row['department_id'],
+                'department_name': row['department_name'],
+                'year': row['year'],
+                'publication_count': count,
+                'impact_factor': {
+                    'count': row['impact_factor_count'],
+                    'sum': round(float(impact_sum), 3) if impact_sum is not None else 0.0,
+                    'mean': round(float(impact_avg), 3) if impact_avg is not None else None,
+                    'percentiles': {
+                        name: round(value, 3) if value is not None else None
+                        for name, value in zip(percentile_keys, row['impact_factor_percentiles'])
+                    },
+                },
+                'journal_rank_distribution': dict(sorted(rank_distribution[key].items())),
+                'project_linked_ratio': round(row['project_linked_count'] / count, 4) if count else 0.0,
+                'top_journals': [
+                    {'journal_name': name, 'count': journal_count}
+                    for name, journal_count in journals[:top_journals]
+                ],
+            })
+
+        return {'percentiles': percentile_keys, 'results': results}
@@ -0,0 +1,77 @@
+import html
+import re
+from typing import List, Optional
+
+from apps.dashboard.repositories import PublicationRepository
+
+
+# DB 하이라이트 구분자 (원문에 나오지 않는 제어 문자 -> HTML 이스케이프 후 <mark>로 치환)
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_END = '\x03'
+
+MAX_TERMS = 8
+MAX_LIMIT = 100
+
+
+def parse_search_terms(query: str) -> List[str]:
+    """검색어 문자열 -> 소문자 단어 목록 (특수 문자 제거, 최대 MAX_TERMS개)"""
+    terms = [term.lower() for term in re.findall(r'\w+', query or '')]
+    return list(dict.fromkeys(terms))[:MAX_TERMS]
+
+
+def _render_highlight(text: str) -> str:
+    """구분자가 포함된 원문 -> <mark> 태그만 허용한 HTML"""
+    return (
+        html.escape(text)
+        .replace(HIGHLIGHT_START, '<mark>')
+        .replace(HIGHLIGHT_END, '</mark>')
+    )
+
+
+class PublicationSearchService:
+    """논문 전문 검색 (관련도 순위 + 하이라이트)"""
+
+    def __init__(self):
+        self.publication_repo = PublicationRepository()
+
+    def search(
+        self, query: str, limit: int = 20, department_id: Optional[int] = None
+    ) -> List[dict]:
+        """
+        제목/저널명/저자에서 모든 검색어를 포함하는 논문 검색
+
+        Args:
+            query: 검색어 (공백 구분, 각 단어는 접두어 일치)
+            limit: 최대 결과 수 (1 ~ MAX_LIMIT)
+            department_id: 학과 필터
+
+        Returns:
+            관련도 내림차순 [{'id', 'rank', 'highlight': {'title', 'journal_name'}}, ...]
+
+        Raises:
+            ValueError: 검색어가 비어 있는 경우
+        """
+        terms = parse_search_terms(query)
+        if not terms:
+            raise ValueError('검색어를 입력해야 합니다.')
+
+        limit = max(1, min(limit, MAX_LIMIT))
+        rows = self.publication_repo.search_full_text(
+            terms,
+            limit,
+            department_id=department_id,
+            highlight_start=HIGHLIGHT_START,
+            highlight_end=HIGHLIGHT_END,
+        )
+
+        return [
+            {
+                'id': row['id'],
+                'rank': round(row['rank'], 6),
+                'highlight': {
+                    'title': _render_highlight(row['title_highlight']),
+                    'journal_name': _render_highlight(row['journal_highlight']),
+                },
+            }
+            for row in rows
+        ]
@@ -0,0 +1,100 @@
+from typing import Dict, Iterable, Tuple
+
+from django.db import transaction
+
+from apps.dashboard.repositories import (
+    DepartmentRepository,
+    StudentRepository,
+    PublicationRepository,
+    ResearchProjectRepository,
+    ProjectExpenseRepository,
+    DepartmentYearRollupRepository,
+)
+from apps.dashboard.models import DepartmentYearRollup
+
+
+class DepartmentYearRollupService:
+    """학과 × 연도 집계 테이블 갱신"""
+
+    def __init__(self):
+        self.department_repo = DepartmentRepository()
+        self.student_repo = StudentRepository()
+        self.publication_repo = PublicationRepository()
+        self.project_repo = ResearchProjectRepository()
+        self.expense_repo = ProjectExpenseRepository()
+        self.rollup_repo = DepartmentYearRollupRepository()
+
+    def refresh_departments(self, department_ids: Iterable[int]) -> int:
+        """
+        특정 학과들의 집계만 원본 테이블에서 다시 계산
+
+        Import 또는 CRUD로 변경된 학과만 전달하면 나머지 학과의 집계는 유지된다.
+        학과 행을 잠근 뒤 계산하므로 같은 학과를 동시에 갱신해도 나중 갱신이 앞선 쓰기까지
+        반영한 값으로 교체하며, (학과, 연도) 중복 삽입이 발생하지 않는다.
+
+        Returns:
+            저장된 집계 행 수
+        """
+        department_ids = sorted({dept_id for dept_id in department_ids if dept_id is not None})
+        if not department_ids:
+            return 0
+
+        with transaction.atomic():
+            self.department_repo.lock(department_ids)
+            rollups = self._compute(department_ids)
+            self.rollup_repo.replace_for_departments(department_ids, rollups)
+        return len(rollups)
+
+    def rebuild_all(self) -> int:
+        """전체 학과 집계 재계산 (관리 명령 rebuild_department_year_rollup에서 실행)"""
+        with transaction.atomic():
+            department_ids = self.department_repo.lock(
+                dept.id for dept in self.department_repo.get_all()
+            )
+            self.rollup_repo.delete_all()
+            return self.refresh_departments(department_ids)
+
+    def is_built(self) -> bool:
+        """집계 테이블 사용 가능 여부 (원본 학과가 있는데 비어 있으면 아직 생성 전)"""
+        return self.rollup_repo.exists() or not self.department_repo.exists()
+
+    def collect_department_ids(self, data_types: Iterable[str]) -> set:
+        """삭제 대상 데이터 종류에 해당하는 학과 ID 수집 (Import 전 호출)"""
+        department_ids = set()
+        for data_type in data_types:
+            if data_type == 'students':
+                department_ids.update(self.student_repo.get_department_ids())
+            elif data_type == 'publications':
+                department_ids.update(self.publication_repo.get_department_ids())
+            elif data_type == 'projects':
+                department_ids.update(self.project_repo.get_department_ids())
+        return department_ids
+
+    def _compute(self, department_ids: list) -> list:
+        """원본 테이블 그룹 집계 결과를 (학과, 연도) 단위로 병합"""
+        merged: Dict[Tuple[int, int], dict] = {}
+
+        def row_for(item: dict) -> dict:
+            key = (item['department_id'], int(item['year']))
+            return merged.setdefault(key, {})
+
+        for item in self.publication_repo.stats_by_department_and_year(department_ids):
+            row = row_for(item)
+            row['publication_count'] = item['publication_count']
+            row['avg_impact_factor'] = item['avg_impact_factor']
+
+        for item in self.student_repo.count_admitted_by_department_and_year(department_ids):
+            row_for(item)['students_admitted'] = item['students_admitted']
+
+        for item in self.project_repo.stats_by_department_and_year(department_ids):
+            row = row_for(item)
+            row['project_count'] = item['project_count']
+            row['total_funding'] = item['total_funding'] or 0
+
+        for item in self.expense_repo.sum_executed_by_department_and_year(department_ids):
+            row_for(item)['total_expenses'] = item['total_expenses'] or 0
+
+        return [
+            DepartmentYearRollup(department_id=department_id, year=year, **values)
+            for (department_id, year), values in sorted(merged.items())
+        ]
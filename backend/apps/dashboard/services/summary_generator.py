@@ -1,6 +1,10 @@
-from typing import List, Dict
+from typing import Callable, Iterable, List, Dict, Optional
+from django.conf import settings
+from django.db import connection
 from django.db.models import Count, Sum
 
+from apps.core.concurrency import run_concurrently
+
 from apps.dashboard.repositories import (
     StudentRepository,
     PublicationRepository,
@@ -8,8 +12,24 @@ from apps.dashboard.repositories import (
     ProjectExpenseRepository,
     ResearchProjectRepository,
     DepartmentRepository,
+    DepartmentYearRollupRepository,
 )
 from apps.dashboard.models import ProjectStatus
+from .cache import cached_by_data_version
+from .rollup import DepartmentYearRollupService
+
+
+# 요약 섹션 -> 섹션 결과가 의존하는 데이터 종류 (캐시 무효화 단위)
+SECTION_DATASETS = {
+    'performance_by_department': ('departments', 'students', 'publications', 'projects'),
+    'publications_by_year': ('publications',),
+    'students_by_status': ('students',),
+    'budget_execution': ('projects', 'expenses'),
+}
+SECTION_NAMES = tuple(SECTION_DATASETS)
+
+# 학과×연도 집계 테이블을 사용하는 섹션
+ROLLUP_SECTIONS = ('performance_by_department', 'publications_by_year')
 
 
 class DashboardSummaryService:
@@ -22,11 +42,23 @@ class DashboardSummaryService:
         self.expense_repo = ProjectExpenseRepository()
         self.project_repo = ResearchProjectRepository()
         self.department_repo = DepartmentRepository()
-
-    def generate_dashboard_summary(self) -> dict:
+        self.rollup_repo = DepartmentYearRollupRepository()
+        self.rollup_service = DepartmentYearRollupService()
+        # 학과×연도 집계 테이블 사용 여부 (generate_dashboard_summary에서 결정)
+        self.use_rollup = True
+
+    def generate_dashboard_summary(
+        self,
+        sections: Optional[Iterable[str]] = None,
+        concurrent: Optional[bool] = None,
+    ) -> dict:
         """
         대시보드 전체 데이터 생성
 
+        Args:
+            sections: 계산할 섹션 이름 목록 (기본값: 전체 섹션)
+            concurrent: 섹션별 동시 계산 여부 (기본값: DASHBOARD_SUMMARY_CONCURRENT 설정)
+
         Returns:
             {
                 'is_empty': bool,
@@ -35,33 +67,84 @@ class DashboardSummaryService:
                 'students_by_status': list,
                 'budget_execution': dict
             }
+            (sections 지정 시 요청한 섹션만 포함)
+
+        Raises:
+            ValueError: 알 수 없는 섹션 이름
         """
+        requested = list(dict.fromkeys(sections)) if sections else list(SECTION_NAMES)
+        unknown = [name for name in requested if name not in SECTION_DATASETS]
+        if unknown:
+            raise ValueError(f"알 수 없는 섹션: {', '.join(unknown)}")
+
         # 데이터 존재 여부 확인
         if self._is_data_empty():
             return {'is_empty': True}
 
+        # 추이/학과별 집계는 학과×연도 집계 테이블에서 조회한다. 집계 테이블은 조회 요청에서
+        # 만들지 않으며 (rebuild_department_year_rollup 명령), 아직 비어 있으면 원본 테이블을 집계한다.
+        if any(name in ROLLUP_SECTIONS for name in requested):
+            self.use_rollup = self.rollup_service.is_built()
+
+        if concurrent is None:
+            concurrent = getattr(settings, 'DASHBOARD_SUMMARY_CONCURRENT', False)
+
+        builders = {name: self._cached_section(name) for name in requested}
+        if concurrent and len(builders) > 1 and not connection.in_atomic_block:
+            # 각 섹션은 서로 독립적이므로 스레드별 DB 연결로 동시에 계산
+            # (트랜잭션 내부에서는 다른 연결이 미커밋 데이터를 볼 수 없으므로 순차 실행)
+            results = run_concurrently(
+                builders,
+                max_workers=getattr(settings, 'DASHBOARD_SUMMARY_MAX_WORKERS', 4),
+            )
+        else:
+            results = {name: builder() for name, builder in builders.items()}
+
+        return {'is_empty': False, **results}
+
+    def _get_section_builders(self) -> Dict[str, Callable[[], object]]:
+        """요약 섹션 이름 -> 계산 함수"""
         return {
-            'is_empty': False,
-            'performance_by_department': self._get_performance_by_department(),
-            'publications_by_year': self._get_publications_by_year(),
-            'students_by_status': self._get_students_by_status(),
-            'budget_execution': self._get_budget_execution(),
+            'performance_by_department': self._get_performance_by_department,
+            'publications_by_year': self._get_publications_by_year,
+            'students_by_status': self._get_students_by_status,
+            'budget_execution': self._get_budget_execution,
         }
 
+    def _cached_section(self, name: str) -> Callable[[], object]:
+        """섹션 계산 함수를 섹션별 캐시로 감싸기 (의존 데이터 변경 시에만 무효화)"""
+        builder = self._get_section_builders()[name]
+        return lambda: cached_by_data_version(
+            f'summary:{name}', None, builder, datasets=SECTION_DATASETS[name]
+        )
+
     def _is_data_empty(self) -> bool:
         """데이터베이스에 데이터가 있는지 확인"""
-        return self.student_repo.count() == 0 and self.publication_repo.count() == 0
+        return cached_by_data_version(
+            'summary:is_empty',
+            None,
+            lambda: not self.student_repo.exists() and not self.publication_repo.exists(),
+            datasets=('students', 'publications'),
+        )
 
     def _get_performance_by_department(self) -> List[dict]:
         """학과별 종합 실적 (막대 그래프용)"""
-        departments = self.department_repo.get_all()
+        departments = self.department_repo.get_all_with_college()
+        if self.use_rollup:
+            rollup_totals = self.rollup_repo.totals_by_department()
+        else:
+            rollup_totals = self._get_live_totals_by_department()
+        # 재학생 수는 입학년도가 없는 학생도 포함해야 하므로 집계 테이블(입학년도 기준)
+        # 대신 원본 테이블을 학과별 GROUP BY 한 번으로 조회
+        student_counts = self.student_repo.count_all_by_department()
         performance_data = []
 
         for dept in departments[:10]:  # 상위 10개 학과만
-            student_count = self.student_repo.count_by_department(dept.id)
-            publication_count = self.publication_repo.count_by_department(dept.id)
-            project_count = self.project_repo.count_by_department(dept.id)
-            total_funding = self.project_repo.get_total_funding_by_department(dept.id)
+            totals = rollup_totals.get(dept.id, {})
+            student_count = student_counts.get(dept.id, 0)
+            publication_count = totals.get('publication_count') or 0
+            project_count = totals.get('project_count') or 0
+            total_funding = totals.get('total_funding') or 0
 
             performance_data.append(
                 {
@@ -78,9 +161,21 @@ class DashboardSummaryService:
         performance_data.sort(key=lambda x: x['student_count'], reverse=True)
         return performance_data
 
+    def _get_live_totals_by_department(self) -> Dict[int, dict]:
+        """집계 테이블 생성 전 학과별 논문 수/과제 수/총 연구비 (원본 테이블 GROUP BY)"""
+        totals = {
+            dept_id: dict(values) for dept_id, values in self.project_repo.totals_by_department().items()
+        }
+        for dept_id, count in self.publication_repo.count_all_by_department().items():
+            totals.setdefault(dept_id, {})['publication_count'] = count
+        return totals
+
     def _get_publications_by_year(self) -> List[dict]:
         """연도별 논문 수 추이 (라인 차트용)"""
-        year_data = self.publication_repo.count_by_year()
+        if self.use_rollup:
+            year_data = self.rollup_repo.publications_by_year()
+        else:
+            year_data = [item for item in self.publication_repo.count_by_year() if item['year'] is not None]
 
         # 형식 변환
         return [{'year': int(item['year']), 'count': item['count']} for item in year_data]
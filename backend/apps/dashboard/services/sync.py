@@ -0,0 +1,226 @@
+import base64
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.deletion import Collector
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.core.pagination import CursorJSONEncoder
+from apps.dashboard.repositories import DeletedRecordRepository
+from apps.dashboard.models import (
+    College,
+    Department,
+    Student,
+    DepartmentKPI,
+    Publication,
+    ResearchProject,
+    ProjectExpense,
+)
+
+
+# 증분 동기화 대상 모델 (updated_at + 삭제 기록)
+SYNC_MODELS = (
+    College,
+    Department,
+    Student,
+    DepartmentKPI,
+    Publication,
+    ResearchProject,
+    ProjectExpense,
+)
+
+# Import 데이터 종류 -> 전체 삭제 후 다시 채워지는 모델
+IMPORT_SYNC_MODELS = {
+    'students': (Student,),
+    'kpis': (DepartmentKPI,),
+    'publications': (Publication,),
+    'projects': (ResearchProject, ProjectExpense),
+}
+
+
+class SyncCursor(NamedTuple):
+    """
+    증분 동기화 위치
+
+    updated_at, id: 마지막으로 받은 행의 (updated_at, id) 위치
+    synced_at: 클라이언트 데이터의 조회 시각 (여러 페이지로 나눠 받는 중이면 첫 페이지 시각)
+    """
+    updated_at: datetime
+    id: int
+    synced_at: datetime
+
+
+def encode_sync_cursor(cursor: SyncCursor) -> str:
+    """동기화 위치 -> URL 안전 문자열"""
+    raw = json.dumps(list(cursor), cls=CursorJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_sync_cursor(encoded: str) -> Optional[SyncCursor]:
+    """
+    since 커서 문자열 -> 동기화 위치
+
+    빈 문자열이면 None (처음부터 전체 동기화)
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    if not encoded:
+        return None
+    try:
+        padded = encoded + '=' * (-len(encoded) % 4)
+        updated_at, record_id, synced_at = json.loads(
+            base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+        )
+        updated_at = parse_datetime(updated_at)
+        synced_at = parse_datetime(synced_at)
+    except Exception:
+        raise ValueError('유효하지 않은 since 커서입니다.')
+    if updated_at is None or synced_at is None or not isinstance(record_id, int):
+        raise ValueError('유효하지 않은 since 커서입니다.')
+    return SyncCursor(updated_at, record_id, synced_at)
+
+
+@dataclass
+class DeltaPage:
+    """증분 동기화 한 페이지"""
+    rows: list
+    deleted_ids: List[int]
+    reset: bool
+    has_more: bool
+    cursor: SyncCursor
+
+
+class DeltaSyncService:
+    """목록 API 증분 동기화 (?since=) 및 삭제 기록 관리"""
+
+    def __init__(self):
+        self.deleted_repo = DeletedRecordRepository()
+
+    def get_changes(
+        self, queryset, since: Optional[SyncCursor], limit: int
+    ) -> DeltaPage:
+        """
+        since 이후 생성/수정된 행과 삭제된 행 ID 조회
+
+        행은 (updated_at, id) 순으로 최대 limit건 반환하고, 남은 행이 있으면
+        has_more=True와 함께 마지막 행 위치를 커서로 반환한다.
+        마지막 페이지의 커서는 DASHBOARD_SYNC_OVERLAP_SECONDS 만큼 앞당겨서
+        조회 시점에 커밋되지 않았던 변경도 다음 동기화에서 받도록 한다
+        (클라이언트는 id 기준 upsert/삭제이므로 중복 수신은 문제없음).
+
+        다음 경우에는 reset=True로 처음부터 다시 보낸다 (클라이언트는 로컬 데이터를 비움).
+            - since가 없는 경우 (최초 동기화)
+            - since 조회 시각 이후 Import로 테이블 전체가 교체된 경우
+            - since 조회 시각이 삭제 기록 보관 기간보다 오래된 경우
+
+        Args:
+            queryset: 대상 모델 QuerySet 또는 values() QuerySet (updated_at, id 포함)
+            since: 이전 동기화 커서 위치
+            limit: 최대 행 수
+        """
+        now = timezone.now()
+        table_name = queryset.model._meta.db_table
+        if since is not None and self._needs_reset(table_name, since.synced_at, now):
+            since = None
+
+        queryset = queryset.order_by('updated_at', 'id')
+        if since is not None:
+            queryset = queryset.filter(
+                Q(updated_at__gte=since.updated_at)
+                & (Q(updated_at__gt=since.updated_at) | Q(updated_at=since.updated_at, id__gt=since.id))
+            )
+
+        rows = list(queryset[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if rows:
+            last = self._get_position(rows[-1])
+        else:
+            last = (since.updated_at, since.id) if since is not None else None
+
+        if has_more:
+            synced_at = since.synced_at if since is not None else now
+            cursor = SyncCursor(*last, synced_at)
+        else:
+            overlap = timedelta(seconds=settings.DASHBOARD_SYNC_OVERLAP_SECONDS)
+            safe = (now - overlap, 0)
+            cursor = SyncCursor(*(min(last, safe) if last is not None else safe), now)
+
+        deleted_ids = []
+        if since is not None:
+            deleted_ids = self.deleted_repo.get_deleted_ids(
+                table_name, since.updated_at, until=cursor.updated_at if has_more else None
+            )
+
+        return DeltaPage(
+            rows=rows,
+            deleted_ids=deleted_ids,
+            reset=since is None,
+            has_more=has_more,
+            cursor=cursor,
+        )
+
+    def delete(self, queryset) -> int:
+        """
+        queryset.delete()와 같지만 CASCADE로 함께 삭제되는 행까지 포함하여
+        동기화 대상 모델의 삭제 기록을 같은 트랜잭션에 남긴다
+
+        Returns:
+            삭제된 전체 행 수
+        """
+        queryset = queryset.select_related(None).order_by()
+        collector = Collector(using=queryset.db, origin=queryset)
+        collector.collect(queryset)
+
+        deleted_ids = defaultdict(set)
+        for model, instances in collector.data.items():
+            if model in SYNC_MODELS:
+                deleted_ids[model].update(instance.pk for instance in instances)
+        for fast_query in collector.fast_deletes:
+            if fast_query.model in SYNC_MODELS:
+                deleted_ids[fast_query.model].update(fast_query.values_list('pk', flat=True))
+
+        with transaction.atomic(using=queryset.db):
+            count, _ = collector.delete()
+            for model, record_ids in deleted_ids.items():
+                self.deleted_repo.record_deletions(model._meta.db_table, sorted(record_ids))
+        return count
+
+    def record_resets(self, models: Iterable) -> None:
+        """
+        테이블 전체 교체 기록
+
+        기록 시각이 새 데이터의 커밋 시각보다 늦어야 그 사이에 동기화한 클라이언트도
+        다음 동기화에서 전체 재동기화하므로 Import 트랜잭션 커밋 후(on_commit) 호출한다.
+        """
+        self.deleted_repo.record_resets(
+            dict.fromkeys(model._meta.db_table for model in models)
+        )
+
+    def purge_expired(self) -> int:
+        """보관 기간(DASHBOARD_SYNC_TOMBSTONE_RETENTION_DAYS)이 지난 삭제 기록 정리"""
+        return self.deleted_repo.delete_before(self._retention_cutoff(timezone.now()))
+
+    def _needs_reset(self, table_name: str, synced_at: datetime, now: datetime) -> bool:
+        if synced_at < self._retention_cutoff(now):
+            return True
+        return self.deleted_repo.has_reset_after(table_name, synced_at)
+
+    @staticmethod
+    def _retention_cutoff(now: datetime) -> datetime:
+        return now - timedelta(days=settings.DASHBOARD_SYNC_TOMBSTONE_RETENTION_DAYS)
+
+    @staticmethod
+    def _get_position(row) -> tuple:
+        """행에서 (updated_at, id) 추출 (모델 인스턴스 또는 dict)"""
+        if isinstance(row, dict):
+            return row['updated_at'], row['id']
+        return row.updated_at, row.id
@@ -1,6 +1,12 @@
+from __future__ import annotations
+
 from typing import List
 from rest_framework.exceptions import ValidationError
-import pandas as pd
+
+from apps.core.lazy import LazyModule
+
+# pandas는 검증 시점에 import (URL 로딩/워커 부팅 시간 단축)
+pd = LazyModule('pandas')
 
 
 class DataSchemaValidator:
@@ -0,0 +1,162 @@
+import pytest
+from datetime import date
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from apps.dashboard.models import (
+    College, Department, Student, Publication, ResearchProject, ProjectExpense,
+)
+from apps.dashboard.services.aggregation import AggregationService
+from apps.dashboard.services.cache import bump_data_version
+
+
+URL = '/api/v1/dashboard/aggregate/'
+
+
+@pytest.fixture
+def sample_data(dashboard_tables):
+    """학과 2개에 학생/논문/집행내역 생성"""
+    cache.clear()
+    college = College.objects.create(name='공과대학')
+    cs = Department.objects.create(college=college, name='컴퓨터공학과')
+    ee = Department.objects.create(college=college, name='전자공학과')
+
+    for index, (department, status_value) in enumerate(
+        [(cs, '재학'), (cs, '재학'), (cs, '휴학'), (ee, '재학')]
+    ):
+        Student.objects.create(
+            student_id_number=f'S{index}', name=f'학생{index}', department=department,
+            program_level='학사', status=status_value,
+        )
+
+    Publication.objects.create(
+        publication_date=date(2023, 3, 1), department=cs, title='A', impact_factor='2.500',
+    )
+    Publication.objects.create(
+        publication_date=date(2024, 3, 1), department=cs, title='B', impact_factor='1.500',
+    )
+
+    project = ResearchProject.objects.create(project_number='R1', name='AI 과제', department=cs)
+    for index, (amount, status_value) in enumerate([(100, '집행완료'), (200, '집행완료'), (50, '처리중')]):
+        ProjectExpense.objects.create(
+            execution_id=f'E{index}', project=project, execution_date=date(2024, 1, 10),
+            item='장비', amount=amount, status=status_value,
+        )
+    return cs, ee
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAggregationService:
+    """범용 집계 서비스 테스트"""
+
+    def test_groups_by_multiple_columns_in_one_query(self, sample_data):
+        cs, ee = sample_data
+
+        with CaptureQueriesContext(connection) as queries:
+            result = AggregationService().aggregate('students', group_by=['department', 'status'])
+
+        assert len(queries) == 1
+        assert result['rows'] == [
+            {'department': cs.id, 'status': '재학', 'count': 2},
+            {'department': cs.id, 'status': '휴학', 'count': 1},
+            {'department': ee.id, 'status': '재학', 'count': 1},
+        ]
+        assert result['truncated'] is False
+
+    def test_metrics_and_filters(self, sample_data):
+        result = AggregationService().aggregate(
+            'expenses', group_by=['status'], metrics=['count', 'sum_amount'],
+            filters={'status': '집행완료'},
+        )
+
+        assert result['rows'] == [{'status': '집행완료', 'count': 2, 'sum_amount': 300}]
+
+    def test_decimal_metric_is_float(self, sample_data):
+        result = AggregationService().aggregate(
+            'publications', group_by=['year'], metrics=['avg_impact_factor'],
+        )
+
+        assert result['rows'] == [
+            {'year': 2023, 'avg_impact_factor': 2.5},
+            {'year': 2024, 'avg_impact_factor': 1.5},
+        ]
+
+    def test_without_group_by_returns_total(self, sample_data):
+        result = AggregationService().aggregate('students')
+
+        assert result['rows'] == [{'count': 4}]
+
+    def test_row_cap_truncates(self, sample_data, settings):
+        settings.DASHBOARD_AGGREGATE_MAX_ROWS = 2
+
+        result = AggregationService().aggregate('students', group_by=['department', 'status'])
+
+        assert len(result['rows']) == 2
+        assert result['truncated'] is True
+
+    def test_cached_until_dataset_version_changes(self, sample_data):
+        service = AggregationService()
+        service.aggregate('students', group_by=['status'])
+
+        with CaptureQueriesContext(connection) as queries:
+            service.aggregate('students', group_by=['status'])
+        assert len(queries) == 0
+
+        bump_data_version('publications')
+        with CaptureQueriesContext(connection) as queries:
+            service.aggregate('students', group_by=['status'])
+        assert len(queries) == 0
+
+        bump_data_version('students')
+        with CaptureQueriesContext(connection) as queries:
+            service.aggregate('students', group_by=['status'])
+        assert len(queries) == 1
+
+    @pytest.mark.parametrize('kwargs', [
+        {'dataset': 'users'},
+        {'dataset': 'students', 'group_by': ['email']},
+        {'dataset': 'students', 'metrics': ['sum_amount']},
+        {'dataset': 'students', 'filters': {'email': 'a@b.c'}},
+        {'dataset': 'students', 'filters': {'department': 'abc'}},
+        {'dataset': 'students', 'group_by': ['department', 'college', 'status', 'grade']},
+    ])
+    def test_rejects_values_outside_whitelist(self, sample_data, kwargs):
+        with pytest.raises(ValueError):
+            AggregationService().aggregate(**kwargs)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAggregateAPI:
+    """GET /aggregate/ 테스트"""
+
+    def test_returns_rows(self, bearer_client, sample_data):
+        cs, ee = sample_data
+
+        response = bearer_client.get(URL, {
+            'dataset': 'students', 'group_by': 'department', 'metric': 'count', 'status': '재학',
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['rows'] == [
+            {'department': cs.id, 'count': 2},
+            {'department': ee.id, 'count': 1},
+        ]
+
+    def test_unknown_dataset_returns_400(self, bearer_client, sample_data):
+        response = bearer_client.get(URL, {'dataset': 'users'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'students' in response.data['available_datasets']
+
+    def test_unknown_group_by_returns_400_with_whitelist(self, bearer_client, sample_data):
+        response = bearer_client.get(URL, {'dataset': 'students', 'group_by': 'name'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'status' in response.data['available_group_by']
+
+    def test_requires_authentication(self, client, sample_data):
+        response = client.get(URL, {'dataset': 'students'})
+
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
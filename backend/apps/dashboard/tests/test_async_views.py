@@ -0,0 +1,202 @@
+import json
+import logging
+import pytest
+from datetime import date
+from unittest.mock import patch
+from asgiref.sync import SyncToAsync, async_to_sync
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.test import AsyncClient
+from rest_framework import status
+
+from apps.dashboard.models import (
+    College, Department, Student, DepartmentKPI, Publication, ResearchProject, ProjectExpense,
+)
+
+
+SYNC_URL = '/api/v1/dashboard/'
+ASYNC_URL = '/api/v1/dashboard/async/'
+RESOURCES = ('colleges', 'departments', 'students', 'kpis', 'publications', 'projects', 'expenses')
+
+
+@pytest.fixture
+def sample_data(dashboard_tables):
+    cache.clear()
+    college = College.objects.create(name='공과대학')
+    department = Department.objects.create(college=college, name='컴퓨터공학과')
+    for index in range(3):
+        Student.objects.create(
+            student_id_number=f'S{index}', name=f'학생{index}', department=department,
+            program_level='학사', status='재학', admission_year=2022,
+        )
+        Publication.objects.create(
+            publication_id_str=f'P{index}', publication_date=date(2024, 1, index + 1),
+            department=department, title=f'논문{index}',
+        )
+    DepartmentKPI.objects.create(department=department, evaluation_year=2024)
+    project = ResearchProject.objects.create(
+        project_number='R1', name='AI 과제', department=department, total_funding_amount=1000,
+    )
+    ProjectExpense.objects.create(
+        execution_id='E1', project=project, execution_date=date(2024, 1, 10),
+        item='장비', amount=200, status='집행완료',
+    )
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def auth_header(bearer_client):
+    return bearer_client._credentials['HTTP_AUTHORIZATION']
+
+
+def _async_get(path, auth_header=None, data=None):
+    headers = {'Authorization': auth_header} if auth_header else {}
+    return async_to_sync(AsyncClient().get)(path, data or {}, headers=headers)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncReadViews:
+    """비동기 목록/상세 조회 API 테스트 (동기 API와 같은 응답)"""
+
+    @pytest.mark.parametrize('resource', RESOURCES)
+    def test_list_matches_sync_list(self, bearer_client, auth_header, sample_data, resource):
+        expected = bearer_client.get(f'{SYNC_URL}{resource}/')
+        response = _async_get(f'{ASYNC_URL}{resource}/', auth_header)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == json.loads(expected.content)
+
+    @pytest.mark.parametrize('resource', RESOURCES)
+    def test_retrieve_matches_sync_retrieve(self, bearer_client, auth_header, sample_data, resource):
+        item_id = bearer_client.get(f'{SYNC_URL}{resource}/').data['results'][0]['id']
+
+        expected = bearer_client.get(f'{SYNC_URL}{resource}/{item_id}/')
+        response = _async_get(f'{ASYNC_URL}{resource}/{item_id}/', auth_header)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == json.loads(expected.content)
+
+    def test_filters_fields_and_cursor_are_applied(self, auth_header, sample_data):
+        params = {'status': '재학', 'fields': 'id,name', 'page_size': 2}
+        first = _async_get(f'{ASYNC_URL}students/', auth_header, params).json()
+
+        assert len(first['results']) == 2
+        assert set(first['results'][0]) == {'id', 'name'}
+
+        second = _async_get(
+            f'{ASYNC_URL}students/', auth_header, {**params, 'cursor': first['next_cursor']}
+        ).json()
+        assert second['next'] is None
+        assert {row['name'] for row in first['results'] + second['results']} == {'학생0', '학생1', '학생2'}
+
+    def test_errors_use_drf_format(self, auth_header, sample_data):
+        assert _async_get(f'{ASYNC_URL}students/999999/', auth_header).status_code == status.HTTP_404_NOT_FOUND
+        assert _async_get(f'{ASYNC_URL}students/abc/', auth_header).status_code == status.HTTP_404_NOT_FOUND
+        assert _async_get(f'{ASYNC_URL}students/', auth_header, {'cursor': 'x'}).status_code == 404
+
+        response = _async_get(f'{ASYNC_URL}students/', auth_header, {'fields': 'unknown'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'fields' in response.json()
+
+    def test_requires_authentication(self, sample_data):
+        response = _async_get(f'{ASYNC_URL}students/')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert 'detail' in response.json()
+
+    def test_read_only(self, auth_header, sample_data):
+        response = async_to_sync(AsyncClient().post)(
+            f'{ASYNC_URL}colleges/', {'name': '새대학'}, headers={'Authorization': auth_header}
+        )
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_sync_fallback_for_delta_sync(self, bearer_client, auth_header, sample_data):
+        """?since= 증분 동기화는 ViewSet의 동기 action으로 처리한다"""
+        expected = bearer_client.get(f'{SYNC_URL}colleges/', {'since': ''})
+        response = _async_get(f'{ASYNC_URL}colleges/', auth_header, {'since': ''})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['changed'] == json.loads(expected.content)['changed']
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncDashboardSummaryView:
+    """비동기 대시보드 요약 API 테스트"""
+
+    def test_matches_sync_summary(self, bearer_client, auth_header, sample_data):
+        expected = bearer_client.get(f'{SYNC_URL}summary/')
+        response = _async_get(f'{ASYNC_URL}summary/', auth_header)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == json.loads(expected.content)
+        assert response.json()['is_empty'] is False
+
+    def test_unknown_section_returns_400(self, auth_header, sample_data):
+        response = _async_get(f'{ASYNC_URL}summary/', auth_header, {'sections': 'unknown'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'available_sections' in response.json()
+
+    @patch('apps.dashboard.views.DashboardSummaryService.generate_dashboard_summary')
+    def test_service_error_returns_500(self, mock_generate, auth_header, sample_data):
+        mock_generate.side_effect = RuntimeError('DB 오류')
+
+        response = _async_get(f'{ASYNC_URL}summary/', auth_header)
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+class TestAsgiMiddlewareChain:
+    """ASGI 미들웨어 체인 테스트"""
+
+    @staticmethod
+    def _adapted_middleware(caplog):
+        """ASGI 핸들러 로드 시 동기/비동기 변환이 필요한 미들웨어 로그"""
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger='django.request'):
+            ASGIHandler().load_middleware(is_async=True)
+        return [record.getMessage() for record in caplog.records if 'adapted for middleware' in record.getMessage()]
+
+    def test_no_middleware_is_adapted(self, settings, caplog):
+        """동기 전용 미들웨어가 없어 요청이 미들웨어 단계에서 스레드로 옮겨지지 않는다"""
+        settings.DEBUG = True
+        assert self._adapted_middleware(caplog) == []
+
+        settings.MIDDLEWARE = [
+            'whitenoise.middleware.WhiteNoiseMiddleware' if path.endswith('StaticFilesMiddleware') else path
+            for path in settings.MIDDLEWARE
+        ]
+        assert self._adapted_middleware(caplog) != []
+
+    @staticmethod
+    def _adapted_hooks() -> list:
+        """ASGI 핸들러에 sync_to_async로 감싸 등록된 process_view/template_response/exception hook"""
+        handler = ASGIHandler()
+        handler.load_middleware(is_async=True)
+        hooks = (
+            handler._view_middleware + handler._template_response_middleware + handler._exception_middleware
+        )
+        return [hook for hook in hooks if isinstance(hook, SyncToAsync)]
+
+    def test_view_hooks_are_not_adapted(self, settings):
+        """뷰 단계 hook이 코루틴으로 등록되어 요청마다 스레드로 옮겨지지 않는다"""
+        assert self._adapted_hooks() == []
+
+        settings.MIDDLEWARE = [
+            'django.middleware.csrf.CsrfViewMiddleware' if path.endswith('NonApiCsrfViewMiddleware') else path
+            for path in settings.MIDDLEWARE
+        ]
+        assert self._adapted_hooks() != []
+
+    @pytest.mark.django_db(transaction=True)
+    def test_view_timing_recorded_by_async_hooks(self, settings, auth_header, sample_data):
+        """비동기 hook으로도 뷰 시간이 Server-Timing에 기록된다"""
+        settings.REQUEST_TIMING_ENABLED = True
+        settings.REQUEST_TIMING_SAMPLE_RATE = 1.0
+
+        response = _async_get(f'{ASYNC_URL}colleges/', auth_header)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'view;dur=' in response['Server-Timing']
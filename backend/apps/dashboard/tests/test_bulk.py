@@ -0,0 +1,200 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from apps.dashboard.models import (
+    College, Department, Student, ResearchProject, ProjectExpense, DepartmentYearRollup,
+)
+
+
+@pytest.fixture
+def project(dashboard_tables):
+    college = College.objects.create(name='공과대학')
+    department = Department.objects.create(college=college, name='컴퓨터공학과')
+    return ResearchProject.objects.create(
+        project_number='R1', name='AI 과제', department=department, total_funding_amount=10000,
+    )
+
+
+def _expense_payload(project, count, start=0):
+    return [
+        {
+            'execution_id': f'E{index}', 'project': project.id,
+            'execution_date': '2024-01-15', 'item': '장비',
+            'amount': 100, 'status': '처리중',
+        }
+        for index in range(start, start + count)
+    ]
+
+
+def _expense_queries(context):
+    return [q['sql'] for q in context.captured_queries if '"project_expenses"' in q['sql']]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBulkCreate:
+    """POST /bulk/ 대량 생성"""
+
+    url = '/api/v1/dashboard/expenses/bulk/'
+
+    def test_creates_all_items_with_per_item_results(self, bearer_client, project):
+        response = bearer_client.post(self.url, _expense_payload(project, 3), format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['count'] == 3
+        assert [item['status'] for item in response.data['results']] == ['created'] * 3
+        ids = [item['id'] for item in response.data['results']]
+        assert set(ProjectExpense.objects.values_list('id', flat=True)) == set(ids)
+
+    def test_query_count_does_not_grow_with_items(self, bearer_client, project):
+        """관계 객체/고유값 검증과 INSERT가 항목 수와 무관한 쿼리 수로 수행된다"""
+        # 인증 프로필 캐시를 미리 채워 두 요청의 인증 쿼리 수를 같게 함
+        bearer_client.get('/api/v1/dashboard/expenses/')
+        with CaptureQueriesContext(connection) as small:
+            bearer_client.post(self.url, _expense_payload(project, 2), format='json')
+        with CaptureQueriesContext(connection) as large:
+            bearer_client.post(self.url, _expense_payload(project, 50, start=100), format='json')
+
+        assert ProjectExpense.objects.count() == 52
+        assert len(large.captured_queries) == len(small.captured_queries)
+        inserts = [sql for sql in _expense_queries(large) if sql.startswith('INSERT')]
+        assert len(inserts) == 1
+
+    def test_invalid_item_rejects_whole_batch(self, bearer_client, project):
+        """하나라도 잘못되면 아무것도 저장하지 않고 항목별 오류를 반환한다"""
+        payload = _expense_payload(project, 3)
+        payload[1]['amount'] = 'abc'
+        payload[2]['project'] = 999999
+
+        response = bearer_client.post(self.url, payload, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        errors = {item['index']: item['errors'] for item in response.data['results']}
+        assert set(errors) == {1, 2}
+        assert 'amount' in errors[1]
+        assert 'project' in errors[2]
+        assert ProjectExpense.objects.count() == 0
+
+    def test_unique_conflicts_are_reported_per_item(self, bearer_client, project):
+        """요청 내 중복과 기존 데이터 충돌을 항목별로 알려준다"""
+        bearer_client.post(self.url, _expense_payload(project, 1), format='json')
+        payload = _expense_payload(project, 1) + _expense_payload(project, 1, start=5) * 2
+
+        response = bearer_client.post(self.url, payload, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        errors = {item['index']: item['errors'] for item in response.data['results']}
+        assert set(errors) == {0, 2}
+        assert '이미 존재하는' in errors[0]['execution_id'][0]
+        assert '중복된' in errors[2]['execution_id'][0]
+
+    def test_rejects_empty_and_oversized_payload(self, bearer_client, project, settings):
+        settings.DASHBOARD_BULK_MAX_ITEMS = 2
+
+        assert bearer_client.post(self.url, [], format='json').status_code == 400
+        response = bearer_client.post(self.url, _expense_payload(project, 3), format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_rollup_is_refreshed(self, bearer_client, project):
+        """집계 대상 모델은 반영 후 학과×연도 집계를 갱신한다"""
+        payload = _expense_payload(project, 2)
+        for item in payload:
+            item['status'] = '집행완료'
+
+        bearer_client.post(self.url, payload, format='json')
+
+        rollup = DepartmentYearRollup.objects.get(department=project.department, year=2024)
+        assert rollup.total_expenses == 200
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBulkUpdate:
+    """PATCH /bulk/ 대량 부분 수정"""
+
+    url = '/api/v1/dashboard/expenses/bulk/'
+
+    def test_updates_status_in_one_statement(self, bearer_client, project):
+        bearer_client.post(self.url, _expense_payload(project, 20), format='json')
+        ids = list(ProjectExpense.objects.values_list('id', flat=True))
+
+        with CaptureQueriesContext(connection) as context:
+            response = bearer_client.patch(
+                self.url, [{'id': pk, 'status': '집행완료'} for pk in ids], format='json'
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 20
+        assert set(ProjectExpense.objects.values_list('status', flat=True)) == {'집행완료'}
+        updates = [sql for sql in _expense_queries(context) if sql.startswith('UPDATE')]
+        assert len(updates) == 1
+
+    def test_missing_id_rejects_whole_batch(self, bearer_client, project):
+        bearer_client.post(self.url, _expense_payload(project, 1), format='json')
+        existing = ProjectExpense.objects.get()
+
+        response = bearer_client.patch(
+            self.url,
+            [{'id': existing.id, 'status': '집행완료'}, {'id': 999999, 'status': '반려'}, {'status': '반려'}],
+            format='json',
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [item['index'] for item in response.data['results']] == [1, 2]
+        existing.refresh_from_db()
+        assert existing.status == '처리중'
+
+    def test_invalid_choice_is_reported(self, bearer_client, project):
+        bearer_client.post(self.url, _expense_payload(project, 1), format='json')
+        existing = ProjectExpense.objects.get()
+
+        response = bearer_client.patch(
+            self.url, [{'id': existing.id, 'status': '없는상태'}], format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'status' in response.data['results'][0]['errors']
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBulkDelete:
+    """DELETE /bulk/ 대량 삭제"""
+
+    url = '/api/v1/dashboard/expenses/bulk/'
+
+    def test_deletes_with_single_statement(self, bearer_client, project):
+        bearer_client.post(self.url, _expense_payload(project, 5), format='json')
+        ids = list(ProjectExpense.objects.values_list('id', flat=True))[:3]
+
+        with CaptureQueriesContext(connection) as context:
+            response = bearer_client.delete(self.url, {'ids': ids}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        assert ProjectExpense.objects.count() == 2
+        deletes = [sql for sql in _expense_queries(context) if sql.startswith('DELETE')]
+        assert len(deletes) == 1
+
+    def test_unknown_id_rejects_whole_batch(self, bearer_client, project):
+        bearer_client.post(self.url, _expense_payload(project, 2), format='json')
+        ids = list(ProjectExpense.objects.values_list('id', flat=True)) + [999999]
+
+        response = bearer_client.delete(self.url, {'ids': ids}, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['results'][0]['index'] == 2
+        assert ProjectExpense.objects.count() == 2
+
+    def test_restricted_delete_returns_400(self, bearer_client, project):
+        """다른 데이터가 참조하는 항목(RESTRICT)은 삭제하지 않는다"""
+        Student.objects.create(
+            student_id_number='S1', name='김철수', department=project.department,
+            program_level='학사', status='재학',
+        )
+
+        response = bearer_client.delete(
+            '/api/v1/dashboard/departments/bulk/', {'ids': [project.department_id]}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Department.objects.filter(pk=project.department_id).exists()
@@ -0,0 +1,127 @@
+import pytest
+from datetime import date
+from unittest.mock import patch
+from rest_framework import status
+
+from apps.dashboard.services.expense_timeseries import ExpenseBurnDownService
+from apps.dashboard.services.cache import (
+    bump_data_version,
+    cached_by_data_version,
+    get_data_version,
+)
+
+
+class TestDataVersionCache:
+    """데이터 버전 기반 캐시 테스트"""
+
+    def test_cached_result_reused_within_same_version(self):
+        """같은 데이터 버전에서는 결과를 재계산하지 않는다"""
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return {'value': len(calls)}
+
+        first = cached_by_data_version('test_reuse', {'a': 1}, builder)
+        second = cached_by_data_version('test_reuse', {'a': 1}, builder)
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_bump_data_version_invalidates_cache(self):
+        """데이터 버전이 바뀌면 결과를 다시 계산한다"""
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return len(calls)
+
+        cached_by_data_version('test_bump', None, builder)
+        version = get_data_version()
+        bump_data_version()
+        result = cached_by_data_version('test_bump', None, builder)
+
+        assert get_data_version() == version + 1
+        assert result == 2
+
+
+class TestExpenseBurnDownService:
+    """번다운 서비스 테스트"""
+
+    def test_requires_exactly_one_scope(self):
+        """과제/학과 중 하나만 지정해야 한다"""
+        service = ExpenseBurnDownService()
+
+        with pytest.raises(ValueError):
+            service.generate_burn_down()
+        with pytest.raises(ValueError):
+            service.generate_burn_down(project_id=1, department_id=2)
+
+    def test_remaining_budget_is_computed_from_cumulative(self):
+        """잔여 예산은 총 예산 - 누적 집행 금액"""
+        service = ExpenseBurnDownService()
+
+        with patch.object(
+            service.project_repo, 'get_total_funding_by_project', return_value=1000
+        ), patch.object(
+            service.expense_repo,
+            'monthly_burn_down',
+            return_value=[
+                {'month': date(2024, 1, 1), 'monthly_amount': 200, 'cumulative_amount': 200},
+                {'month': date(2024, 2, 1), 'monthly_amount': 300, 'cumulative_amount': 500},
+            ],
+        ):
+            result = service._build_burn_down(project_id=7, department_id=None)
+
+        assert result['scope'] == 'project'
+        assert result['total_budget'] == 1000
+        assert result['series'][0]['month'] == '2024-01'
+        assert result['series'][1]['remaining_budget'] == 500
+
+
+@pytest.mark.django_db
+class TestExpenseBurnDownView:
+    """번다운 API 테스트"""
+
+    url = '/api/v1/dashboard/burn-down/'
+
+    def test_requires_authentication(self, client):
+        """인증 없이 접근 시 401 응답"""
+        response = client.get(self.url, {'project_id': 1})
+        assert response.status_code in (
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        )
+
+    def test_missing_scope_returns_400(self, bearer_client):
+        """조회 조건이 없으면 400 응답"""
+        response = bearer_client.get(self.url)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_invalid_id_returns_400(self, bearer_client):
+        """정수가 아닌 ID는 400 응답"""
+        response = bearer_client.get(self.url, {'department_id': 'abc'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @patch.object(ExpenseBurnDownService, 'generate_burn_down')
+    def test_returns_series(self, mock_generate, bearer_client):
+        """번다운 시계열 정상 응답"""
+        mock_generate.return_value = {
+            'scope': 'department',
+            'scope_id': 3,
+            'total_budget': 1000,
+            'series': [
+                {
+                    'month': '2024-01',
+                    'monthly_amount': 200,
+                    'cumulative_amount': 200,
+                    'remaining_budget': 800,
+                }
+            ],
+        }
+
+        response = bearer_client.get(self.url, {'department_id': 3})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['series'][0]['remaining_budget'] == 800
+        mock_generate.assert_called_once_with(project_id=None, department_id=3)
@@ -0,0 +1,182 @@
+import jwt
+import time
+import pytest
+from asgiref.sync import async_to_sync
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connections, router
+from django.test import AsyncClient
+from rest_framework.test import APIClient
+from unittest.mock import patch
+
+from apps.core.concurrency import run_concurrently
+from apps.core.db_routing import (
+    CACHE_BUILD_PIN_KEY, PrimaryReplicaRouter, pin_to_primary, read_from_replica, use_primary,
+)
+from apps.dashboard.models import College
+from apps.dashboard.services.cache import bump_data_version, cached_by_data_version
+from apps.users.models import Profile, UserRole
+
+
+COLLEGES_URL = '/api/v1/dashboard/colleges/'
+
+
+@pytest.fixture
+def replica(settings, dashboard_tables):
+    """
+    기본 DB와 별도인 로컬 복제본 DB ('replica' 별칭)
+
+    복제는 하지 않으므로 기본 DB와 복제본에 서로 다른 데이터를 넣어 어느 DB에서 읽었는지 확인한다.
+    """
+    settings.DATABASE_READ_REPLICA = 'replica'
+    settings.DATABASE_REPLICA_PIN_SECONDS = 5
+    cache.clear()
+
+    models = list(apps.get_app_config('dashboard').get_models())
+    with connections['replica'].schema_editor() as editor:
+        for model in models:
+            editor.create_model(model)
+
+    College.objects.create(name='기본DB대학')
+    College.objects.using('replica').create(name='복제본대학')
+    yield
+    with connections['replica'].schema_editor() as editor:
+        for model in reversed(models):
+            editor.delete_model(model)
+    cache.clear()
+
+
+def _client_for(profile, secret):
+    token = jwt.encode(
+        {'sub': str(profile.id), 'email': profile.email, 'exp': int(time.time()) + 3600},
+        secret,
+        algorithm='HS256',
+    )
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return client
+
+
+def _college_names(client):
+    response = client.get(COLLEGES_URL)
+    assert response.status_code == 200
+    return sorted(item['name'] for item in response.data['results'])
+
+
+class TestPrimaryReplicaRouter:
+    """라우터 단위 테스트"""
+
+    def test_reads_default_to_primary(self):
+        assert router.db_for_read(College) == 'default'
+
+    def test_replica_context(self, settings):
+        settings.DATABASE_READ_REPLICA = 'replica'
+        with read_from_replica():
+            assert router.db_for_read(College) == 'replica'
+            assert router.db_for_write(College) == 'default'
+            with use_primary():
+                assert router.db_for_read(College) == 'default'
+
+    def test_replica_context_without_replica_uses_primary(self, settings):
+        settings.DATABASE_READ_REPLICA = ''
+        with read_from_replica():
+            assert router.db_for_read(College) == 'default'
+
+    def test_migrations_only_on_primary(self):
+        assert PrimaryReplicaRouter().allow_migrate('default', 'dashboard')
+        assert not PrimaryReplicaRouter().allow_migrate('replica', 'dashboard')
+
+    def test_context_propagates_to_worker_threads(self, settings):
+        settings.DATABASE_READ_REPLICA = 'replica'
+        with read_from_replica():
+            result = run_concurrently({'db': lambda: router.db_for_read(College)}, max_workers=1)
+
+        assert result == {'db': 'replica'}
+
+
+@pytest.mark.django_db(transaction=True, databases=['default', 'replica'])
+class TestReplicaReadRouting:
+    """두 로컬 DB로 조회/쓰기 라우팅 확인"""
+
+    def test_list_reads_from_replica(self, replica, bearer_client):
+        assert _college_names(bearer_client) == ['복제본대학']
+
+    def test_list_reads_primary_without_replica(self, replica, settings, bearer_client):
+        settings.DATABASE_READ_REPLICA = ''
+
+        assert _college_names(bearer_client) == ['기본DB대학']
+
+    def test_async_list_reads_from_replica_unless_pinned(self, replica, bearer_client, general_profile):
+        """비동기 조회 API도 복제본에서 읽고, 쓰기 후 고정된 사용자는 primary에서 읽는다"""
+        headers = {'Authorization': bearer_client._credentials['HTTP_AUTHORIZATION']}
+
+        def names():
+            response = async_to_sync(AsyncClient().get)('/api/v1/dashboard/async/colleges/', headers=headers)
+            assert response.status_code == 200
+            return sorted(item['name'] for item in response.json()['results'])
+
+        assert names() == ['복제본대학']
+        pin_to_primary(general_profile.id)
+        assert names() == ['기본DB대학']
+
+    def test_summary_service_reads_from_replica(self, replica, bearer_client):
+        used = []
+
+        def generate(service, sections=None):
+            used.append(router.db_for_read(College))
+            raise RuntimeError('중단')
+
+        with patch(
+            'apps.dashboard.views.DashboardSummaryService.generate_dashboard_summary',
+            autospec=True, side_effect=generate,
+        ):
+            bearer_client.get('/api/v1/dashboard/summary/')
+
+        assert used == ['replica']
+
+    def test_write_goes_to_primary_and_pins_writer(self, replica, bearer_client, general_profile, jwt_secret):
+        other = Profile.objects.create(role=UserRole.GENERAL, email='other@test.com')
+        other_client = _client_for(other, jwt_secret)
+
+        response = bearer_client.post(COLLEGES_URL, {'name': '신규대학'}, format='json')
+        assert response.status_code == 201
+        assert College.objects.using('default').filter(name='신규대학').exists()
+        assert not College.objects.using('replica').filter(name='신규대학').exists()
+
+        # 쓰기를 한 사용자만 고정 시간 동안 primary에서 읽고, 다른 사용자는 계속 복제본에서 읽음
+        assert _college_names(bearer_client) == ['기본DB대학', '신규대학']
+        assert _college_names(other_client) == ['복제본대학']
+
+    def test_cache_builds_use_primary_after_data_change(self, replica):
+        """데이터 변경 직후 새 버전으로 캐시할 결과만 primary에서 계산한다"""
+        def college_names():
+            return sorted(College.objects.values_list('name', flat=True))
+
+        with read_from_replica():
+            bump_data_version('departments')
+            assert cached_by_data_version('test', {'n': 1}, college_names) == ['기본DB대학']
+            assert college_names() == ['복제본대학']
+
+            cache.delete(CACHE_BUILD_PIN_KEY)
+            assert cached_by_data_version('test', {'n': 2}, college_names) == ['복제본대학']
+
+    def test_no_pin_when_window_disabled(self, replica, settings, bearer_client):
+        settings.DATABASE_REPLICA_PIN_SECONDS = 0
+
+        assert bearer_client.post(COLLEGES_URL, {'name': '신규대학'}, format='json').status_code == 201
+        assert _college_names(bearer_client) == ['복제본대학']
+
+    def test_excel_import_uses_primary(self, replica):
+        from apps.dashboard.services.excel_importer import ExcelImportService
+
+        used = []
+
+        def read_file(path):
+            used.append(router.db_for_read(College))
+            raise ValueError('파일 읽기 중단')
+
+        with patch.object(ExcelImportService, '_read_excel_file', side_effect=read_file):
+            with read_from_replica(), pytest.raises(ValueError):
+                ExcelImportService().import_from_excel('unused.xlsx')
+
+        assert used == ['default']
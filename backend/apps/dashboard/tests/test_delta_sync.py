@@ -0,0 +1,179 @@
+import pytest
+from datetime import date, datetime, timezone
+from rest_framework import status
+
+from apps.dashboard.models import (
+    College, Department, ResearchProject, ProjectExpense, DeletedRecord,
+)
+from apps.dashboard.services.sync import (
+    DeltaSyncService, SyncCursor, decode_sync_cursor, encode_sync_cursor,
+)
+
+
+EXPENSES_URL = '/api/v1/dashboard/expenses/'
+
+
+@pytest.fixture
+def project(dashboard_tables, settings):
+    # 커서를 앞당기지 않아야 변경분만 정확히 비교할 수 있음
+    settings.DASHBOARD_SYNC_OVERLAP_SECONDS = 0
+    college = College.objects.create(name='공과대학')
+    department = Department.objects.create(college=college, name='컴퓨터공학과')
+    return ResearchProject.objects.create(
+        project_number='R1', name='AI 과제', department=department,
+    )
+
+
+def _create_expenses(project, count, start=0):
+    return [
+        ProjectExpense.objects.create(
+            execution_id=f'E{index}', project=project, execution_date=date(2024, 1, 1),
+            item='장비', amount=100, status='처리중',
+        )
+        for index in range(start, start + count)
+    ]
+
+
+def _sync(client, since='', url=EXPENSES_URL, **params):
+    response = client.get(url, {'since': since, **params})
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return response.data
+
+
+class TestSyncCursor:
+    """since 커서 인코딩 테스트"""
+
+    def test_round_trip_keeps_microseconds(self):
+        """같은 밀리초 안의 행을 다시 보내거나 건너뛰지 않도록 마이크로초까지 유지한다"""
+        cursor = SyncCursor(
+            datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc), 7,
+            datetime(2024, 1, 2, 0, 0, 0, 654321, tzinfo=timezone.utc),
+        )
+
+        assert decode_sync_cursor(encode_sync_cursor(cursor)) == cursor
+
+    def test_empty_cursor_means_full_sync(self):
+        assert decode_sync_cursor('') is None
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDeltaSync:
+    """목록 API ?since= 증분 동기화 테스트"""
+
+    def test_initial_sync_returns_everything_with_reset(self, bearer_client, project):
+        expenses = _create_expenses(project, 3)
+
+        data = _sync(bearer_client)
+
+        assert data['reset'] is True
+        assert data['has_more'] is False
+        assert data['deleted'] == []
+        assert [item['id'] for item in data['changed']] == [expense.id for expense in expenses]
+        assert data['cursor']
+
+    def test_returns_only_changes_after_cursor(self, bearer_client, project):
+        """생성/수정/삭제된 행만 반환하고 변경이 없으면 빈 결과"""
+        first, second, third = _create_expenses(project, 3)
+        cursor = _sync(bearer_client)['cursor']
+
+        bearer_client.patch(f'{EXPENSES_URL}{second.id}/', {'status': '집행완료'}, format='json')
+        bearer_client.delete(f'{EXPENSES_URL}{third.id}/')
+        created = bearer_client.post(EXPENSES_URL, {
+            'execution_id': 'E9', 'project': project.id, 'execution_date': '2024-02-01',
+            'item': '재료', 'amount': 50, 'status': '처리중',
+        }, format='json').data
+
+        data = _sync(bearer_client, cursor)
+
+        assert data['reset'] is False
+        assert [item['id'] for item in data['changed']] == [second.id, created['id']]
+        assert data['changed'][0]['status'] == '집행완료'
+        assert data['deleted'] == [third.id]
+
+        assert _sync(bearer_client, data['cursor'])['changed'] == []
+
+    def test_pages_through_large_delta(self, bearer_client, project):
+        """page_size보다 변경이 많으면 has_more와 커서로 이어서 받는다"""
+        expenses = _create_expenses(project, 5)
+
+        received = []
+        data = _sync(bearer_client, page_size=2)
+        received += data['changed']
+        while data['has_more']:
+            assert len(data['changed']) == 2
+            data = _sync(bearer_client, data['cursor'], page_size=2)
+            assert data['reset'] is False
+            received += data['changed']
+
+        assert [item['id'] for item in received] == [expense.id for expense in expenses]
+
+    def test_overlap_resends_recent_changes(self, bearer_client, project, settings):
+        """커밋 지연 대비: 마지막 커서는 겹치는 구간만큼 앞당겨진다"""
+        settings.DASHBOARD_SYNC_OVERLAP_SECONDS = 300
+        _create_expenses(project, 2)
+
+        cursor = _sync(bearer_client)['cursor']
+
+        assert len(_sync(bearer_client, cursor)['changed']) == 2
+
+    def test_honors_fields(self, bearer_client, project):
+        _create_expenses(project, 1)
+
+        data = _sync(bearer_client, fields='id,amount')
+
+        assert data['changed'] == [{'id': data['changed'][0]['id'], 'amount': 100}]
+
+    def test_rejects_filters_and_invalid_cursor(self, bearer_client, project):
+        response = bearer_client.get(EXPENSES_URL, {'since': '', 'status': '처리중'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'status' in response.data['error']
+
+        response = bearer_client.get(EXPENSES_URL, {'since': 'not-a-cursor'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDeletionTracking:
+    """삭제 기록(tombstone) 테스트"""
+
+    def test_cascade_delete_records_child_rows(self, bearer_client, project):
+        """과제를 삭제하면 CASCADE로 삭제된 집행내역도 기록된다"""
+        expenses = _create_expenses(project, 2)
+        cursor = _sync(bearer_client)['cursor']
+
+        bearer_client.delete(f'/api/v1/dashboard/projects/{project.id}/')
+
+        data = _sync(bearer_client, cursor)
+        assert sorted(data['deleted']) == sorted(expense.id for expense in expenses)
+        assert DeletedRecord.objects.filter(table_name='research_projects', record_id=project.id).exists()
+
+    def test_bulk_write_is_tracked(self, bearer_client, project):
+        """대량 수정은 updated_at을 갱신하고 대량 삭제는 삭제 기록을 남긴다"""
+        first, second, third = _create_expenses(project, 3)
+        cursor = _sync(bearer_client)['cursor']
+
+        bearer_client.patch(f'{EXPENSES_URL}bulk/', [{'id': first.id, 'status': '반려'}], format='json')
+        bearer_client.delete(f'{EXPENSES_URL}bulk/', {'ids': [second.id, third.id]}, format='json')
+
+        data = _sync(bearer_client, cursor)
+        assert [item['id'] for item in data['changed']] == [first.id]
+        assert sorted(data['deleted']) == [second.id, third.id]
+
+    def test_table_reset_forces_full_resync(self, bearer_client, project):
+        """Import로 테이블이 교체되면 reset과 함께 처음부터 다시 보낸다"""
+        _create_expenses(project, 2)
+        cursor = _sync(bearer_client)['cursor']
+
+        DeltaSyncService().record_resets([ProjectExpense])
+
+        data = _sync(bearer_client, cursor)
+        assert data['reset'] is True
+        assert len(data['changed']) == 2
+
+    def test_expired_cursor_forces_full_resync(self, bearer_client, project, settings):
+        _create_expenses(project, 1)
+        cursor = _sync(bearer_client)['cursor']
+
+        settings.DASHBOARD_SYNC_TOMBSTONE_RETENTION_DAYS = -1
+
+        assert _sync(bearer_client, cursor)['reset'] is True
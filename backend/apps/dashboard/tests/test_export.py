@@ -0,0 +1,138 @@
+import csv
+import io
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from openpyxl import load_workbook
+from rest_framework import status
+
+from apps.dashboard.models import College, Department, ResearchProject, ProjectExpense
+from apps.dashboard.services.exporter import CSV_BOM, DatasetExporter
+
+
+@pytest.fixture
+def expenses(dashboard_tables):
+    college = College.objects.create(name='공과대학')
+    department = Department.objects.create(college=college, name='컴퓨터공학과')
+    project = ResearchProject.objects.create(
+        project_number='R1', name='AI 과제', department=department,
+    )
+    for index in range(5):
+        ProjectExpense.objects.create(
+            execution_id=f'E{index}', project=project,
+            execution_date=date(2024, 1, index + 1), item=f'항목,{index}',
+            amount=100 * (index + 1),
+            status='집행완료' if index % 2 == 0 else '처리중',
+        )
+    return project
+
+
+def _read_csv(response) -> list:
+    content = b''.join(response.streaming_content).decode('utf-8')
+    assert content.startswith(CSV_BOM)
+    return list(csv.reader(io.StringIO(content[len(CSV_BOM):])))
+
+
+@pytest.mark.django_db(transaction=True)
+class TestExportAction:
+    """/export/ 파일 내보내기 테스트"""
+
+    url = '/api/v1/dashboard/expenses/export/'
+
+    def test_csv_export_streams_all_rows(self, bearer_client, expenses):
+        """CSV는 스트리밍 응답으로 헤더와 전체 행을 내보낸다"""
+        response = bearer_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'].startswith('text/csv')
+        assert 'attachment; filename="expense_' in response['Content-Disposition']
+
+        rows = _read_csv(response)
+        assert rows[0][:3] == ['id', 'execution_id', 'project']
+        assert [row[1] for row in rows[1:]] == ['E4', 'E3', 'E2', 'E1', 'E0']
+        # 쉼표가 포함된 값도 올바르게 인용된다
+        assert rows[1][rows[0].index('item')] == '항목,4'
+
+    def test_csv_export_honors_list_filters_and_fields(self, bearer_client, expenses):
+        """목록 API와 같은 필터/fields/정렬이 적용된다"""
+        response = bearer_client.get(
+            self.url,
+            {'status': '집행완료', 'fields': 'execution_id,amount', 'ordering': 'execution_date'},
+        )
+
+        assert _read_csv(response) == [
+            ['execution_id', 'amount'],
+            ['E0', '100'],
+            ['E2', '300'],
+            ['E4', '500'],
+        ]
+
+    def test_csv_query_runs_lazily_while_streaming(self, bearer_client, expenses):
+        """데이터 조회는 응답 본문을 읽을 때 수행된다 (응답 시작 전 전체 조회 없음)"""
+        with CaptureQueriesContext(connection) as context:
+            response = bearer_client.get(self.url)
+        assert not [q for q in context.captured_queries if '"project_expenses"' in q['sql']]
+
+        with CaptureQueriesContext(connection) as context:
+            rows = _read_csv(response)
+        assert len(rows) == 6
+        assert [q for q in context.captured_queries if '"project_expenses"' in q['sql']]
+
+    def test_xlsx_export(self, bearer_client, expenses):
+        """XLSX는 한 시트에 헤더와 전체 행을 담는다"""
+        response = bearer_client.get(self.url, {'file_format': 'xlsx', 'fields': 'execution_id,amount'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'spreadsheetml' in response['Content-Type']
+        workbook = load_workbook(io.BytesIO(b''.join(response.streaming_content)), read_only=True)
+        rows = list(workbook.active.iter_rows(values_only=True))
+        assert rows[0] == ('execution_id', 'amount')
+        assert len(rows) == 6
+        assert rows[1] == ('E4', 500)
+
+    def test_unknown_format_returns_400(self, bearer_client, expenses):
+        response = bearer_client.get(self.url, {'file_format': 'pdf'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['available_formats'] == ['csv', 'xlsx']
+
+
+class TestDatasetExporter:
+    """CSV 변환 단위 테스트"""
+
+    def test_csv_chunks_and_null_values(self):
+        """None은 빈 칸으로 쓰고 여러 행을 묶어 전송한다"""
+        exporter = DatasetExporter(['id', 'notes'])
+        items = ({'id': index, 'notes': None} for index in range(1200))
+
+        chunks = list(exporter.iter_csv(items))
+
+        assert chunks[0] == CSV_BOM + 'id,notes\r\n'
+        assert len(chunks) == 1 + 3
+        assert chunks[1].startswith('0,\r\n1,\r\n')
+
+    def test_formula_cells_are_neutralized(self):
+        """=, +, -, @로 시작하는 문자열은 엑셀에서 수식으로 실행되지 않도록 ' 를 붙인다"""
+        exporter = DatasetExporter(['item', 'amount'])
+        items = [
+            {'item': '=HYPERLINK("http://evil")', 'amount': -100},
+            {'item': '@SUM(A1)', 'amount': 1},
+            {'item': '장비 = 100', 'amount': 2},
+        ]
+
+        rows = list(csv.reader(io.StringIO(''.join(exporter.iter_csv(items))[len(CSV_BOM):])))
+
+        assert rows[1] == ["'=HYPERLINK(\"http://evil\")", '-100']
+        assert rows[2][0] == "'@SUM(A1)"
+        assert rows[3][0] == '장비 = 100'
+
+    def test_xlsx_formula_cells_are_stored_as_text(self):
+        exporter = DatasetExporter(['item'])
+
+        output = exporter.write_xlsx([{'item': '+cmd|calc'}], sheet_title='test')
+
+        workbook = load_workbook(output, read_only=True)
+        rows = list(workbook.active.iter_rows(values_only=True))
+        assert rows[1] == ("'+cmd|calc",)
@@ -0,0 +1,164 @@
+import os
+import time
+import pytest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from apps.core.fast_serializers import ValuesSerializer
+from apps.dashboard.models import (
+    College, Department, Student, DepartmentKPI,
+    Publication, ResearchProject, ProjectExpense,
+)
+from apps.dashboard.serializers import StudentSerializer, ProjectExpenseSerializer
+from apps.dashboard.views import BaseDashboardViewSet
+
+
+RESOURCES = ['colleges', 'departments', 'students', 'kpis', 'publications', 'projects', 'expenses']
+
+
+@pytest.fixture
+def sample_data(dashboard_tables):
+    """모든 필드 종류(NULL 포함)가 나타나도록 리소스별 데이터 생성"""
+    college = College.objects.create(name='공과대학')
+    department = Department.objects.create(college=college, name='컴퓨터공학과')
+    Student.objects.create(
+        student_id_number='S1', name='김철수', department=department, grade=3,
+        program_level='학사', status='재학', gender='M', admission_year=2022,
+        email='s1@example.com',
+    )
+    Student.objects.create(
+        student_id_number='S2', name='이영희', department=department,
+        program_level='석사', status='휴학',
+    )
+    DepartmentKPI.objects.create(
+        department=department, evaluation_year=2024,
+        employment_rate=Decimal('81.50'), tech_transfer_income=Decimal('12.25'),
+    )
+    Publication.objects.create(
+        publication_id_str='P1', publication_date=date(2024, 3, 1), department=department,
+        title='논문', impact_factor=Decimal('3.125'), is_project_linked=True,
+    )
+    Publication.objects.create(
+        publication_date=date(2024, 4, 1), department=department, title='논문2',
+    )
+    project = ResearchProject.objects.create(
+        project_number='R1', name='AI 과제', department=department, total_funding_amount=1000,
+    )
+    ProjectExpense.objects.create(
+        execution_id='E1', project=project, execution_date=date(2024, 1, 10),
+        item='장비', amount=100, status='집행완료', notes='비고',
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFastListParity:
+    """고속 직렬화 경로와 ModelSerializer 경로의 응답 동일성"""
+
+    url = '/api/v1/dashboard/'
+
+    def _list(self, client, resource, fast, params=None):
+        with patch.object(BaseDashboardViewSet, 'fast_list_serialization', fast):
+            response = client.get(f'{self.url}{resource}/', params or {})
+        assert response.status_code == 200, response.data
+        return response.json()
+
+    @pytest.mark.parametrize('resource', RESOURCES)
+    def test_list_output_is_identical(self, bearer_client, sample_data, resource):
+        """모든 리소스에서 JSON 응답이 완전히 같다 (키 순서 포함)"""
+        slow = self._list(bearer_client, resource, fast=False)
+        fast = self._list(bearer_client, resource, fast=True)
+
+        assert slow['results']
+        assert fast == slow
+        assert [list(item) for item in fast['results']] == [list(item) for item in slow['results']]
+
+    def test_identical_with_sparse_fields_and_pagination(self, bearer_client, sample_data):
+        """fields/page_size와 함께 사용해도 응답과 커서가 같다"""
+        params = {'fields': 'id,name,college_name,created_at', 'page_size': 1}
+        slow = self._list(bearer_client, 'students', fast=False, params=params)
+        fast = self._list(bearer_client, 'students', fast=True, params=params)
+
+        assert fast == slow
+        assert fast['next'] is not None
+
+
+class TestValuesSerializer:
+    """values() 고속 직렬화기 단위 테스트"""
+
+    def test_compiles_nested_sources_to_values_paths(self):
+        """관계 source는 values() 경로(__)로 변환된다"""
+        values_serializer = ValuesSerializer.for_serializer(StudentSerializer())
+
+        assert 'department__college__name' in values_serializer.value_paths
+        assert 'department' in values_serializer.value_paths
+
+    def test_compiled_serializer_is_cached(self):
+        """같은 Serializer/필드 조합은 한 번만 컴파일된다"""
+        first = ValuesSerializer.for_serializer(StudentSerializer())
+        second = ValuesSerializer.for_serializer(StudentSerializer())
+        trimmed = ValuesSerializer.for_serializer(StudentSerializer(fields=['id']))
+
+        assert first is second
+        assert trimmed is not first
+        assert trimmed.value_paths == ['id']
+
+
+def _expense_rows(count):
+    """번호만 다른 집행내역 (모델 인스턴스, values() 행) 쌍 생성"""
+    department = Department(id=1, name='컴퓨터공학과')
+    project = ResearchProject(id=1, project_number='R1', name='AI 과제', department=department)
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    instances = []
+    rows = []
+    for index in range(count):
+        values = {
+            'id': index, 'execution_id': f'E{index}', 'project': 1,
+            'project__name': project.name, 'project__project_number': project.project_number,
+            'execution_date': date(2024, 1, 1), 'item': '장비', 'amount': 100 + index,
+            'status': '집행완료', 'notes': None, 'created_at': created_at, 'updated_at': created_at,
+        }
+        rows.append(values)
+        instances.append(ProjectExpense(
+            id=index, execution_id=values['execution_id'], project=project,
+            execution_date=values['execution_date'], item=values['item'],
+            amount=values['amount'], status=values['status'], notes=None,
+            created_at=created_at, updated_at=created_at,
+        ))
+    return instances, rows
+
+
+class TestFastListBenchmark:
+    """목록 직렬화 CPU 시간 비교 (DB 제외)"""
+
+    def test_fast_path_matches_serializer_output(self):
+        instances, rows = _expense_rows(50)
+
+        slow = ProjectExpenseSerializer(instances, many=True).data
+        fast = ValuesSerializer.for_serializer(ProjectExpenseSerializer()).to_representation(rows)
+
+        assert fast == [dict(item) for item in slow]
+
+    @pytest.mark.skipif(
+        not os.getenv('RUN_BENCHMARKS'), reason='RUN_BENCHMARKS=1 일 때만 실행'
+    )
+    def test_fast_path_speedup(self):
+        """BENCHMARK_ROWS(기본 100,000)건 직렬화 소요 시간 비교"""
+        count = int(os.getenv('BENCHMARK_ROWS', '100000'))
+        instances, rows = _expense_rows(count)
+        values_serializer = ValuesSerializer.for_serializer(ProjectExpenseSerializer())
+
+        started = time.perf_counter()
+        ProjectExpenseSerializer(instances, many=True).data
+        slow_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        values_serializer.to_representation(rows)
+        fast_elapsed = time.perf_counter() - started
+
+        print(
+            f"rows={count} serializer={slow_elapsed:.3f}s values={fast_elapsed:.3f}s "
+            f"speedup={slow_elapsed / fast_elapsed:.1f}x"
+        )
+        assert fast_elapsed * 3 < slow_elapsed
@@ -0,0 +1,95 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from apps.dashboard.models import College, Department, Student, Publication
+
+
+@pytest.fixture
+def sample_data(dashboard_tables):
+    college = College.objects.create(name='공과대학')
+    department = Department.objects.create(college=college, name='컴퓨터공학과')
+    for index in range(3):
+        Student.objects.create(
+            student_id_number=f'S{index}', name=f'학생{index}', department=department,
+            program_level='학사', status='재학',
+        )
+        Publication.objects.create(
+            publication_id_str=f'P{index}', publication_date=date(2024, 1, index + 1),
+            department=department, title='긴 제목 ' * 50, contributing_authors='저자, ' * 50,
+        )
+    return department
+
+
+def _table_queries(context, table):
+    return [query['sql'] for query in context.captured_queries if f'"{table}"' in query['sql']]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSparseFieldsets:
+    """?fields= 출력 필드 제한 테스트"""
+
+    url = '/api/v1/dashboard/'
+
+    def test_response_contains_only_requested_fields(self, bearer_client, sample_data):
+        """요청한 필드만 응답에 포함된다"""
+        response = bearer_client.get(f'{self.url}students/', {'fields': 'id,name,status'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 3
+        for item in response.data['results']:
+            assert set(item.keys()) == {'id', 'name', 'status'}
+
+    def test_query_loads_only_requested_columns(self, bearer_client, sample_data):
+        """요청하지 않은 긴 텍스트 컬럼과 JOIN은 조회하지 않는다"""
+        with CaptureQueriesContext(connection) as context:
+            response = bearer_client.get(
+                f'{self.url}publications/', {'fields': 'id,publication_date,journal_rank'}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        queries = _table_queries(context, 'publications')
+        assert len(queries) == 1
+        assert 'contributing_authors' not in queries[0]
+        assert '"title"' not in queries[0]
+        assert 'JOIN' not in queries[0]
+
+    def test_nested_source_field_uses_single_join(self, bearer_client, sample_data):
+        """관계 필드(college_name)는 필요한 JOIN만 추가하고 N+1 쿼리가 없다"""
+        with CaptureQueriesContext(connection) as context:
+            response = bearer_client.get(f'{self.url}students/', {'fields': 'id,college_name'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {item['college_name'] for item in response.data['results']} == {'공과대학'}
+        queries = _table_queries(context, 'students')
+        assert len(queries) == 1
+        assert '"colleges"' in queries[0]
+        assert '"advisor_name"' not in queries[0]
+
+    def test_retrieve_supports_fields(self, bearer_client, sample_data):
+        """단건 조회도 fields를 지원한다"""
+        student = Student.objects.first()
+        response = bearer_client.get(
+            f'{self.url}students/{student.id}/', {'fields': 'student_id_number'}
+        )
+
+        assert response.data == {'student_id_number': student.student_id_number}
+
+    def test_pagination_works_with_fields(self, bearer_client, sample_data):
+        """커서 정렬 필드를 요청하지 않아도 다음 페이지 커서가 생성된다"""
+        response = bearer_client.get(
+            f'{self.url}publications/', {'fields': 'id', 'page_size': 2}
+        )
+        next_page = bearer_client.get(response.data['next'])
+
+        ids = [item['id'] for item in response.data['results'] + next_page.data['results']]
+        assert len(set(ids)) == 3
+
+    def test_unknown_field_returns_400(self, bearer_client, sample_data):
+        """알 수 없는 필드는 400"""
+        response = bearer_client.get(f'{self.url}students/', {'fields': 'id,password'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'fields' in response.data
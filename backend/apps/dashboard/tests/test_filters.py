@@ -0,0 +1,225 @@
+import pytest
+from datetime import date
+from pathlib import Path
+from django.conf import settings
+from django.db import connection
+from rest_framework import status
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.dashboard.models import (
+    College, Department, Student, Publication, ResearchProject, ProjectExpense,
+)
+from apps.dashboard.views import ProjectExpenseViewSet, ResearchProjectViewSet, StudentViewSet
+
+
+MIGRATIONS_DIR = Path(settings.BASE_DIR).parent / 'supabase' / 'migrations'
+SEARCH_INDEX_MIGRATIONS = (
+    '20261019000400_list_filter_indexes.sql',
+    '20261019000800_search_trigram_indexes.sql',
+)
+
+
+@pytest.fixture
+def sample_data(dashboard_tables):
+    """학과 2개에 학생/논문/집행내역을 나눠 생성"""
+    college = College.objects.create(name='공과대학')
+    other_college = College.objects.create(name='자연과학대학')
+    cs = Department.objects.create(college=college, name='컴퓨터공학과')
+    math = Department.objects.create(college=other_college, name='수학과')
+
+    Student.objects.create(
+        student_id_number='S1', name='김철수', department=cs,
+        program_level='학사', status='재학', admission_year=2022,
+    )
+    Student.objects.create(
+        student_id_number='S2', name='이영희', department=cs,
+        program_level='석사', status='휴학', admission_year=2023,
+    )
+    Student.objects.create(
+        student_id_number='S3', name='박민수', department=math,
+        program_level='학사', status='재학', admission_year=2022,
+    )
+
+    Publication.objects.create(
+        publication_id_str='P1', publication_date=date(2023, 3, 1),
+        department=cs, title='Deep Learning Survey', journal_rank='SCIE',
+    )
+    Publication.objects.create(
+        publication_id_str='P2', publication_date=date(2024, 5, 1),
+        department=cs, title='Graph Theory Notes', journal_rank='KCI',
+    )
+    Publication.objects.create(
+        publication_id_str='P3', publication_date=date(2024, 7, 1),
+        department=math, title='Number Theory', journal_rank='SCIE',
+    )
+
+    project = ResearchProject.objects.create(
+        project_number='R1', name='AI 과제', department=cs, total_funding_amount=1000,
+    )
+    ProjectExpense.objects.create(
+        execution_id='E1', project=project, execution_date=date(2024, 1, 10),
+        item='장비', amount=100, status='집행완료',
+    )
+    ProjectExpense.objects.create(
+        execution_id='E2', project=project, execution_date=date(2024, 3, 10),
+        item='출장', amount=200, status='처리중',
+    )
+    return {'cs': cs, 'math': math, 'college': college}
+
+
+def _ids(response, key):
+    assert response.status_code == status.HTTP_200_OK, response.data
+    return sorted(item[key] for item in response.data['results'])
+
+
+@pytest.mark.django_db(transaction=True)
+class TestListFilters:
+    """목록 API 서버 필터 테스트"""
+
+    url = '/api/v1/dashboard/'
+
+    def test_students_filter_by_department_and_status(self, bearer_client, sample_data):
+        """학생은 학과/학적 상태로 필터링된다"""
+        response = bearer_client.get(
+            f'{self.url}students/', {'department': sample_data['cs'].id, 'status': '재학'}
+        )
+        assert _ids(response, 'student_id_number') == ['S1']
+
+    def test_students_filter_by_college_and_admission_year(self, bearer_client, sample_data):
+        """학생은 단과대학/입학년도로 필터링된다"""
+        response = bearer_client.get(
+            f'{self.url}students/', {'college': sample_data['college'].id, 'admission_year': 2022}
+        )
+        assert _ids(response, 'student_id_number') == ['S1']
+
+    def test_students_search_by_name(self, bearer_client, sample_data):
+        """학생 이름 부분 검색"""
+        response = bearer_client.get(f'{self.url}students/', {'search': '영희'})
+        assert _ids(response, 'student_id_number') == ['S2']
+
+    def test_publications_filter_by_date_range_and_rank(self, bearer_client, sample_data):
+        """논문은 게재일 범위/저널 등급으로 필터링된다"""
+        response = bearer_client.get(
+            f'{self.url}publications/',
+            {'date_from': '2024-01-01', 'date_to': '2024-12-31', 'journal_rank': 'SCIE'},
+        )
+        assert _ids(response, 'publication_id_str') == ['P3']
+
+    def test_publications_search_by_title(self, bearer_client, sample_data):
+        """논문 제목 부분 검색 (대소문자 무시)"""
+        response = bearer_client.get(f'{self.url}publications/', {'search': 'theory'})
+        assert _ids(response, 'publication_id_str') == ['P2', 'P3']
+
+    def test_expenses_filter_by_status_and_date(self, bearer_client, sample_data):
+        """집행내역은 상태/집행일 범위로 필터링된다"""
+        response = bearer_client.get(
+            f'{self.url}expenses/', {'status': '집행완료', 'date_to': '2024-02-01'}
+        )
+        assert _ids(response, 'execution_id') == ['E1']
+
+    def test_invalid_filter_value_returns_400(self, bearer_client, sample_data):
+        """변환할 수 없는 필터 값은 400"""
+        response = bearer_client.get(f'{self.url}publications/', {'date_from': '2024-13-01'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'date_from' in response.data
+
+    def test_ordering_whitelist(self, bearer_client, sample_data):
+        """허용된 필드만 정렬할 수 있다"""
+        response = bearer_client.get(f'{self.url}students/', {'ordering': 'student_id_number'})
+        assert [item['student_id_number'] for item in response.data['results']] == ['S1', 'S2', 'S3']
+
+        response = bearer_client.get(f'{self.url}students/', {'ordering': 'email'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'ordering' in response.data
+
+    def test_ordering_is_kept_across_pages(self, bearer_client, sample_data):
+        """정렬 조건은 다음 페이지 커서에도 유지된다"""
+        response = bearer_client.get(
+            f'{self.url}students/', {'ordering': '-student_id_number', 'page_size': 2}
+        )
+        first_page = [item['student_id_number'] for item in response.data['results']]
+        response = bearer_client.get(response.data['next'])
+        second_page = [item['student_id_number'] for item in response.data['results']]
+
+        assert first_page + second_page == ['S3', 'S2', 'S1']
+        assert response.data['next'] is None
+
+
+def _explain(queryset) -> str:
+    """인덱스 사용이 드러나도록 실행 계획 조회 (PostgreSQL은 순차 스캔 비활성화)"""
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+    return queryset.explain()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFilterIndexUsage:
+    """필터 + 커서 정렬 쿼리가 복합 인덱스를 사용하는지 확인"""
+
+    def test_student_department_filter_uses_index(self, dashboard_tables):
+        plan = _explain(
+            Student.objects.filter(department_id=1).order_by('-created_at', '-id')[:101]
+        )
+        assert 'idx_students_dept_created' in plan
+
+    def test_publication_department_date_range_uses_index(self, dashboard_tables):
+        plan = _explain(
+            Publication.objects.filter(
+                department_id=1, publication_date__gte=date(2024, 1, 1)
+            ).order_by('-publication_date', '-id')[:101]
+        )
+        assert 'idx_pubs_dept_date' in plan
+
+    def test_expense_status_date_range_uses_index(self, dashboard_tables):
+        plan = _explain(
+            ProjectExpense.objects.filter(
+                status='처리중', execution_date__gte=date(2024, 1, 1)
+            ).order_by('-execution_date', '-id')[:101]
+        )
+        assert 'idx_expenses_status_date' in plan
+
+
+def _search_queryset(viewset_class, term: str):
+    """목록 API와 같은 SearchFilter 조건 (search_fields 컬럼 icontains OR) 적용"""
+    request = Request(APIRequestFactory().get('/', {'search': term}))
+    view = viewset_class()
+    return SearchFilter().filter_queryset(request, view.queryset.all(), view)
+
+
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason='트라이그램 인덱스는 PostgreSQL 전용')
+@pytest.mark.django_db(transaction=True)
+class TestSearchIndexUsage:
+    """?search= OR 조건의 모든 컬럼이 트라이그램 인덱스를 사용하는지 확인 (순차 스캔 없음)"""
+
+    @pytest.fixture(autouse=True)
+    def search_indexes(self, dashboard_tables):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+            if cursor.fetchone() is None:
+                pytest.skip('pg_trgm 확장이 설치되지 않은 PostgreSQL')
+            for name in SEARCH_INDEX_MIGRATIONS:
+                cursor.execute((MIGRATIONS_DIR / name).read_text(encoding='utf-8'))
+
+    def test_student_name_or_id_number_search(self):
+        plan = _explain(_search_queryset(StudentViewSet, '2024'))
+
+        assert 'idx_students_name_trgm' in plan
+        assert 'idx_students_id_number_trgm' in plan
+        assert 'Seq Scan on students' not in plan
+
+    def test_project_name_or_number_search(self):
+        plan = _explain(_search_queryset(ResearchProjectViewSet, 'R-2024'))
+
+        assert 'idx_research_projects_name_trgm' in plan
+        assert 'idx_research_projects_number_trgm' in plan
+        assert 'Seq Scan on research_projects' not in plan
+
+    def test_expense_item_search(self):
+        plan = _explain(_search_queryset(ProjectExpenseViewSet, '연구장비'))
+
+        assert 'idx_project_expenses_item_trgm' in plan
+        assert 'Seq Scan on project_expenses' not in plan
@@ -0,0 +1,75 @@
+"""
+워커 부팅 import 시간 예산 테스트
+
+gunicorn 워커가 부팅하며 수행하는 django.setup() + URLConf 로딩을 `python -X importtime`으로
+별도 프로세스에서 측정한다. 무거운 모듈(pandas, supabase 등)이 부팅 경로에 다시 들어오거나
+전체 import 시간이 예산(IMPORT_TIME_BUDGET_MS, 기본 800ms)을 넘으면 실패한다.
+"""
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+
+
+BOOT_SCRIPT = (
+    'import django; django.setup(); '
+    'from django.urls import get_resolver; get_resolver().url_patterns'
+)
+
+# 첫 사용 시점까지 import를 미루는 모듈 (엑셀 업로드/로그인에서만 사용)
+DEFERRED_MODULES = ('pandas', 'numpy', 'openpyxl', 'supabase')
+
+DEFAULT_BUDGET_MS = 800
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$')
+
+
+def _boot_imports():
+    """부팅 스크립트의 importtime 결과 -> {모듈: (누적 µs, 중첩 깊이)}"""
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'dashboard_project.settings')}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            imports[match.group(4)] = (int(match.group(2)), len(match.group(3)) // 2)
+    return imports
+
+
+@pytest.fixture(scope='module')
+def boot_imports():
+    return _boot_imports()
+
+
+def test_heavy_modules_are_not_imported_at_boot(boot_imports):
+    loaded = [name for name in DEFERRED_MODULES if name in boot_imports]
+
+    assert loaded == [], f'부팅 시 import 된 지연 대상 모듈: {loaded}'
+
+
+def test_boot_import_time_within_budget(boot_imports):
+    budget_ms = int(os.environ.get('IMPORT_TIME_BUDGET_MS', DEFAULT_BUDGET_MS))
+    total_ms = sum(cumulative for cumulative, depth in boot_imports.values() if depth == 0) / 1000
+
+    assert total_ms <= budget_ms, f'부팅 import 시간 {total_ms:.0f}ms > 예산 {budget_ms}ms'
+
+
+def test_lazy_module_loads_on_first_use():
+    from apps.core.lazy import LazyModule
+
+    json_module = LazyModule('json')
+    assert 'not loaded' in repr(json_module)
+    assert json_module.dumps({'a': 1}) == '{"a": 1}'
+    assert 'not loaded' not in repr(json_module)
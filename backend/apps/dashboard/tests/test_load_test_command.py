@@ -0,0 +1,38 @@
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+
+from apps.core.management.commands.load_test import percentile
+
+
+def test_percentile_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.99) == 0.0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_test_against_live_server(live_server, settings, jwt_secret, tmp_path):
+    """local 인증 제공자로 로그인 후 실제 서버에 부하를 보내고 결과를 비교표로 출력"""
+    settings.AUTH_PROVIDER = 'local'
+    call_command('create_local_auth_user', 'perf@test.com', password='perf-pass-1', stdout=StringIO())
+    output = tmp_path / 'load.jsonl'
+
+    for label in ('baseline', 'tuned'):
+        call_command(
+            'load_test', live_server.url,
+            path=['/api/v1/auth/profile/'], requests=20, concurrency=4, warmup=2,
+            email='perf@test.com', password='perf-pass-1',
+            label=label, output=str(output), stdout=StringIO(),
+        )
+
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [result['label'] for result in results] == ['baseline', 'tuned']
+    assert all(result['errors'] == 0 and result['throughput_rps'] > 0 for result in results)
+
+    out = StringIO()
+    call_command('load_test', compare=str(output), stdout=out)
+    assert 'tuned' in out.getvalue() and 'req/s' in out.getvalue()
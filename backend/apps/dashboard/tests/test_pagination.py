@@ -0,0 +1,158 @@
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.core.pagination import KeysetPagination
+from apps.dashboard.views import (
+    BaseDashboardViewSet, CollegeViewSet, PublicationViewSet, ProjectExpenseViewSet,
+)
+from apps.users.models import Profile
+
+
+class _ProfileView:
+    keyset_ordering = ('-created_at', '-id')
+
+
+def _request(params=None):
+    factory = APIRequestFactory()
+    return Request(factory.get('/api/dashboard/items/', params or {}))
+
+
+@pytest.fixture
+def profiles():
+    """생성 시각이 일부 겹치는 프로필 7건 (동일 created_at은 id로 구분)"""
+    base = timezone.now()
+    created = []
+    for index in range(7):
+        profile = Profile.objects.create(email=f"user{index}@example.com")
+        # 2건씩 같은 생성 시각
+        Profile.objects.filter(pk=profile.pk).update(
+            created_at=base - timedelta(minutes=index // 2)
+        )
+        created.append(profile.pk)
+    return created
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """키셋 페이지네이션 테스트"""
+
+    def _collect(self, page_size):
+        """next 커서를 따라 전체 페이지 수집"""
+        pages = []
+        params = {'page_size': page_size}
+        while True:
+            paginator = KeysetPagination()
+            rows = paginator.paginate_queryset(Profile.objects.all(), _request(params), _ProfileView())
+            pages.append([row.pk for row in rows])
+            if not paginator.has_next:
+                return pages
+            params = {'page_size': page_size, 'cursor': paginator.encode_cursor(paginator.next_position)}
+
+    def test_pages_cover_all_rows_in_order_without_duplicates(self, profiles):
+        """동일 정렬 값이 있어도 누락/중복 없이 정렬 순서대로 조회된다"""
+        pages = self._collect(page_size=2)
+        flattened = [pk for page in pages for pk in page]
+
+        expected = list(
+            Profile.objects.order_by('-created_at', '-id').values_list('pk', flat=True)
+        )
+        assert flattened == expected
+        assert [len(page) for page in pages] == [2, 2, 2, 1]
+
+    def test_sub_millisecond_timestamps_are_not_skipped(self):
+        """같은 밀리초 안에 생성된 행(bulk_create 등)도 커서 페이지에서 누락되지 않는다"""
+        base = timezone.now().replace(microsecond=500000)
+        for index in range(4):
+            profile = Profile.objects.create(email=f"bulk{index}@example.com")
+            Profile.objects.filter(pk=profile.pk).update(
+                created_at=base + timedelta(microseconds=100 * index)
+            )
+
+        pages = self._collect(page_size=1)
+
+        assert [len(page) for page in pages] == [1, 1, 1, 1]
+        assert len({pk for page in pages for pk in page}) == 4
+
+    def test_queries_use_no_offset_or_count(self, profiles):
+        """다음 페이지 조회는 OFFSET/COUNT 없이 커서 조건으로 수행된다"""
+        first = KeysetPagination()
+        first.paginate_queryset(Profile.objects.all(), _request({'page_size': 3}), _ProfileView())
+        cursor = first.encode_cursor(first.next_position)
+
+        paginator = KeysetPagination()
+        with CaptureQueriesContext(connection) as context:
+            paginator.paginate_queryset(
+                Profile.objects.all(), _request({'page_size': 3, 'cursor': cursor}), _ProfileView()
+            )
+
+        assert len(context.captured_queries) == 1
+        sql = context.captured_queries[0]['sql'].upper()
+        assert 'OFFSET' not in sql
+        assert 'COUNT(' not in sql
+        assert 'LIMIT 4' in sql
+
+    def test_paginated_response_contains_next_link(self, profiles):
+        """응답에 다음 페이지 링크와 결과 목록이 포함된다"""
+        paginator = KeysetPagination()
+        paginator.paginate_queryset(Profile.objects.all(), _request({'page_size': 5}), _ProfileView())
+        response = paginator.get_paginated_response(['a'])
+
+        assert list(response.data.keys()) == ['next', 'next_cursor', 'results']
+        assert f"cursor={response.data['next_cursor']}" in response.data['next']
+        assert 'page_size=5' in response.data['next']
+
+    def test_next_link_is_relative(self, profiles):
+        """프록시 뒤 http/https 혼용을 피하기 위해 next에 scheme/host를 넣지 않는다"""
+        paginator = KeysetPagination()
+        request = _request({'page_size': 5})
+        paginator.paginate_queryset(Profile.objects.all(), request, _ProfileView())
+
+        assert paginator.get_next_link().startswith('/api/dashboard/items/?')
+
+    def test_last_page_has_no_next_link(self, profiles):
+        """마지막 페이지에는 next가 없다"""
+        paginator = KeysetPagination()
+        paginator.paginate_queryset(Profile.objects.all(), _request({'page_size': 100}), _ProfileView())
+
+        assert paginator.get_next_link() is None
+        assert paginator.get_next_cursor() is None
+
+    def test_invalid_cursor_raises_not_found(self):
+        """잘못된 커서는 404로 처리된다"""
+        paginator = KeysetPagination()
+
+        with pytest.raises(NotFound):
+            paginator.paginate_queryset(
+                Profile.objects.all(), _request({'cursor': 'not-a-cursor'}), _ProfileView()
+            )
+
+    def test_page_size_is_clamped(self):
+        """페이지 크기는 1 ~ max_page_size 범위로 제한된다"""
+        paginator = KeysetPagination()
+
+        assert paginator.get_page_size(_request({'page_size': '100000'})) == paginator.max_page_size
+        assert paginator.get_page_size(_request({'page_size': '0'})) == 1
+        assert paginator.get_page_size(_request({'page_size': 'abc'})) == paginator.page_size
+
+
+class TestDashboardViewSetOrdering:
+    """CRUD ViewSet 정렬 설정 테스트"""
+
+    @pytest.mark.parametrize('viewset', BaseDashboardViewSet.__subclasses__())
+    def test_queryset_ordering_matches_keyset_ordering(self, viewset):
+        """쿼리셋 기본 정렬과 커서 정렬이 일치하고 id로 끝난다"""
+        assert viewset.pagination_class is KeysetPagination
+        assert tuple(viewset.queryset.query.order_by) == tuple(viewset.keyset_ordering)
+        assert viewset.keyset_ordering[-1] == '-id'
+
+    def test_date_ordered_viewsets(self):
+        """논문/집행내역은 날짜 기준 커서를 사용한다"""
+        assert PublicationViewSet.keyset_ordering == ('-publication_date', '-id')
+        assert ProjectExpenseViewSet.keyset_ordering == ('-execution_date', '-id')
+        assert CollegeViewSet.keyset_ordering == ('-created_at', '-id')
@@ -0,0 +1,148 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from apps.dashboard.models import College, Department, ResearchProject, ProjectExpense
+
+
+PROJECTS_URL = '/api/v1/dashboard/projects/'
+
+
+@pytest.fixture
+def projects(dashboard_tables):
+    """집행내역이 있는 과제 2개와 연구비가 없는 과제 1개"""
+    college = College.objects.create(name='공과대학')
+    department = Department.objects.create(college=college, name='컴퓨터공학과')
+    funded = ResearchProject.objects.create(
+        project_number='R1', name='AI 과제', department=department, total_funding_amount=1000,
+    )
+    other = ResearchProject.objects.create(
+        project_number='R2', name='반도체 과제', department=department, total_funding_amount=300,
+    )
+    unfunded = ResearchProject.objects.create(
+        project_number='R3', name='연구비 미정 과제', department=department,
+    )
+
+    rows = [
+        (funded, 200, '집행완료', date(2024, 1, 10)),
+        (funded, 133, '집행완료', date(2024, 2, 10)),
+        (funded, 50, '처리중', date(2024, 3, 10)),
+        (funded, 70, '반려', date(2024, 4, 10)),
+        (other, 300, '처리중', date(2024, 1, 5)),
+    ]
+    for index, (project, amount, status_value, execution_date) in enumerate(rows):
+        ProjectExpense.objects.create(
+            execution_id=f'E{index}', project=project, execution_date=execution_date,
+            item='장비', amount=amount, status=status_value,
+        )
+    return funded, other, unfunded
+
+
+@pytest.mark.django_db(transaction=True)
+class TestProjectExpenseTotals:
+    """과제 목록/상세 집행 금액 주석 테스트"""
+
+    def test_list_includes_totals(self, bearer_client, projects):
+        funded, other, unfunded = projects
+
+        response = bearer_client.get(PROJECTS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        totals = {
+            item['id']: (
+                item['executed_amount'], item['pending_amount'],
+                item['remaining_amount'], item['execution_rate'],
+            )
+            for item in response.data['results']
+        }
+        assert totals == {
+            funded.id: (333, 50, 667, 33.3),
+            other.id: (0, 300, 300, 0.0),
+            unfunded.id: (0, 0, 0, 0.0),
+        }
+
+    def test_totals_computed_in_list_query(self, bearer_client, projects):
+        """과제 수와 관계없이 목록 쿼리 하나로 계산한다 (과제별 합계 조회 없음)"""
+        for index in range(5):
+            ResearchProject.objects.create(
+                project_number=f'X{index}', name='과제', department=projects[0].department,
+                total_funding_amount=100,
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = bearer_client.get(PROJECTS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        expense_queries = [q['sql'] for q in queries if 'project_expenses' in q['sql']]
+        assert len(expense_queries) == 1
+
+    def test_detail_and_fields(self, bearer_client, projects):
+        funded = projects[0]
+
+        detail = bearer_client.get(f'{PROJECTS_URL}{funded.id}/').data
+        assert detail['remaining_amount'] == 667
+
+        response = bearer_client.get(PROJECTS_URL, {'fields': 'id,execution_rate'})
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data['results'][0]) == {'id', 'execution_rate'}
+
+    def test_write_still_works(self, bearer_client, projects):
+        funded = projects[0]
+
+        response = bearer_client.patch(
+            f'{PROJECTS_URL}{funded.id}/', {'total_funding_amount': 2000}, format='json',
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert bearer_client.get(f'{PROJECTS_URL}{funded.id}/').data['remaining_amount'] == 1667
+
+
+@pytest.mark.django_db(transaction=True)
+class TestProjectExpensesEndpoint:
+    """GET /projects/{id}/expenses/ 테스트"""
+
+    def test_returns_only_project_expenses_in_date_order(self, bearer_client, projects):
+        funded = projects[0]
+
+        response = bearer_client.get(f'{PROJECTS_URL}{funded.id}/expenses/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item['execution_date'] for item in response.data['results']] == [
+            '2024-04-10', '2024-03-10', '2024-02-10', '2024-01-10',
+        ]
+        assert response.data['results'][0]['project_number'] == 'R1'
+
+    def test_keyset_pages(self, bearer_client, projects):
+        funded = projects[0]
+        url = f'{PROJECTS_URL}{funded.id}/expenses/'
+
+        received = []
+        data = bearer_client.get(url, {'page_size': 3}).data
+        received += data['results']
+        assert data['next']
+        data = bearer_client.get(data['next']).data
+        received += data['results']
+
+        assert data['next'] is None
+        assert len({item['id'] for item in received}) == 4
+
+    def test_filters(self, bearer_client, projects):
+        funded = projects[0]
+
+        response = bearer_client.get(
+            f'{PROJECTS_URL}{funded.id}/expenses/', {'status': '집행완료', 'date_from': '2024-02-01'},
+        )
+
+        assert [item['amount'] for item in response.data['results']] == [133]
+
+    def test_invalid_filter_returns_400(self, bearer_client, projects):
+        response = bearer_client.get(f'{PROJECTS_URL}{projects[0].id}/expenses/', {'date_from': 'x'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unknown_project_returns_404(self, bearer_client, projects):
+        response = bearer_client.get(f'{PROJECTS_URL}999999/expenses/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
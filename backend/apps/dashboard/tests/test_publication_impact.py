@@ -0,0 +1,133 @@
+import pytest
+from datetime import date
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from apps.dashboard.models import College, Department, Publication
+from apps.dashboard.repositories import PublicationRepository
+from apps.dashboard.services.publication_analytics import PublicationImpactService
+
+
+@pytest.fixture
+def departments(dashboard_tables):
+    cache.clear()
+    college = College.objects.create(name='공과대학')
+    return (
+        Department.objects.create(college=college, name='컴퓨터공학과'),
+        Department.objects.create(college=college, name='전자공학과'),
+    )
+
+
+def _publication(department, year, impact_factor=None, journal_rank='SCIE',
+                 journal_name='Journal A', is_project_linked=False):
+    return Publication.objects.create(
+        publication_date=date(year, 6, 1), department=department, title='논문',
+        impact_factor=impact_factor, journal_rank=journal_rank,
+        journal_name=journal_name, is_project_linked=is_project_linked,
+    )
+
+
+class TestInterpolatePercentile:
+    """percentile_cont 미지원 DB용 백분위 계산 테스트"""
+
+    def test_linear_interpolation(self):
+        values = [1.0, 2.0, 3.0, 4.0]
+
+        assert PublicationRepository._interpolate_percentile(values, 0.5) == 2.5
+        assert PublicationRepository._interpolate_percentile(values, 0.9) == pytest.approx(3.7)
+        assert PublicationRepository._interpolate_percentile(values, 1.0) == 4.0
+
+    def test_empty_values(self):
+        assert PublicationRepository._interpolate_percentile([], 0.5) is None
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPublicationImpactService:
+    """논문 Impact Factor 분석 서비스 테스트"""
+
+    def test_stats_per_department_and_year(self, departments):
+        cs, ee = departments
+        _publication(cs, 2024, '1.000', journal_name='Journal A', is_project_linked=True)
+        _publication(cs, 2024, '2.000', journal_name='Journal A')
+        _publication(cs, 2024, '3.000', journal_rank='KCI', journal_name='Journal B')
+        _publication(cs, 2024, '4.000', journal_rank=None, journal_name=None, is_project_linked=True)
+        _publication(cs, 2024, None, journal_name='Journal B')
+        _publication(cs, 2023, '5.000')
+        _publication(ee, 2024, '7.000')
+
+        result = PublicationImpactService().generate_impact_analytics(top_journals=1)
+
+        assert result['percentiles'] == ['p25', 'p50', 'p75', 'p90']
+        assert [(row['department_id'], row['year']) for row in result['results']] == [
+            (cs.id, 2023), (cs.id, 2024), (ee.id, 2024),
+        ]
+        cs_2024 = result['results'][1]
+        assert cs_2024['department_name'] == '컴퓨터공학과'
+        assert cs_2024['publication_count'] == 5
+        assert cs_2024['impact_factor'] == {
+            'count': 4,
+            'sum': 10.0,
+            'mean': 2.5,
+            'percentiles': {'p25': 1.75, 'p50': 2.5, 'p75': 3.25, 'p90': 3.7},
+        }
+        assert cs_2024['journal_rank_distribution'] == {'KCI': 1, 'SCIE': 3, '미분류': 1}
+        assert cs_2024['project_linked_ratio'] == 0.4
+        assert cs_2024['top_journals'] == [{'journal_name': 'Journal A', 'count': 2}]
+
+    def test_uses_grouped_queries_regardless_of_department_count(self, departments):
+        """원본 논문 행 대신 GROUP BY 결과만 조회한다 (학과 수와 무관한 쿼리 수)"""
+        for department in departments:
+            for year in (2022, 2023, 2024):
+                _publication(department, year, '1.500')
+
+        with CaptureQueriesContext(connection) as queries:
+            PublicationImpactService().generate_impact_analytics()
+
+        expected = 2 if connection.vendor == 'postgresql' else 3
+        assert len(queries) == expected
+
+    def test_filters(self, departments):
+        cs, ee = departments
+        _publication(cs, 2022, '1.000')
+        _publication(cs, 2024, '1.000')
+        _publication(ee, 2024, '1.000')
+
+        result = PublicationImpactService().generate_impact_analytics(
+            department_id=cs.id, year_from=2023,
+        )
+
+        assert [(row['department_id'], row['year']) for row in result['results']] == [(cs.id, 2024)]
+
+    def test_without_impact_factor(self, departments):
+        _publication(departments[0], 2024, None)
+
+        row = PublicationImpactService().generate_impact_analytics()['results'][0]
+
+        assert row['impact_factor']['mean'] is None
+        assert row['impact_factor']['percentiles']['p50'] is None
+
+    def test_invalid_top_journals(self, departments):
+        with pytest.raises(ValueError):
+            PublicationImpactService().generate_impact_analytics(top_journals=0)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPublicationImpactAPI:
+    """GET /publications/impact/ 테스트"""
+
+    url = '/api/v1/dashboard/publications/impact/'
+
+    def test_returns_analytics(self, bearer_client, departments):
+        _publication(departments[0], 2024, '2.000')
+
+        response = bearer_client.get(self.url, {'department': departments[0].id})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['impact_factor']['mean'] == 2.0
+
+    def test_invalid_param_returns_400(self, bearer_client, departments):
+        response = bearer_client.get(self.url, {'year_from': 'abc'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,203 @@
+import pytest
+from datetime import date
+from pathlib import Path
+from django.conf import settings
+from django.db import connection
+from rest_framework import status
+
+from apps.dashboard.models import College, Department, Publication
+from apps.dashboard.repositories import PublicationRepository
+from apps.dashboard.services.publication_search import (
+    HIGHLIGHT_END, HIGHLIGHT_START, MAX_TERMS, PublicationSearchService, parse_search_terms,
+)
+
+
+SEARCH_MIGRATION = (
+    Path(settings.BASE_DIR).parent / 'supabase' / 'migrations'
+    / '20261019000500_publication_full_text_search.sql'
+)
+
+postgresql_only = pytest.mark.skipif(
+    connection.vendor != 'postgresql', reason='PostgreSQL tsvector 경로 테스트'
+)
+
+
+@pytest.fixture
+def departments(dashboard_tables):
+    """
+    전문 검색 색인이 준비된 학과 2개
+
+    PostgreSQL은 Supabase 마이그레이션으로 search_vector 컬럼/GIN 인덱스를,
+    SQLite는 FTS5 테이블/트리거를 만든다 (검색 요청은 스키마를 변경하지 않음).
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(SEARCH_MIGRATION.read_text(encoding='utf-8'))
+    else:
+        PublicationRepository().ensure_sqlite_fts()
+
+    college = College.objects.create(name='공과대학')
+    return (
+        Department.objects.create(college=college, name='컴퓨터공학과'),
+        Department.objects.create(college=college, name='전자공학과'),
+    )
+
+
+def _publication(department, title, journal_name=None, primary_author=None, **kwargs):
+    return Publication.objects.create(
+        publication_date=kwargs.pop('publication_date', date(2024, 1, 1)),
+        department=department, title=title, journal_name=journal_name,
+        primary_author=primary_author, **kwargs,
+    )
+
+
+class TestParseSearchTerms:
+    """검색어 분리 단위 테스트"""
+
+    def test_strips_operators_and_duplicates(self):
+        assert parse_search_terms('Deep  "learning" OR deep* -AI') == ['deep', 'learning', 'or', 'ai']
+
+    def test_keeps_korean_words(self):
+        assert parse_search_terms('딥러닝, 영상처리!') == ['딥러닝', '영상처리']
+
+    def test_limits_number_of_terms(self):
+        assert len(parse_search_terms(' '.join(f'w{i}' for i in range(20)))) == MAX_TERMS
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPublicationSearchService:
+    """전문 검색 서비스 테스트 (PostgreSQL tsvector / SQLite FTS5)"""
+
+    def test_title_match_ranks_above_journal_match(self, departments):
+        in_journal = _publication(departments[0], '영상 분할 기법', journal_name='Deep Learning Review')
+        in_title = _publication(departments[0], 'Deep learning for 의료 영상', journal_name='Medical Journal')
+        _publication(departments[0], '무관한 논문')
+
+        results = PublicationSearchService().search('deep learning')
+
+        assert [row['id'] for row in results] == [in_title.id, in_journal.id]
+        assert results[0]['rank'] > results[1]['rank']
+
+    def test_all_terms_required_with_prefix_match(self, departments):
+        """모든 단어를 포함해야 하며 조사가 붙은 단어도 접두어로 찾는다"""
+        match = _publication(departments[0], '딥러닝을 이용한 영상처리')
+        _publication(departments[0], '딥러닝 기반 자연어처리')
+
+        results = PublicationSearchService().search('딥러닝 영상')
+
+        assert [row['id'] for row in results] == [match.id]
+
+    def test_searches_author_columns(self, departments):
+        match = _publication(departments[0], '논문 A', contributing_authors='김철수, 이영희')
+
+        assert [row['id'] for row in PublicationSearchService().search('이영희')] == [match.id]
+
+    def test_highlight_is_html_escaped(self, departments):
+        """원문은 이스케이프하고 일치한 단어만 <mark>로 감싼다"""
+        _publication(departments[0], '<script> graph 신경망', journal_name='A & B')
+
+        highlight = PublicationSearchService().search('graph')[0]['highlight']
+
+        assert highlight['title'] == '&lt;script&gt; <mark>graph</mark> 신경망'
+        assert highlight['journal_name'] == 'A &amp; B'
+
+    def test_department_filter(self, departments):
+        _publication(departments[0], 'graph 알고리즘')
+        other = _publication(departments[1], 'graph 회로')
+
+        results = PublicationSearchService().search('graph', department_id=departments[1].id)
+
+        assert [row['id'] for row in results] == [other.id]
+
+    def test_index_follows_updates_and_deletes(self, departments):
+        """생성 컬럼(PostgreSQL)/트리거(SQLite)로 수정/삭제가 색인에 반영된다"""
+        publication = _publication(departments[0], 'graph 알고리즘')
+        service = PublicationSearchService()
+        assert service.search('graph')
+
+        publication.title = 'tree 알고리즘'
+        publication.save()
+        assert service.search('graph') == []
+        assert [row['id'] for row in service.search('tree')] == [publication.id]
+
+        publication.delete()
+        assert service.search('tree') == []
+
+    def test_empty_query_raises(self, departments):
+        with pytest.raises(ValueError):
+            PublicationSearchService().search('  !! ')
+
+
+@postgresql_only
+@pytest.mark.django_db(transaction=True)
+class TestPostgreSQLSearchVector:
+    """마이그레이션의 search_vector 컬럼과 tsquery/ts_headline 경로 테스트"""
+
+    def test_search_vector_is_weighted_by_column(self, departments):
+        publication = _publication(
+            departments[0], 'graph 신경망', journal_name='Neural Journal', primary_author='Kim',
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT search_vector::text FROM publications WHERE id = %s", [publication.id]
+            )
+            vector = cursor.fetchone()[0]
+
+        assert "'graph':1A" in vector
+        assert "'neural':3B" in vector
+        assert "'kim':5C" in vector
+
+    def test_repository_uses_prefix_tsquery_and_headline(self, departments):
+        match = _publication(departments[0], 'Graphene 소재 연구', journal_name='Graph Letters')
+        _publication(departments[1], 'graph 이론')
+
+        rows = PublicationRepository().search_full_text(
+            ['graph'], 10, department_id=departments[0].id,
+            highlight_start=HIGHLIGHT_START, highlight_end=HIGHLIGHT_END,
+        )
+
+        assert [row['id'] for row in rows] == [match.id]
+        assert rows[0]['title_highlight'] == f'{HIGHLIGHT_START}Graphene{HIGHLIGHT_END} 소재 연구'
+        assert rows[0]['journal_highlight'] == f'{HIGHLIGHT_START}Graph{HIGHLIGHT_END} Letters'
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPublicationSearchAPI:
+    """GET /publications/search/ 테스트"""
+
+    url = '/api/v1/dashboard/publications/search/'
+
+    def test_returns_publications_in_rank_order(self, bearer_client, departments):
+        _publication(departments[0], '무관한 논문', journal_name='graph journal')
+        best = _publication(departments[0], 'graph 신경망', publication_date=date(2023, 5, 1))
+
+        response = bearer_client.get(self.url, {'q': 'graph', 'fields': 'id,title'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['query'] == 'graph'
+        first = response.data['results'][0]
+        assert first['id'] == best.id
+        assert first['title'] == 'graph 신경망'
+        assert first['highlight']['title'] == '<mark>graph</mark> 신경망'
+        assert 'publication_date' not in first
+        assert len(response.data['results']) == 2
+
+    def test_missing_query_returns_400(self, bearer_client, departments):
+        assert bearer_client.get(self.url).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_invalid_department_returns_400(self, bearer_client, departments):
+        response = bearer_client.get(self.url, {'q': 'graph', 'department': 'abc'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.skipif(connection.vendor != 'sqlite', reason='SQLite FTS5 색인 미설정 테스트')
+    def test_missing_index_returns_501_without_creating_it(self, bearer_client, departments):
+        """검색 요청은 색인을 만들지 않고 501로 알린다"""
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE {PublicationRepository.SQLITE_FTS_TABLE}')
+
+        response = bearer_client.get(self.url, {'q': 'graph'})
+
+        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+        assert PublicationRepository.SQLITE_FTS_TABLE not in connection.introspection.table_names()
@@ -0,0 +1,112 @@
+import jwt
+import time
+import pytest
+from rest_framework.test import APIClient
+
+from apps.core.query_insights import method_stats, slow_query_log
+from apps.dashboard.models import College, Department
+from apps.dashboard.repositories import DepartmentRepository
+
+
+SLOW_QUERIES_URL = '/api/v1/dashboard/slow-queries/'
+
+
+@pytest.fixture(autouse=True)
+def clean_insights():
+    slow_query_log.clear()
+    method_stats.clear()
+    yield
+    slow_query_log.clear()
+    method_stats.clear()
+
+
+@pytest.fixture
+def instrumented(settings):
+    settings.REPOSITORY_INSTRUMENTATION_ENABLED = True
+    settings.REPOSITORY_SLOW_QUERY_MS = 0
+    settings.REPOSITORY_EXPLAIN_SAMPLE_RATE = 1.0
+
+
+@pytest.fixture
+def department(dashboard_tables):
+    college = College.objects.create(name='공과대학')
+    return Department.objects.create(college=college, name='컴퓨터공학과')
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRepositoryInstrumentation:
+    """Repository 메서드 계측"""
+
+    def test_disabled_by_default(self, department):
+        assert DepartmentRepository().get_by_id(department.id) == department
+
+        assert method_stats.top() == []
+        assert slow_query_log.entries() == []
+
+    def test_records_method_stats(self, instrumented, department):
+        repository = DepartmentRepository()
+        repository.get_by_id(department.id)
+        repository.get_by_id(department.id)
+
+        stats = {item['method']: item for item in method_stats.top()}
+        assert stats['DepartmentRepository.get_by_id']['calls'] == 2
+
+    def test_slow_query_is_tagged_and_explained(self, instrumented, department):
+        DepartmentRepository().get_by_id(department.id)
+
+        entry = slow_query_log.entries()[0]
+        assert entry['method'] == 'DepartmentRepository.get_by_id'
+        assert entry['sql'].endswith("/* repository='DepartmentRepository.get_by_id' */")
+        assert entry['plan']
+
+    def test_fast_query_is_not_captured(self, instrumented, settings, department):
+        settings.REPOSITORY_SLOW_QUERY_MS = 60_000
+        DepartmentRepository().get_by_id(department.id)
+
+        assert slow_query_log.entries() == []
+
+    def test_writes_are_not_explained(self, instrumented, department):
+        DepartmentRepository().update(department, name='전자공학과')
+
+        entries = [entry for entry in slow_query_log.entries() if entry['method'] == 'DepartmentRepository.update']
+        assert entries and all(entry['plan'] is None for entry in entries)
+        department.refresh_from_db()
+        assert department.name == '전자공학과'
+
+    def test_ring_buffer_is_bounded(self, instrumented, settings, department):
+        settings.REPOSITORY_SLOW_QUERY_BUFFER_SIZE = 2
+        for _ in range(3):
+            DepartmentRepository().get_by_id(department.id)
+
+        assert len(slow_query_log.entries()) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSlowQueryLogView:
+    """느린 쿼리 조회 API"""
+
+    @pytest.fixture
+    def admin_client(self, admin_profile, jwt_secret):
+        token = jwt.encode(
+            {'sub': str(admin_profile.id), 'email': admin_profile.email, 'exp': int(time.time()) + 3600},
+            jwt_secret,
+            algorithm='HS256',
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        return client
+
+    def test_admin_reads_and_clears(self, instrumented, admin_client, department):
+        DepartmentRepository().get_by_id(department.id)
+
+        response = admin_client.get(SLOW_QUERIES_URL)
+        assert response.status_code == 200
+        assert response.data['enabled'] is True
+        assert 'DepartmentRepository.get_by_id' in {entry['method'] for entry in response.data['slow_queries']}
+        assert any(item['method'] == 'DepartmentRepository.get_by_id' for item in response.data['methods'])
+
+        assert admin_client.delete(SLOW_QUERIES_URL).status_code == 204
+        assert slow_query_log.entries() == []
+
+    def test_requires_admin(self, bearer_client):
+        assert bearer_client.get(SLOW_QUERIES_URL).status_code == 403
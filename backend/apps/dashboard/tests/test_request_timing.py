@@ -0,0 +1,100 @@
+import json
+import logging
+import pytest
+from unittest.mock import patch
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+from apps.core.instrumentation import RequestTimings, activate, current_timings, deactivate, timed
+from apps.dashboard.models import College, Department
+
+
+@pytest.fixture
+def timing_enabled(settings):
+    settings.REQUEST_TIMING_ENABLED = True
+    settings.REQUEST_TIMING_SAMPLE_RATE = 1.0
+
+
+def _metrics(header):
+    """Server-Timing 헤더 -> {이름: 전체 항목}"""
+    return {item.strip().split(';')[0]: item.strip() for item in header.split(',')}
+
+
+class TestInstrumentation:
+    """계측 구간 기록 단위 테스트"""
+
+    def test_timed_is_noop_without_active_request(self):
+        assert current_timings() is None
+        with timed('view'):
+            pass
+
+    def test_timed_accumulates_sections(self):
+        timings = RequestTimings()
+        token = activate(timings)
+        try:
+            with timed('serialize'):
+                pass
+            with timed('serialize'):
+                pass
+        finally:
+            deactivate(token)
+
+        assert set(timings.sections) == {'serialize'}
+        header = timings.server_timing(0.01)
+        assert 'db;dur=0.00;desc="0 queries"' in header
+        assert header.endswith('total;dur=10.00')
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRequestTimingMiddleware:
+    """Server-Timing 헤더 및 구조화 로그"""
+
+    @pytest.fixture
+    def departments(self, dashboard_tables):
+        college = College.objects.create(name='공과대학')
+        Department.objects.create(college=college, name='컴퓨터공학과')
+
+    def test_disabled_by_default(self, bearer_client, departments):
+        response = bearer_client.get('/api/v1/dashboard/departments/')
+
+        assert response.status_code == 200
+        assert 'Server-Timing' not in response
+
+    def test_sampled_request_reports_stages(self, timing_enabled, bearer_client, departments, caplog):
+        with caplog.at_level(logging.INFO, logger='apps.core.request_timing'):
+            response = bearer_client.get('/api/v1/dashboard/departments/')
+
+        assert response.status_code == 200
+        metrics = _metrics(response['Server-Timing'])
+        assert {'auth', 'view', 'serialize', 'render', 'db', 'total'} <= set(metrics)
+        assert 'queries"' in metrics['db'] and '"0 queries"' not in metrics['db']
+
+        record = json.loads(caplog.records[-1].getMessage())
+        assert record['path'] == '/api/v1/dashboard/departments/'
+        assert record['status'] == 200
+        assert record['db_queries'] >= 1
+        assert record['total_ms'] >= record['view_ms']
+
+    def test_sampling_rate_zero_skips(self, timing_enabled, settings, bearer_client, departments):
+        settings.REQUEST_TIMING_SAMPLE_RATE = 0.0
+
+        with patch('apps.core.middleware.connections') as connections:
+            response = bearer_client.get('/api/v1/dashboard/departments/')
+
+        assert 'Server-Timing' not in response
+        connections.all.assert_not_called()
+
+    def test_async_request_reports_stages(self, timing_enabled, bearer_client, departments):
+        """ASGI 비동기 View 요청도 계측한다 (DB 쿼리는 다른 스레드에서 실행되어 측정하지 않음)"""
+        headers = {'Authorization': bearer_client._credentials['HTTP_AUTHORIZATION']}
+        response = async_to_sync(AsyncClient().get)('/api/v1/dashboard/async/departments/', headers=headers)
+
+        assert response.status_code == 200
+        metrics = _metrics(response['Server-Timing'])
+        assert {'auth', 'view', 'serialize', 'total'} <= set(metrics)
+
+    def test_unauthenticated_request_is_timed(self, timing_enabled, client):
+        response = client.get('/api/v1/dashboard/departments/')
+
+        metrics = _metrics(response['Server-Timing'])
+        assert 'view' in metrics and 'total' in metrics
@@ -0,0 +1,168 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.concurrency import run_concurrently
+from apps.dashboard.models import College, Department, DepartmentYearRollup, Publication, Student
+from apps.dashboard.services.rollup import DepartmentYearRollupService
+from apps.dashboard.services.summary_generator import DashboardSummaryService
+
+
+class TestDepartmentYearRollupService:
+    """학과×연도 집계 서비스 테스트"""
+
+    def _patch_sources(self, service):
+        return [
+            patch.object(
+                service.publication_repo,
+                'stats_by_department_and_year',
+                return_value=[
+                    {'department_id': 1, 'year': 2023, 'publication_count': 2,
+                     'avg_impact_factor': Decimal('3.5')},
+                ],
+            ),
+            patch.object(
+                service.student_repo,
+                'count_admitted_by_department_and_year',
+                return_value=[
+                    {'department_id': 1, 'year': 2023, 'students_admitted': 10},
+                    {'department_id': 2, 'year': 2022, 'students_admitted': 4},
+                ],
+            ),
+            patch.object(
+                service.project_repo,
+                'stats_by_department_and_year',
+                return_value=[
+                    {'department_id': 1, 'year': 2023, 'project_count': 1,
+                     'total_funding': 500},
+                ],
+            ),
+            patch.object(
+                service.expense_repo,
+                'sum_executed_by_department_and_year',
+                return_value=[
+                    {'department_id': 1, 'year': 2024, 'total_expenses': 120},
+                ],
+            ),
+        ]
+
+    @pytest.mark.django_db
+    def test_refresh_merges_sources_by_department_and_year(self):
+        """원본 집계를 (학과, 연도) 단위로 병합하여 교체한다"""
+        service = DepartmentYearRollupService()
+        patches = self._patch_sources(service)
+        for p in patches:
+            p.start()
+        try:
+            with patch.object(service.department_repo, 'lock') as mock_lock, \
+                    patch.object(service.rollup_repo, 'replace_for_departments') as mock_replace:
+                count = service.refresh_departments([2, 1, 1])
+        finally:
+            for p in patches:
+                p.stop()
+
+        department_ids, rollups = mock_replace.call_args[0]
+        by_key = {(r.department_id, r.year): r for r in rollups}
+
+        assert count == 3
+        mock_lock.assert_called_once_with([1, 2])
+        assert department_ids == [1, 2]
+        assert by_key[(1, 2023)].publication_count == 2
+        assert by_key[(1, 2023)].students_admitted == 10
+        assert by_key[(1, 2023)].total_funding == 500
+        assert by_key[(1, 2024)].total_expenses == 120
+        assert by_key[(1, 2024)].publication_count == 0
+        assert by_key[(2, 2022)].students_admitted == 4
+
+    def test_refresh_without_departments_is_noop(self):
+        """갱신 대상 학과가 없으면 쿼리하지 않는다"""
+        service = DepartmentYearRollupService()
+
+        with patch.object(service.rollup_repo, 'replace_for_departments') as mock_replace:
+            assert service.refresh_departments([None]) == 0
+
+        mock_replace.assert_not_called()
+
+
+@pytest.fixture
+def department(dashboard_tables):
+    cache.clear()
+    college = College.objects.create(name='공과대학')
+    department = Department.objects.create(college=college, name='컴퓨터공학과')
+    for index in range(2):
+        Publication.objects.create(
+            publication_id_str=f'P{index}', publication_date=date(2023 + index, 3, 1), department=department,
+        )
+    yield department
+    cache.clear()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRollupConsistency:
+    """집계 갱신 트랜잭션/조회 경로 테스트"""
+
+    def test_repeated_refresh_replaces_rows(self, department):
+        service = DepartmentYearRollupService()
+
+        service.refresh_departments([department.id])
+        service.refresh_departments([department.id])
+
+        assert DepartmentYearRollup.objects.filter(department=department).count() == 2
+
+    @pytest.mark.skipif(connection.vendor != 'postgresql', reason='행 잠금은 PostgreSQL에서만 확인')
+    def test_concurrent_refresh_of_same_department(self, department):
+        """같은 학과를 동시에 갱신해도 (학과, 연도) 중복 삽입 오류 없이 집계가 유지된다"""
+        def refresh_repeatedly():
+            for _ in range(10):
+                DepartmentYearRollupService().refresh_departments([department.id])
+
+        run_concurrently({index: refresh_repeatedly for index in range(8)}, max_workers=8)
+
+        assert DepartmentYearRollup.objects.filter(department=department).count() == 2
+
+    def test_failed_insert_keeps_previous_rollup(self, department):
+        """삽입이 실패하면 삭제도 취소되어 학과 집계가 사라지지 않는다"""
+        service = DepartmentYearRollupService()
+        service.refresh_departments([department.id])
+
+        with patch.object(service.rollup_repo, 'bulk_create', side_effect=RuntimeError('insert 실패')):
+            with pytest.raises(RuntimeError):
+                service.refresh_departments([department.id])
+
+        assert DepartmentYearRollup.objects.filter(department=department).count() == 2
+
+    def test_summary_does_not_build_rollup(self, department):
+        """조회 요청은 집계 테이블에 쓰지 않고, 비어 있으면 원본 테이블로 같은 결과를 계산한다"""
+        with CaptureQueriesContext(connection) as context:
+            live = DashboardSummaryService().generate_dashboard_summary(
+                sections=['performance_by_department', 'publications_by_year'],
+            )
+
+        assert not DepartmentYearRollup.objects.exists()
+        assert not [query for query in context.captured_queries if 'INSERT' in query['sql'] or 'DELETE' in query['sql']]
+
+        DepartmentYearRollupService().rebuild_all()
+        cache.clear()
+        built = DashboardSummaryService().generate_dashboard_summary(
+            sections=['performance_by_department', 'publications_by_year'],
+        )
+
+        assert live == built
+        assert live['publications_by_year'] == [{'year': 2023, 'count': 1}, {'year': 2024, 'count': 1}]
+
+    def test_crud_write_rolls_back_when_rollup_refresh_fails(self, bearer_client, department):
+        """쓰기와 집계 갱신은 한 트랜잭션이다"""
+        with patch.object(
+            DepartmentYearRollupService, 'refresh_departments', side_effect=RuntimeError('갱신 실패'),
+        ):
+            with pytest.raises(RuntimeError):
+                bearer_client.post('/api/v1/dashboard/students/', {
+                    'student_id_number': 'S1', 'name': '학생', 'department': department.id,
+                    'program_level': '학사', 'status': '재학',
+                }, format='json')
+
+        assert not Student.objects.exists()
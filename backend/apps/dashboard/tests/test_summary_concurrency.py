@@ -0,0 +1,111 @@
+import time
+import pytest
+from unittest.mock import patch
+from django.core.cache import cache
+from django.db import connection
+
+from apps.core.concurrency import run_concurrently
+from apps.dashboard.services.summary_generator import DashboardSummaryService
+
+SECTION_DELAY = 0.2
+SECTIONS = [
+    '_get_performance_by_department',
+    '_get_publications_by_year',
+    '_get_students_by_status',
+    '_get_budget_execution',
+]
+
+
+def _patch_sections(service, section_func):
+    """각 섹션 계산을 지정한 함수로 대체"""
+    return [
+        patch.object(service, name, side_effect=section_func(name)) for name in SECTIONS
+    ]
+
+
+def _generate(service, concurrent):
+    """데이터 존재 여부/집계 준비 단계를 생략하고 요약 생성 (소요 시간 포함)"""
+    cache.clear()
+    with patch.object(service, '_is_data_empty', return_value=False), patch.object(
+        service.rollup_service, 'is_built', return_value=True
+    ):
+        started = time.perf_counter()
+        summary = service.generate_dashboard_summary(concurrent=concurrent)
+        return summary, time.perf_counter() - started
+
+
+class TestRunConcurrently:
+    """run_concurrently 헬퍼 테스트"""
+
+    def test_returns_results_by_key(self):
+        """작업 결과를 키별로 반환한다"""
+        result = run_concurrently({'a': lambda: 1, 'b': lambda: 2}, max_workers=2)
+        assert result == {'a': 1, 'b': 2}
+
+    def test_propagates_exception(self):
+        """작업 중 예외는 호출자에게 전달된다"""
+        def fail():
+            raise RuntimeError('boom')
+
+        with pytest.raises(RuntimeError):
+            run_concurrently({'ok': lambda: 1, 'fail': fail}, max_workers=2)
+
+    @patch('apps.core.concurrency.connections')
+    def test_closes_worker_connections(self, mock_connections):
+        """각 작업 종료 후 스레드 DB 연결을 정리한다"""
+        run_concurrently({'a': lambda: 1, 'b': lambda: 2}, max_workers=2)
+        assert mock_connections.close_all.call_count == 2
+
+
+class TestConcurrentSummary:
+    """요약 섹션 동시 계산 테스트 (DB 미사용)"""
+
+    def test_concurrent_result_matches_sequential(self):
+        """동시 실행 결과는 순차 실행 결과와 같다"""
+        service = DashboardSummaryService()
+        patches = _patch_sections(service, lambda name: lambda: name)
+        for p in patches:
+            p.start()
+        try:
+            sequential, _ = _generate(service, concurrent=False)
+            concurrent, _ = _generate(service, concurrent=True)
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert concurrent == sequential
+        assert sequential['publications_by_year'] == '_get_publications_by_year'
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(
+    connection.vendor != 'postgresql', reason='로컬 PostgreSQL에서만 측정'
+)
+class TestConcurrentSummaryWallClock:
+    """PostgreSQL 쿼리 지연 기준 동시 계산 소요 시간 비교"""
+
+    def _pg_sleep_section(self, name):
+        def section():
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_sleep(%s)', [SECTION_DELAY])
+            return name
+        return section
+
+    def test_concurrent_is_faster_than_sequential(self):
+        """섹션별 연결로 동시 실행하면 전체 소요 시간이 줄어든다"""
+        service = DashboardSummaryService()
+        patches = _patch_sections(service, self._pg_sleep_section)
+        for p in patches:
+            p.start()
+        try:
+            _, sequential_elapsed = _generate(service, concurrent=False)
+            _, concurrent_elapsed = _generate(service, concurrent=True)
+        finally:
+            for p in patches:
+                p.stop()
+
+        print(
+            f"sequential={sequential_elapsed:.3f}s concurrent={concurrent_elapsed:.3f}s"
+        )
+        assert sequential_elapsed >= SECTION_DELAY * len(SECTIONS)
+        assert concurrent_elapsed < sequential_elapsed / 2
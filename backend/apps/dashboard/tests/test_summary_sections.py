@@ -0,0 +1,125 @@
+import pytest
+from unittest.mock import patch
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from apps.dashboard.models import College, Department, Student
+
+from apps.dashboard.services.cache import bump_data_version
+from apps.dashboard.services.summary_generator import DashboardSummaryService
+
+
+@pytest.fixture
+def service():
+    """섹션 계산을 호출 횟수를 세는 가짜 함수로 대체한 서비스"""
+    cache.clear()
+    service = DashboardSummaryService()
+    service.calls = []
+
+    def section(name):
+        def build():
+            service.calls.append(name)
+            return [name]
+        return build
+
+    patches = [
+        patch.object(service, '_is_data_empty', return_value=False),
+        patch.object(service.rollup_service, 'is_built', return_value=True),
+        patch.object(service, '_get_performance_by_department', side_effect=section('performance')),
+        patch.object(service, '_get_publications_by_year', side_effect=section('publications')),
+        patch.object(service, '_get_students_by_status', side_effect=section('students')),
+        patch.object(service, '_get_budget_execution', side_effect=section('budget')),
+    ]
+    for p in patches:
+        p.start()
+    yield service
+    for p in patches:
+        p.stop()
+
+
+class TestSectionSelectiveSummary:
+    """섹션 선택 요약 생성 테스트"""
+
+    def test_only_requested_sections_are_computed(self, service):
+        """요청한 섹션만 계산하여 반환한다"""
+        result = service.generate_dashboard_summary(
+            sections=['budget_execution', 'publications_by_year'], concurrent=False
+        )
+
+        assert set(result) == {'is_empty', 'budget_execution', 'publications_by_year'}
+        assert sorted(service.calls) == ['budget', 'publications']
+
+    def test_unknown_section_raises(self, service):
+        """알 수 없는 섹션은 ValueError"""
+        with pytest.raises(ValueError):
+            service.generate_dashboard_summary(sections=['unknown'])
+
+    def test_sections_are_cached_independently(self, service):
+        """한 데이터 종류가 바뀌면 해당 데이터에 의존하는 섹션만 재계산한다"""
+        service.generate_dashboard_summary(concurrent=False)
+        assert len(service.calls) == 4
+
+        bump_data_version('expenses')
+        service.calls.clear()
+        service.generate_dashboard_summary(concurrent=False)
+
+        assert service.calls == ['budget']
+
+
+@pytest.mark.django_db
+class TestSummarySectionsView:
+    """섹션 선택 요약 API 테스트"""
+
+    url = '/api/v1/dashboard/summary/'
+
+    def test_unknown_section_returns_400(self, bearer_client):
+        """알 수 없는 섹션 요청 시 400 응답"""
+        response = bearer_client.get(self.url, {'sections': 'budget_execution,foo'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'budget_execution' in response.data['available_sections']
+
+    @patch.object(DashboardSummaryService, 'generate_dashboard_summary')
+    def test_sections_param_is_passed_to_service(self, mock_generate, bearer_client):
+        """sections 파라미터를 서비스에 전달한다"""
+        mock_generate.return_value = {
+            'is_empty': False,
+            'budget_execution': {'execution_rate': 10.0},
+        }
+
+        response = bearer_client.get(self.url, {'sections': 'budget_execution'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'performance_by_department' not in response.data
+        mock_generate.assert_called_once_with(sections=['budget_execution'])
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPerformanceByDepartmentQueries:
+    """학과별 실적 섹션 쿼리 수 테스트"""
+
+    def _create(self, count, offset=0):
+        college = College.objects.create(name=f'대학{offset}')
+        for index in range(offset, offset + count):
+            department = Department.objects.create(college=college, name=f'학과{index}')
+            Student.objects.create(
+                student_id_number=f'S{index}', name='학생', department=department,
+                program_level='학사', status='재학',
+            )
+
+    def _count_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            result = DashboardSummaryService()._get_performance_by_department()
+        return len(context.captured_queries), result
+
+    def test_query_count_does_not_grow_with_departments(self, dashboard_tables):
+        """학과 수와 무관하게 학과/집계/학생 수 조회가 각각 한 번씩 실행된다"""
+        self._create(2)
+        small, _ = self._count_queries()
+        self._create(6, offset=2)
+        large, result = self._count_queries()
+
+        assert small == large == 3
+        assert [row['student_count'] for row in result] == [1] * 8
@@ -1,7 +1,8 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
-    DashboardSummaryView,
+    DashboardSummaryView, ExpenseBurnDownView, AggregateView, SlowQueryLogView,
+    AsyncDashboardSummaryView, AsyncDashboardReadView,
     CollegeViewSet, DepartmentViewSet, StudentViewSet,
     DepartmentKPIViewSet, PublicationViewSet,
     ResearchProjectViewSet, ProjectExpenseViewSet
@@ -19,7 +20,22 @@ router.register(r'publications', PublicationViewSet, basename='publication')
 router.register(r'projects', ResearchProjectViewSet, basename='project')
 router.register(r'expenses', ProjectExpenseViewSet, basename='expense')
 
+# 비동기 조회 API (ASGI 서버용): 요약과 각 리소스의 목록/상세 조회
+async_urlpatterns = [
+    path('summary/', AsyncDashboardSummaryView.as_view(), name='async-dashboard-summary'),
+]
+for prefix, viewset, basename in router.registry:
+    read_view = AsyncDashboardReadView.as_view(viewset_class=viewset, basename=basename)
+    async_urlpatterns += [
+        path(f'{prefix}/', read_view, name=f'async-{basename}-list'),
+        path(f'{prefix}/<str:pk>/', read_view, name=f'async-{basename}-detail'),
+    ]
+
 urlpatterns = [
     path('summary/', DashboardSummaryView.as_view(), name='dashboard-summary'),
+    path('burn-down/', ExpenseBurnDownView.as_view(), name='expense-burn-down'),
+    path('aggregate/', AggregateView.as_view(), name='aggregate'),
+    path('slow-queries/', SlowQueryLogView.as_view(), name='slow-queries'),
+    path('async/', include(async_urlpatterns)),
     path('', include(router.urls)),
 ]
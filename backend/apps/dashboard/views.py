@@ -1,13 +1,40 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.filters import SearchFilter
 from rest_framework.permissions import IsAuthenticated
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
+from django.db import NotSupportedError, transaction
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
 import logging
 
-from apps.users.permissions import IsAuthenticatedViaSupabase
-from .services.summary_generator import DashboardSummaryService
+from apps.core.async_views import AsyncAPIView
+from apps.core.bulk import BulkWriteMixin
+from apps.core.db_routing import ReplicaReadMixin
+from apps.core.fast_serializers import ValuesSerializer
+from apps.core.filters import (
+    QueryParamFilterBackend, parse_date, parse_filter_params, parse_int, parse_str,
+)
+from apps.core.pagination import KeysetPagination
+from apps.core.query_insights import method_stats, slow_query_log
+from apps.users.permissions import IsAdmin, IsAuthenticatedViaSupabase
+from .services.summary_generator import DashboardSummaryService, SECTION_NAMES
+from .services.expense_timeseries import ExpenseBurnDownService
+from .services.aggregation import AggregationService, AGGREGATE_DATASET_NAMES
+from .services.cache import bump_data_version
+from .services.rollup import DepartmentYearRollupService
+from .services.exporter import DatasetExporter
+from .services.publication_search import PublicationSearchService
+from .services.publication_analytics import PublicationImpactService
+from .services.sync import DeltaSyncService, decode_sync_cursor, encode_sync_cursor
+from .repositories import ResearchProjectRepository, ProjectExpenseRepository
 from .serializers import (
-    DashboardSummarySerializer,
+    DashboardSummarySerializer, BurnDownSerializer,
     CollegeSerializer, DepartmentSerializer, StudentSerializer,
     DepartmentKPISerializer, PublicationSerializer,
     ResearchProjectSerializer, ProjectExpenseSerializer
@@ -22,58 +49,595 @@ logger = logging.getLogger(__name__)
 
 # ============= CRUD ViewSets =============
 
-class CollegeViewSet(viewsets.ModelViewSet):
+class BaseDashboardViewSet(ReplicaReadMixin, BulkWriteMixin, viewsets.ModelViewSet):
+    """대시보드 데이터 CRUD 공통 ViewSet (변경 시 집계 갱신 및 캐시 무효화, 조회는 읽기 복제본 사용)"""
+
+    # 학과×연도 집계에 반영되는 모델이면 인스턴스에서 학과 ID를 찾는 경로 (예: 'project.department_id')
+    rollup_department_path = None
+    # 변경 시 무효화할 캐시 데이터 종류 (services.cache.DATASETS)
+    cache_datasets = ()
+    # 목록 조회 키셋 페이지네이션 정렬 (정렬 필드, id 복합 인덱스 필요)
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+    # ?ordering= 로 허용할 정렬 필드 (NULL이 없고 인덱스가 있는 필드만)
+    ordering_fields = ('created_at',)
+    # ?<파라미터>= 필터 (파라미터 -> (ORM 조회 조건, 값 변환 함수))
+    filter_params = {}
+    # ?search= 검색 대상 필드
+    search_fields = ()
+    filter_backends = [QueryParamFilterBackend, SearchFilter]
+    # ?fields=id,name 형태의 출력 필드 제한 파라미터 (GET 전용)
+    fields_query_param = 'fields'
+    # 목록 조회 시 values() 기반 고속 직렬화 사용 여부
+    fast_list_serialization = True
+    # /export/ 지원 파일 형식 (?file_format=)
+    export_formats = ('csv', 'xlsx')
+    # ?since=<커서> 증분 동기화 파라미터 (빈 값이면 처음부터)
+    sync_query_param = 'since'
+
+    def list(self, request, *args, **kwargs):
+        if self.sync_query_param in request.query_params:
+            return self.sync_list(request)
+
+        values_serializer = self.get_values_serializer()
+        if values_serializer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.get_list_values_queryset(values_serializer)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.to_representation(page))
+        return Response(values_serializer.to_representation(queryset))
+
+    def get_list_values_queryset(self, values_serializer):
+        """목록 조회 values() QuerySet (필터/검색 적용, 직렬화 필드와 커서 정렬 필드만 조회)"""
+        ordering_fields = [order.lstrip('-') for order in self.get_keyset_ordering()]
+        return self.filter_queryset(self.get_queryset()).values(
+            *dict.fromkeys(values_serializer.value_paths + ordering_fields)
+        )
+
+    def sync_list(self, request):
+        """
+        증분 동기화 (GET /<resource>/?since=<cursor>)
+
+        since 이후 생성/수정된 행(changed)과 삭제된 행 ID(deleted)를 반환한다.
+        클라이언트는 changed를 id 기준으로 반영한 뒤 deleted를 제거하고,
+        has_more가 false가 될 때까지 응답의 cursor로 다시 요청한다.
+        reset이 true이면 로컬 데이터를 비우고 changed로 다시 채운다.
+
+        Query Params:
+            since: 이전 응답의 cursor (빈 값이면 처음부터 전체)
+            page_size: 한 번에 받을 최대 행 수
+            fields: 출력 필드 제한
+
+        Returns:
+            HTTP 200 OK: {'changed', 'deleted', 'reset', 'has_more', 'cursor'}
+            HTTP 400 Bad Request: 잘못된 커서 또는 필터/검색/정렬과 함께 사용
+            HTTP 401 Unauthorized: 인증 실패
+        """
+        # 필터 조건에서 벗어난 행은 삭제 기록이 없으므로 전체 테이블 기준으로만 동기화
+        unsupported = [
+            param for param in (*self.filter_params, 'search', 'ordering', 'cursor')
+            if param in request.query_params
+        ]
+        if unsupported:
+            return Response(
+                {'error': f"{self.sync_query_param}는 다음 파라미터와 함께 사용할 수 없습니다: {', '.join(unsupported)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            since = decode_sync_cursor(request.query_params[self.sync_query_param])
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = self.get_serializer()
+        values_serializer = self.get_values_serializer(serializer)
+        queryset = self.get_queryset()
+        if values_serializer is not None:
+            queryset = queryset.values(
+                *dict.fromkeys(values_serializer.value_paths + ['updated_at', 'id'])
+            )
+
+        page = DeltaSyncService().get_changes(
+            queryset, since, self.paginator.get_page_size(request)
+        )
+        if values_serializer is not None:
+            changed = values_serializer.to_representation(page.rows)
+        else:
+            changed = [serializer.to_representation(instance) for instance in page.rows]
+
+        return Response({
+            'changed': changed,
+            'deleted': page.deleted_ids,
+            'reset': page.reset,
+            'has_more': page.has_more,
+            'cursor': encode_sync_cursor(page.cursor),
+        })
+
+    def get_values_serializer(self, serializer=None):
+        """목록 고속 직렬화기 (사용할 수 없으면 None)"""
+        if not self.fast_list_serialization:
+            return None
+        return ValuesSerializer.for_serializer(serializer or self.get_serializer())
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """
+        목록 데이터 파일 내보내기 (목록 API와 같은 필터/검색/정렬/fields 적용)
+
+        Query Params:
+            file_format: csv (기본값) | xlsx
+
+        Returns:
+            HTTP 200 OK: CSV 스트리밍 또는 XLSX 파일
+            HTTP 400 Bad Request: 지원하지 않는 형식 또는 잘못된 필터
+            HTTP 401 Unauthorized: 인증 실패
+        """
+        file_format = request.query_params.get('file_format', 'csv').lower()
+        if file_format not in self.export_formats:
+            return Response(
+                {
+                    'error': f'지원하지 않는 파일 형식입니다: {file_format}',
+                    'available_formats': list(self.export_formats),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = self.get_serializer()
+        columns = [name for name, field in serializer.fields.items() if not field.write_only]
+        exporter = DatasetExporter(columns)
+        items = self._iter_export_items(serializer)
+
+        if file_format == 'csv':
+            response = StreamingHttpResponse(
+                exporter.iter_csv(items), content_type='text/csv; charset=utf-8'
+            )
+        else:
+            response = FileResponse(
+                exporter.write_xlsx(items, sheet_title=self.basename),
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            )
+
+        filename = f"{self.basename}_{timezone.localdate():%Y%m%d}.{file_format}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def _iter_export_items(self, serializer):
+        """내보낼 행을 DB에서 chunk 단위로 읽어 직렬화하는 제너레이터"""
+        queryset = self.filter_queryset(self.get_queryset()).order_by(*self.get_keyset_ordering())
+        chunk_size = settings.DASHBOARD_EXPORT_CHUNK_SIZE
+
+        values_serializer = self.get_values_serializer(serializer)
+        if values_serializer is not None:
+            rows = queryset.values(*values_serializer.value_paths).iterator(chunk_size=chunk_size)
+            return values_serializer.iter_representation(rows)
+
+        return (
+            serializer.to_representation(instance)
+            for instance in queryset.iterator(chunk_size=chunk_size)
+        )
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_requested_fields()
+        if fields:
+            queryset = self._restrict_columns(queryset, fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields:
+            kwargs.setdefault('fields', fields)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_requested_fields(self):
+        """?fields= 로 요청한 출력 필드 목록 (지정하지 않았으면 None)"""
+        if hasattr(self, '_requested_fields'):
+            return self._requested_fields
+
+        raw = self.request.query_params.get(self.fields_query_param, '')
+        fields = None
+        if self.request.method == 'GET' and raw.strip():
+            fields = list(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+            available = self.get_serializer_class().Meta.fields
+            unknown = [name for name in fields if name not in available]
+            if unknown:
+                raise ValidationError({
+                    self.fields_query_param: f"알 수 없는 필드입니다: {', '.join(unknown)} (허용: {', '.join(available)})"
+                })
+
+        self._requested_fields = fields
+        return fields
+
+    def _restrict_columns(self, queryset, fields):
+        """
+        요청 필드의 source 경로만 조회하도록 컬럼과 JOIN 제한
+
+        예: department_name(source='department.name') -> select_related('department'), only('department__name')
+        커서 정렬 필드와 id는 항상 포함한다.
+        """
+        serializer_fields = self.get_serializer_class()().fields
+        model_fields = {field.name for field in queryset.model._meta.get_fields()}
+        columns = {'id'} | {order.lstrip('-') for order in self.get_keyset_ordering()}
+        related = set()
+
+        for name in fields:
+            parts = serializer_fields[name].source.split('.')
+            if parts[0] not in model_fields:
+                # 주석(annotate) 값은 get_queryset()에서 계산
+                continue
+            columns.add('__'.join(parts))
+            if len(parts) > 1:
+                related.add('__'.join(parts[:-1]))
+
+        queryset = queryset.select_related(None)
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*columns)
+
+    # 쓰기와 집계 갱신은 한 트랜잭션 (집계 갱신이 실패하면 쓰기도 취소되어 집계와 원본이 어긋나지 않음)
+
+    @transaction.atomic
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self._after_write(self._get_rollup_department_ids(serializer.instance))
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        department_ids = self._get_rollup_department_ids(serializer.instance)
+        super().perform_update(serializer)
+        department_ids |= self._get_rollup_department_ids(serializer.instance)
+        self._after_write(department_ids)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        department_ids = self._get_rollup_department_ids(instance)
+        # CASCADE로 함께 삭제되는 행까지 증분 동기화 삭제 기록을 남김
+        DeltaSyncService().delete(type(instance).objects.filter(pk=instance.pk))
+        self._after_write(department_ids)
+
+    def get_keyset_ordering(self) -> tuple:
+        """?ordering=필드 또는 -필드 (허용 필드만, id로 동순위 구분)"""
+        ordering = self.request.query_params.get('ordering', '').strip()
+        if not ordering:
+            return self.keyset_ordering
+
+        field = ordering.lstrip('-')
+        if field not in self.ordering_fields:
+            raise ValidationError({
+                'ordering': f"정렬할 수 없는 필드입니다: {field} (허용: {', '.join(self.ordering_fields)})"
+            })
+        direction = '-' if ordering.startswith('-') else ''
+        return (f'{direction}{field}', f'{direction}id')
+
+    def perform_bulk_delete(self, queryset) -> None:
+        DeltaSyncService().delete(queryset)
+
+    def after_bulk_write(self, instances: list) -> None:
+        department_ids = set()
+        for instance in instances:
+            department_ids |= self._get_rollup_department_ids(instance)
+        self._after_write(department_ids)
+
+    def _get_rollup_department_ids(self, instance) -> set:
+        """인스턴스가 영향을 주는 학과 ID"""
+        if not self.rollup_department_path:
+            return set()
+        value = instance
+        for attr in self.rollup_department_path.split('.'):
+            value = getattr(value, attr)
+        return {value}
+
+    def _after_write(self, department_ids: set) -> None:
+        """변경된 학과 집계 갱신 후 커밋 시점에 캐시 무효화"""
+        if department_ids:
+            DepartmentYearRollupService().refresh_departments(department_ids)
+        transaction.on_commit(lambda: bump_data_version(*self.cache_datasets))
+
+
+class CollegeViewSet(BaseDashboardViewSet):
     """단과대학 CRUD API"""
-    queryset = College.objects.all().order_by('-created_at')
+    queryset = College.objects.all().order_by('-created_at', '-id')
     serializer_class = CollegeSerializer
     permission_classes = [IsAuthenticatedViaSupabase]
+    ordering_fields = ('created_at', 'name')
+    search_fields = ('name',)
+    cache_datasets = ('departments', 'kpis')
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(BaseDashboardViewSet):
     """학과 CRUD API"""
-    queryset = Department.objects.select_related('college').all().order_by('-created_at')
+    queryset = Department.objects.select_related('college').all().order_by('-created_at', '-id')
     serializer_class = DepartmentSerializer
     permission_classes = [IsAuthenticatedViaSupabase]
+    filter_params = {
+        'college': ('college_id', parse_int),
+    }
+    search_fields = ('name',)
+    cache_datasets = ('departments', 'kpis')
 
 
-class StudentViewSet(viewsets.ModelViewSet):
+class StudentViewSet(BaseDashboardViewSet):
     """학생 CRUD API"""
-    queryset = Student.objects.select_related('department__college').all().order_by('-created_at')
+    queryset = Student.objects.select_related('department__college').all().order_by('-created_at', '-id')
     serializer_class = StudentSerializer
     permission_classes = [IsAuthenticatedViaSupabase]
+    ordering_fields = ('created_at', 'student_id_number')
+    filter_params = {
+        'department': ('department_id', parse_int),
+        'college': ('department__college_id', parse_int),
+        'status': ('status', parse_str),
+        'program_level': ('program_level', parse_str),
+        'admission_year': ('admission_year', parse_int),
+    }
+    search_fields = ('name', 'student_id_number')
+    cache_datasets = ('students',)
+    rollup_department_path = 'department_id'
 
 
-class DepartmentKPIViewSet(viewsets.ModelViewSet):
+class DepartmentKPIViewSet(BaseDashboardViewSet):
     """학과 KPI CRUD API"""
-    queryset = DepartmentKPI.objects.select_related('department').all().order_by('-evaluation_year', '-created_at')
+    queryset = DepartmentKPI.objects.select_related('department').all().order_by('-evaluation_year', '-id')
     serializer_class = DepartmentKPISerializer
     permission_classes = [IsAuthenticatedViaSupabase]
+    keyset_ordering = ('-evaluation_year', '-id')
+    ordering_fields = ('evaluation_year',)
+    filter_params = {
+        'department': ('department_id', parse_int),
+        'college': ('department__college_id', parse_int),
+        'evaluation_year': ('evaluation_year', parse_int),
+    }
+    cache_datasets = ('kpis',)
 
 
-class PublicationViewSet(viewsets.ModelViewSet):
+class PublicationViewSet(BaseDashboardViewSet):
     """논문 CRUD API"""
-    queryset = Publication.objects.select_related('department').all().order_by('-publication_date')
+    queryset = Publication.objects.select_related('department').all().order_by('-publication_date', '-id')
     serializer_class = PublicationSerializer
     permission_classes = [IsAuthenticatedViaSupabase]
+    keyset_ordering = ('-publication_date', '-id')
+    ordering_fields = ('publication_date',)
+    filter_params = {
+        'department': ('department_id', parse_int),
+        'college': ('department__college_id', parse_int),
+        'journal_rank': ('journal_rank', parse_str),
+        'date_from': ('publication_date__gte', parse_date),
+        'date_to': ('publication_date__lte', parse_date),
+    }
+    search_fields = ('title',)
+    cache_datasets = ('publications',)
+    rollup_department_path = 'department_id'
+
+    @action(detail=False, methods=['get'], url_path='search')
+    def full_text_search(self, request):
+        """
+        논문 전문 검색 (제목/저널명/저자, 관련도 순)
+
+        Query Params:
+            q: 검색어 (공백 구분, 모든 단어 포함, 단어별 접두어 일치)
+            limit: 최대 결과 수 (기본값: 20, 최대 100)
+            department: 학과 ID
+
+        Returns:
+            HTTP 200 OK: {'query', 'results': [논문 + rank + highlight]}
+            HTTP 400 Bad Request: 검색어 또는 파라미터 오류
+            HTTP 401 Unauthorized: 인증 실패
+            HTTP 500 Internal Server Error: 서버 오류
+            HTTP 501 Not Implemented: 전문 검색을 지원하지 않는 DB 또는 색인 미설정
+        """
+        query = request.query_params.get('q', '')
+        try:
+            limit = int(request.query_params.get('limit', 20))
+            department = request.query_params.get('department')
+            department_id = int(department) if department else None
+        except ValueError:
+            return Response(
+                {'error': 'limit과 department는 정수여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            matches = PublicationSearchService().search(query, limit=limit, department_id=department_id)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except NotSupportedError as e:
+            logger.warning(f"Publication search unavailable: {str(e)}")
+            return Response({'error': str(e)}, status=status.HTTP_501_NOT_IMPLEMENTED)
+        except Exception as e:
+            logger.error(f"Publication search failed: {str(e)}", exc_info=True)
+            return Response(
+                {'error': '검색 중 오류가 발생했습니다.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        publications = self.get_queryset().in_bulk([match['id'] for match in matches])
+        results = []
+        for match in matches:
+            publication = publications.get(match['id'])
+            if publication is None:
+                continue
+            item = self.get_serializer(publication).data
+            item['rank'] = match['rank']
+            item['highlight'] = match['highlight']
+            results.append(item)
+
+        return Response({'query': query, 'results': results})
+
+    @action(detail=False, methods=['get'], url_path='impact')
+    def impact(self, request):
+        """
+        학과 × 연도별 Impact Factor 분석 (건수/합계/평균/백분위, 저널 등급 분포,
+        과제 연계 비율, 저널 순위)
+
+        Query Params:
+            department: 학과 ID
+            college: 단과대학 ID
+            year_from: 시작 연도
+            year_to: 종료 연도
+            top_journals: 학과 × 연도별 저널 순위 수 (기본값: 5, 최대 20)
+
+        Returns:
+            HTTP 200 OK: {'percentiles', 'results'}
+            HTTP 400 Bad Request: 파라미터 오류
+            HTTP 401 Unauthorized: 인증 실패
+            HTTP 500 Internal Server Error: 서버 오류
+        """
+        params = {}
+        for param in ('department', 'college', 'year_from', 'year_to', 'top_journals'):
+            raw = request.query_params.get(param)
+            if raw in (None, ''):
+                continue
+            try:
+                params[param] = int(raw)
+            except ValueError:
+                return Response(
+                    {'error': f'{param}는 정수여야 합니다.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        try:
+            analytics = PublicationImpactService().generate_impact_analytics(
+                department_id=params.get('department'),
+                college_id=params.get('college'),
+                year_from=params.get('year_from'),
+                year_to=params.get('year_to'),
+                top_journals=params.get('top_journals', 5),
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Publication impact analytics failed: {str(e)}", exc_info=True)
+            return Response(
+                {'error': '데이터를 불러오는 중 오류가 발생했습니다.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return Response(analytics, status=status.HTTP_200_OK)
 
 
-class ResearchProjectViewSet(viewsets.ModelViewSet):
+class ResearchProjectViewSet(BaseDashboardViewSet):
     """연구과제 CRUD API"""
-    queryset = ResearchProject.objects.select_related('department').all().order_by('-created_at')
+    queryset = ResearchProject.objects.select_related('department').all().order_by('-created_at', '-id')
     serializer_class = ResearchProjectSerializer
     permission_classes = [IsAuthenticatedViaSupabase]
+    ordering_fields = ('created_at', 'project_number')
+    filter_params = {
+        'department': ('department_id', parse_int),
+        'college': ('department__college_id', parse_int),
+    }
+    search_fields = ('name', 'project_number')
+    cache_datasets = ('projects', 'expenses')
+    rollup_department_path = 'department_id'
+    # /projects/{id}/expenses/ 필터 및 커서 정렬
+    expense_filter_params = {
+        'status': ('status', parse_str),
+        'date_from': ('execution_date__gte', parse_date),
+        'date_to': ('execution_date__lte', parse_date),
+    }
+    expense_keyset_ordering = ('-execution_date', '-id')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method == 'GET':
+            # 집행/처리중/잔액/집행률을 목록 쿼리 하나에서 함께 계산
+            queryset = ResearchProjectRepository().with_expense_totals(queryset)
+        return queryset
+
+    @action(detail=True, methods=['get'], url_path='expenses')
+    def expenses(self, request, pk=None):
+        """
+        과제 집행 내역 목록 (키셋 페이지네이션)
 
+        Query Params:
+            status: 집행 상태
+            date_from: 집행일 시작 (YYYY-MM-DD)
+            date_to: 집행일 종료 (YYYY-MM-DD)
+            cursor: 다음 페이지 커서
+            page_size: 페이지 크기
 
-class ProjectExpenseViewSet(viewsets.ModelViewSet):
+        Returns:
+            HTTP 200 OK: {'next', 'next_cursor', 'results'}
+            HTTP 400 Bad Request: 잘못된 필터 또는 커서
+            HTTP 401 Unauthorized: 인증 실패
+            HTTP 404 Not Found: 과제 없음
+        """
+        try:
+            project_id = int(pk)
+        except ValueError:
+            raise NotFound()
+        if not ResearchProject.objects.filter(pk=project_id).exists():
+            raise NotFound()
+
+        conditions, errors = parse_filter_params(self.expense_filter_params, request.query_params)
+        if errors:
+            raise ValidationError(errors)
+
+        values_serializer = ValuesSerializer.for_serializer(ProjectExpenseSerializer())
+        ordering_fields = [order.lstrip('-') for order in self.expense_keyset_ordering]
+        queryset = ProjectExpenseRepository().get_queryset_by_project(project_id, conditions).values(
+            *dict.fromkeys(values_serializer.value_paths + ordering_fields)
+        )
+
+        paginator = KeysetPagination()
+        paginator.ordering = self.expense_keyset_ordering
+        page = paginator.paginate_queryset(queryset, request)
+        return paginator.get_paginated_response(values_serializer.to_representation(page))
+
+
+class ProjectExpenseViewSet(BaseDashboardViewSet):
     """과제집행내역 CRUD API"""
-    queryset = ProjectExpense.objects.select_related('project__department').all().order_by('-execution_date')
+    queryset = ProjectExpense.objects.select_related('project__department').all().order_by('-execution_date', '-id')
     serializer_class = ProjectExpenseSerializer
     permission_classes = [IsAuthenticatedViaSupabase]
+    keyset_ordering = ('-execution_date', '-id')
+    ordering_fields = ('execution_date',)
+    filter_params = {
+        'project': ('project_id', parse_int),
+        'department': ('project__department_id', parse_int),
+        'college': ('project__department__college_id', parse_int),
+        'status': ('status', parse_str),
+        'date_from': ('execution_date__gte', parse_date),
+        'date_to': ('execution_date__lte', parse_date),
+    }
+    search_fields = ('item',)
+    cache_datasets = ('expenses',)
+    rollup_department_path = 'project.department_id'
 
 
 # ============= Dashboard Views =============
 
-class DashboardSummaryView(APIView):
+def _parse_summary_sections(query_params):
+    """
+    ?sections= 파라미터 파싱
+
+    Returns:
+        (요청 섹션 목록 (생략 시 None = 전체), 알 수 없는 섹션이 있으면 400 응답 본문 아니면 None)
+    """
+    sections = [
+        name.strip()
+        for name in query_params.get('sections', '').split(',')
+        if name.strip()
+    ]
+    unknown = [name for name in sections if name not in SECTION_NAMES]
+    if unknown:
+        return None, {
+            'error': f"알 수 없는 섹션입니다: {', '.join(unknown)}",
+            'available_sections': list(SECTION_NAMES),
+        }
+    return sections or None, None
+
+
+def _build_dashboard_summary(sections):
+    """요약 데이터 계산 후 응답 Serializer로 검증한 데이터 반환"""
+    summary_data = DashboardSummaryService().generate_dashboard_summary(sections=sections)
+
+    serializer = DashboardSummarySerializer(data=summary_data)
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+class DashboardSummaryView(ReplicaReadMixin, APIView):
     """대시보드 요약 데이터 조회 API"""
 
     permission_classes = [IsAuthenticatedViaSupabase]
@@ -82,24 +646,308 @@ class DashboardSummaryView(APIView):
         """
         대시보드 요약 데이터 반환
 
+        Query Params:
+            sections: 계산할 섹션 목록 (쉼표 구분, 예: budget_execution,publications_by_year)
+                      생략 시 전체 섹션
+
         Returns:
             HTTP 200 OK: 대시보드 데이터
+            HTTP 400 Bad Request: 알 수 없는 섹션
             HTTP 401 Unauthorized: 인증 실패
             HTTP 500 Internal Server Error: 서버 오류
         """
+        sections, error = _parse_summary_sections(request.query_params)
+        if error is not None:
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
         try:
-            service = DashboardSummaryService()
-            summary_data = service.generate_dashboard_summary()
+            return Response(_build_dashboard_summary(sections), status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logger.error(f"Dashboard summary generation failed: {str(e)}", exc_info=True)
+
+            return Response(
+                {'error': '데이터를 불러오는 중 오류가 발생했습니다.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class ExpenseBurnDownView(ReplicaReadMixin, APIView):
+    """연구비 월별 번다운 시계열 조회 API"""
+
+    permission_classes = [IsAuthenticatedViaSupabase]
+
+    def get(self, request):
+        """
+        과제 또는 학과 단위 월별 집행/누적 집행 금액 반환
+
+        Query Params:
+            project_id: 연구 과제 ID
+            department_id: 학과 ID (project_id와 함께 사용할 수 없음)
+
+        Returns:
+            HTTP 200 OK: 번다운 데이터
+            HTTP 400 Bad Request: 조회 조건 오류
+            HTTP 401 Unauthorized: 인증 실패
+            HTTP 500 Internal Server Error: 서버 오류
+        """
+        try:
+            project_id = self._parse_id(request.query_params.get('project_id'))
+            department_id = self._parse_id(request.query_params.get('department_id'))
+        except ValueError:
+            return Response(
+                {'error': 'project_id와 department_id는 정수여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if (project_id is None) == (department_id is None):
+            return Response(
+                {'error': 'project_id 또는 department_id 중 하나만 지정해야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-            serializer = DashboardSummarySerializer(data=summary_data)
-            serializer.is_valid(raise_exception=True)
+        try:
+            service = ExpenseBurnDownService()
+            burn_down = service.generate_burn_down(
+                project_id=project_id, department_id=department_id
+            )
 
-            return Response(serializer.validated_data, status=status.HTTP_200_OK)
+            serializer = BurnDownSerializer(burn_down)
+            return Response(serializer.data, status=status.HTTP_200_OK)
 
         except Exception as e:
-            logger.error(f"Dashboard summary generation failed: {str(e)}", exc_info=True)
+            logger.error(f"Expense burn-down generation failed: {str(e)}", exc_info=True)
+
+            return Response(
+                {'error': '데이터를 불러오는 중 오류가 발생했습니다.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @staticmethod
+    def _parse_id(value):
+        """쿼리 파라미터를 정수 ID로 변환 (없으면 None)"""
+        if value in (None, ''):
+            return None
+        return int(value)
+
+
+class AggregateView(ReplicaReadMixin, APIView):
+    """허용 목록 기반 범용 집계 API (차트용 GROUP BY 집계)"""
+
+    permission_classes = [IsAuthenticatedViaSupabase]
+
+    # 집계 조건 외의 파라미터는 모두 필터로 취급
+    reserved_params = ('dataset', 'group_by', 'metric')
+
+    def get(self, request):
+        """
+        데이터셋을 그룹 기준별로 집계
+
+        Query Params:
+            dataset: 데이터셋 (students, kpis, publications, projects, expenses)
+            group_by: 그룹 기준 (쉼표 구분, 예: department,status), 생략 시 전체 합계
+            metric: 지표 (쉼표 구분, 예: count,sum_amount), 기본값: count
+            그 외: 데이터셋별 허용 필터 (예: college=1, date_from=2024-01-01)
+
+        Returns:
+            HTTP 200 OK: {'dataset', 'group_by', 'metrics', 'rows', 'truncated'}
+            HTTP 400 Bad Request: 허용되지 않은 데이터셋/그룹 기준/지표/필터
+            HTTP 401 Unauthorized: 인증 실패
+            HTTP 500 Internal Server Error: 서버 오류
+        """
+        service = AggregationService()
+        dataset = request.query_params.get('dataset', '')
+        try:
+            spec = service.get_dataset(dataset)
+        except ValueError as e:
+            return Response(
+                {'error': str(e), 'available_datasets': list(AGGREGATE_DATASET_NAMES)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        group_by = self._split(request.query_params.get('group_by', ''))
+        metrics = self._split(request.query_params.get('metric', '')) or ['count']
+        filters = {
+            param: value
+            for param, value in request.query_params.items()
+            if param not in self.reserved_params
+        }
+
+        try:
+            result = service.aggregate(dataset, group_by=group_by, metrics=metrics, filters=filters)
+        except ValueError as e:
+            return Response(
+                {
+                    'error': str(e),
+                    'available_group_by': list(spec.group_by),
+                    'available_metrics': list(spec.metrics),
+                    'available_filters': list(spec.filters),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as e:
+            logger.error(f"Aggregation failed: {str(e)}", exc_info=True)
 
             return Response(
                 {'error': '데이터를 불러오는 중 오류가 발생했습니다.'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+        return Response(result, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _split(value):
+        """쉼표 구분 파라미터 -> 이름 목록"""
+        return [name.strip() for name in value.split(',') if name.strip()]
+
+
+class SlowQueryLogView(APIView):
+    """Repository 느린 쿼리/메서드 통계 조회 API (관리자 전용, 현재 워커 프로세스 기준)"""
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        """
+        최근 느린 쿼리(실행 계획 포함)와 Repository 메서드별 누적 시간
+
+        Returns:
+            HTTP 200 OK: {'enabled', 'threshold_ms', 'slow_queries', 'methods'}
+            HTTP 403 Forbidden: 관리자가 아님
+        """
+        return Response({
+            'enabled': settings.REPOSITORY_INSTRUMENTATION_ENABLED,
+            'threshold_ms': settings.REPOSITORY_SLOW_QUERY_MS,
+            'slow_queries': slow_query_log.entries(),
+            'methods': method_stats.top(),
+        }, status=status.HTTP_200_OK)
+
+    def delete(self, request):
+        """느린 쿼리 기록과 메서드 통계 초기화"""
+        slow_query_log.clear()
+        method_stats.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ============= Async (ASGI) Views =============
+
+class AsyncDashboardSummaryView(AsyncAPIView):
+    """
+    대시보드 요약 데이터 조회 API (비동기, ASGI 서버용 /async/ 경로)
+
+    DashboardSummaryView와 같은 응답을 반환한다. 섹션 계산은 캐시와 집계 테이블 갱신을 포함한
+    동기 서비스이므로 sync_to_async로 실행하며, 그동안 이벤트 루프는 다른 요청을 처리한다.
+    """
+
+    permission_classes = [IsAuthenticatedViaSupabase]
+
+    async def get(self, request):
+        """
+        대시보드 요약 데이터 반환
+
+        Query Params:
+            sections: 계산할 섹션 목록 (쉼표 구분, 생략 시 전체 섹션)
+
+        Returns:
+            HTTP 200 OK: 대시보드 데이터
+            HTTP 400 Bad Request: 알 수 없는 섹션
+            HTTP 403 Forbidden: 인증 실패
+            HTTP 500 Internal Server Error: 서버 오류
+        """
+        sections, error = _parse_summary_sections(request.GET)
+        if error is not None:
+            return self.render(error, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            summary_data = await sync_to_async(_build_dashboard_summary)(sections)
+            return self.render(summary_data, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logger.error(f"Async dashboard summary generation failed: {str(e)}", exc_info=True)
+
+            return self.render(
+                {'error': '데이터를 불러오는 중 오류가 발생했습니다.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class AsyncDashboardReadView(AsyncAPIView):
+    """
+    대시보드 데이터 목록/상세 조회 API (비동기, ASGI 서버용 /async/ 경로)
+
+    viewset_class(BaseDashboardViewSet 하위 클래스)의 권한, 필터/검색/정렬, ?fields=,
+    키셋 페이지네이션, 고속 직렬화(values) 설정을 그대로 사용하고 조회만 Django 비동기 ORM으로
+    실행하므로 응답은 동기 목록/상세 API와 같다. 고속 직렬화를 사용할 수 없는 ViewSet과
+    ?since= 증분 동기화는 ViewSet의 동기 action을 sync_to_async로 실행한다.
+    """
+
+    viewset_class = None
+    basename = None
+
+    def get_permissions(self) -> list:
+        return [permission() for permission in self.viewset_class.permission_classes]
+
+    async def get(self, request, pk=None):
+        """
+        pk가 없으면 목록(list), 있으면 상세(retrieve)
+
+        Returns:
+            HTTP 200 OK: 목록 {'next', 'next_cursor', 'results'} 또는 상세 데이터
+            HTTP 400 Bad Request: 잘못된 필터 또는 fields
+            HTTP 403 Forbidden: 인증 실패
+            HTTP 404 Not Found: 잘못된 커서 또는 데이터 없음
+        """
+        viewset = self.get_viewset(request, 'list' if pk is None else 'retrieve', pk)
+        if pk is None:
+            return await self.list(viewset)
+        return await self.retrieve(viewset, pk)
+
+    def get_viewset(self, request, action: str, pk=None):
+        """쿼리 구성과 직렬화 설정에 사용할 ViewSet 인스턴스 (DRF Request 포함, dispatch하지 않음)"""
+        kwargs = {} if pk is None else {'pk': pk}
+        viewset = self.viewset_class(
+            action_map={'get': action},
+            basename=self.basename,
+            detail=pk is not None,
+            args=(),
+            kwargs=kwargs,
+            format_kwarg=None,
+        )
+        viewset.request = viewset.initialize_request(request, **kwargs)
+        return viewset
+
+    async def list(self, viewset):
+        request = viewset.request
+        if viewset.sync_query_param in request.query_params:
+            return await self.run_sync_action(viewset)
+
+        values_serializer = viewset.get_values_serializer()
+        if values_serializer is None:
+            return await self.run_sync_action(viewset)
+
+        queryset = viewset.get_list_values_queryset(values_serializer)
+        paginator = viewset.paginator
+        if paginator is None:
+            rows = [row async for row in queryset]
+            return self.render(values_serializer.to_representation(rows))
+
+        page = await paginator.apaginate_queryset(queryset, request, view=viewset)
+        return self.render(
+            paginator.get_paginated_response(values_serializer.to_representation(page)).data
+        )
+
+    async def retrieve(self, viewset, pk):
+        values_serializer = viewset.get_values_serializer()
+        if values_serializer is None:
+            return await self.run_sync_action(viewset, pk=pk)
+
+        queryset = viewset.filter_queryset(viewset.get_queryset()).values(*values_serializer.value_paths)
+        try:
+            row = await queryset.aget(pk=pk)
+        except (ObjectDoesNotExist, TypeError, ValueError, DjangoValidationError):
+            raise NotFound()
+        return self.render(values_serializer.to_representation([row])[0])
+
+    async def run_sync_action(self, viewset, **kwargs):
+        """ViewSet의 동기 action(list/retrieve)을 스레드에서 실행"""
+        response = await sync_to_async(getattr(viewset, viewset.action))(viewset.request, **kwargs)
+        return self.render(response.data, status=response.status_code)
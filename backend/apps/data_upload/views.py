@@ -11,6 +11,7 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from django.core.files.uploadedfile import UploadedFile
 from rest_framework.exceptions import ValidationError
 
+from apps.core.db_routing import ReplicaReadMixin
 from apps.users.permissions import IsAdmin
 from apps.dashboard.services.excel_importer import ExcelImportService
 from .serializers import FileUploadSerializer, MultipleFileUploadSerializer
@@ -18,7 +19,7 @@ from .serializers import FileUploadSerializer, MultipleFileUploadSerializer
 logger = logging.getLogger(__name__)
 
 
-class DataUploadView(APIView):
+class DataUploadView(ReplicaReadMixin, APIView):
     """
     데이터 업로드 API
 
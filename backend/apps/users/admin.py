@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Profile
+from .profile_cache import invalidate_profile
 
 
 @admin.register(Profile)
@@ -7,3 +8,19 @@ class ProfileAdmin(admin.ModelAdmin):
     list_display = ['id', 'email', 'username', 'role', 'created_at']
     list_filter = ['role']
     search_fields = ['email', 'username']
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # 역할 변경이 인증 캐시에 바로 반영되도록 제거
+        invalidate_profile(obj.pk)
+
+    def delete_model(self, request, obj):
+        user_id = obj.pk
+        super().delete_model(request, obj)
+        invalidate_profile(user_id)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = list(queryset.values_list('pk', flat=True))
+        super().delete_queryset(request, queryset)
+        for user_id in user_ids:
+            invalidate_profile(user_id)
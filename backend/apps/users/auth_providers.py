@@ -0,0 +1,180 @@
+"""
+로그인 인증 제공자
+
+LoginView/LogoutView는 AUTH_PROVIDER 설정으로 선택한 제공자를 통해 인증한다.
+- supabase: Supabase Auth (운영 기본값, 네트워크 호출)
+- local: Django 사용자 계정(auth_user)의 비밀번호로 검증하고 Supabase와 같은 claims의
+  HS256 토큰을 SUPABASE_JWT_SECRET으로 직접 발급 (네트워크 없는 부하 테스트/성능 CI용)
+
+두 제공자가 발급한 토큰 모두 SupabaseAuthMiddleware가 같은 방식으로 검증한다.
+"""
+import secrets
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Type
+
+import jwt
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+from .models import Profile
+
+
+# local 제공자의 프로필이 없는 사용자 ID 생성용 네임스페이스 (이메일 -> 고정 UUID)
+LOCAL_USER_NAMESPACE = uuid.UUID('6f1c1d3e-8a4b-4c57-9a43-52a1f1b0c0de')
+
+
+class AuthProviderNotConfigured(Exception):
+    """인증 제공자 설정(URL/키/JWT Secret)이 없어 인증할 수 없음"""
+
+
+@dataclass
+class AuthResult:
+    """로그인 성공 결과"""
+    user_id: str
+    email: str
+    access_token: str
+    refresh_token: str
+
+
+@lru_cache(maxsize=None)
+def get_supabase_client():
+    """
+    Supabase 클라이언트 (로그인/로그아웃 첫 요청 시 생성 후 재사용)
+
+    supabase 패키지 import와 클라이언트 생성 비용을 워커 부팅 시점이 아니라
+    인증 API를 처음 호출할 때 부담한다. 설정이 없으면 None.
+    """
+    if not (settings.SUPABASE_URL and settings.SUPABASE_KEY):
+        return None
+
+    from supabase import create_client
+    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+
+
+class BaseAuthProvider:
+    """인증 제공자 인터페이스"""
+
+    name = ''
+
+    def sign_in(self, email: str, password: str) -> Optional[AuthResult]:
+        """
+        이메일/비밀번호 인증
+
+        Returns:
+            AuthResult, 자격 증명이 일치하지 않으면 None
+
+        Raises:
+            AuthProviderNotConfigured: 제공자 설정 누락
+        """
+        raise NotImplementedError
+
+    def sign_out(self, access_token: str) -> None:
+        """로그아웃 (토큰 캐시 폐기는 호출한 쪽에서 처리)"""
+
+
+class SupabaseAuthProvider(BaseAuthProvider):
+    """Supabase Auth 제공자"""
+
+    name = 'supabase'
+
+    def sign_in(self, email: str, password: str) -> Optional[AuthResult]:
+        client = get_supabase_client()
+        if client is None:
+            raise AuthProviderNotConfigured('SUPABASE_URL/SUPABASE_KEY가 설정되지 않았습니다.')
+
+        auth_response = client.auth.sign_in_with_password({
+            "email": email,
+            "password": password
+        })
+        if not auth_response.user:
+            return None
+
+        return AuthResult(
+            user_id=str(auth_response.user.id),
+            email=auth_response.user.email,
+            access_token=auth_response.session.access_token,
+            refresh_token=auth_response.session.refresh_token,
+        )
+
+    def sign_out(self, access_token: str) -> None:
+        client = get_supabase_client()
+        if client:
+            client.auth.sign_out()
+
+
+class LocalAuthProvider(BaseAuthProvider):
+    """
+    로컬 인증 제공자 (부하 테스트/오프라인 개발용)
+
+    Django 사용자 계정(이메일 기준)의 비밀번호를 검증하고, 사용자 ID는 같은 이메일의
+    Profile ID(없으면 이메일로 만든 고정 UUID)를 사용한다. 토큰 유효 시간은 AUTH_LOCAL_TOKEN_TTL.
+    """
+
+    name = 'local'
+
+    def sign_in(self, email: str, password: str) -> Optional[AuthResult]:
+        jwt_secret = self._jwt_secret()
+
+        user = get_user_model().objects.filter(email__iexact=email, is_active=True).first()
+        if user is None or not user.check_password(password):
+            return None
+
+        email = user.email
+        profile_id = Profile.objects.filter(email=email).values_list('id', flat=True).first()
+        user_id = str(profile_id or uuid.uuid5(LOCAL_USER_NAMESPACE, email.lower()))
+
+        return AuthResult(
+            user_id=user_id,
+            email=email,
+            access_token=self.issue_token(user_id, email, jwt_secret),
+            refresh_token=secrets.token_urlsafe(32),
+        )
+
+    def issue_token(self, user_id: str, email: str, jwt_secret: Optional[str] = None) -> str:
+        """Supabase access token과 같은 claims의 HS256 토큰 발급"""
+        jwt_secret = jwt_secret or self._jwt_secret()
+        issued_at = int(time.time())
+        claims = {
+            'aud': 'authenticated',
+            'exp': issued_at + settings.AUTH_LOCAL_TOKEN_TTL,
+            'iat': issued_at,
+            'iss': f'{settings.SUPABASE_URL.rstrip("/")}/auth/v1' if settings.SUPABASE_URL else 'local',
+            'sub': str(user_id),
+            'email': email,
+            'phone': '',
+            'app_metadata': {'provider': 'email', 'providers': ['email']},
+            'user_metadata': {},
+            'role': 'authenticated',
+            'aal': 'aal1',
+            'amr': [{'method': 'password', 'timestamp': issued_at}],
+            'session_id': str(uuid.uuid4()),
+            'is_anonymous': False,
+        }
+        return jwt.encode(claims, jwt_secret, algorithm='HS256')
+
+    @staticmethod
+    def _jwt_secret() -> str:
+        jwt_secret = settings.SUPABASE_JWT_SECRET
+        if not jwt_secret or jwt_secret == 'your-jwt-secret-here':
+            raise AuthProviderNotConfigured('SUPABASE_JWT_SECRET이 설정되지 않았습니다.')
+        return jwt_secret
+
+
+AUTH_PROVIDERS: Dict[str, Type[BaseAuthProvider]] = {
+    SupabaseAuthProvider.name: SupabaseAuthProvider,
+    LocalAuthProvider.name: LocalAuthProvider,
+}
+
+
+def get_auth_provider() -> BaseAuthProvider:
+    """AUTH_PROVIDER 설정의 인증 제공자"""
+    try:
+        provider_class = AUTH_PROVIDERS[settings.AUTH_PROVIDER]
+    except KeyError:
+        raise AuthProviderNotConfigured(
+            f"알 수 없는 AUTH_PROVIDER: {settings.AUTH_PROVIDER} (사용 가능: {', '.join(AUTH_PROVIDERS)})"
+        )
+    return provider_class()
@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.security, deploy=True)
+def check_local_auth_provider(app_configs, **kwargs):
+    """운영 배포에서 local 인증 제공자 사용 경고 (manage.py check --deploy)"""
+    if settings.AUTH_PROVIDER == 'local':
+        return [
+            Warning(
+                'AUTH_PROVIDER=local은 Supabase 대신 Django 계정으로 토큰을 발급합니다.',
+                hint='부하 테스트/성능 CI 환경에서만 사용하고 운영 환경에서는 supabase를 사용하세요.',
+                id='users.W001',
+            )
+        ]
+    return []
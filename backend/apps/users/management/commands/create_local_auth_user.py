@@ -0,0 +1,41 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.users.auth_providers import LocalAuthProvider
+from apps.users.models import Profile, UserRole
+from apps.users.profile_cache import invalidate_profile
+
+
+class Command(BaseCommand):
+    help = 'local 인증 제공자(AUTH_PROVIDER=local)용 로그인 계정과 프로필을 생성/갱신합니다. (부하 테스트/성능 CI용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('email', help='로그인 이메일')
+        parser.add_argument('--password', required=True, help='로그인 비밀번호')
+        parser.add_argument('--role', choices=UserRole.values, default=UserRole.GENERAL, help='프로필 역할 (기본 general)')
+        parser.add_argument('--print-token', action='store_true', help='로그인 없이 사용할 access token 출력')
+
+    def handle(self, *args, **options):
+        email = options['email']
+
+        with transaction.atomic():
+            user, _ = get_user_model().objects.get_or_create(username=email, defaults={'email': email})
+            user.email = email
+            user.is_active = True
+            user.set_password(options['password'])
+            user.save()
+
+            profile, _ = Profile.objects.get_or_create(
+                email=email,
+                defaults={'username': email.split('@')[0]}
+            )
+            profile.role = options['role']
+            profile.save(update_fields=['role'])
+
+        # 역할이 바뀐 경우 인증 프로필 캐시 제거
+        invalidate_profile(profile.id)
+
+        self.stdout.write(self.style.SUCCESS(f'✅ local 인증 계정 준비 완료: {email} ({profile.role}, {profile.id})'))
+        if options['print_token']:
+            self.stdout.write(LocalAuthProvider().issue_token(str(profile.id), email))
@@ -1,72 +1,100 @@
+import time
+
 import jwt
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.http import JsonResponse
-from .models import Profile
-
+from apps.core.instrumentation import timed
+from apps.core.middleware import AsyncCapableMiddleware, is_api_request
+from .profile_cache import profile_cache
+from .repositories import ProfileRepository
+from .token_cache import token_cache
 
-class SupabaseAuthMiddleware:
-    """JWT 토큰 검증 및 사용자 정보 추출"""
 
-    def __init__(self, get_response):
-        self.get_response = get_response
+class SupabaseAuthMiddleware(AsyncCapableMiddleware):
+    """JWT 토큰 검증 및 사용자 정보 추출 (ASGI에서는 비동기로 동작)"""
 
     def __call__(self, request):
-        # Authorization 헤더에서 JWT 토큰 추출
-        auth_header = request.META.get('HTTP_AUTHORIZATION', '')
-
-        if auth_header.startswith('Bearer '):
-            token = auth_header.split(' ')[1]
-
-            try:
-                # JWT 토큰 디코드 (Supabase JWT Secret 사용)
-                jwt_secret = settings.SUPABASE_JWT_SECRET
-
-                if not jwt_secret or jwt_secret == 'your-jwt-secret-here':
-                    print("⚠️  SUPABASE_JWT_SECRET이 설정되지 않았습니다.")
-                    print("   Supabase Dashboard > Settings > API > JWT Settings에서 JWT Secret을 확인하세요.")
-                    request.is_authenticated = False
-                    request.user_profile = None
-                    response = self.get_response(request)
-                    return response
-
-                decoded = jwt.decode(
-                    token,
-                    jwt_secret,
-                    algorithms=['HS256'],
-                    options={'verify_aud': False},
-                    leeway=10  # 10초의 시간 여유 허용 (시간 동기화 문제 대응)
-                )
-
-                user_id = decoded.get('sub')
-                user_email = decoded.get('email')
-
-                # 프로필 조회 또는 생성
-                profile, created = Profile.objects.get_or_create(
-                    id=user_id,
-                    defaults={'email': user_email}
-                )
-
-                # request에 사용자 정보 저장
-                request.user_profile = profile
-                request.is_authenticated = True
-
-            except jwt.ExpiredSignatureError:
-                print("⚠️  JWT 토큰이 만료되었습니다.")
-                request.is_authenticated = False
-                request.user_profile = None
-            except jwt.InvalidTokenError as e:
-                print(f"⚠️  유효하지 않은 JWT 토큰: {e}")
-                request.is_authenticated = False
-                request.user_profile = None
-            except Exception as e:
-                print(f"❌ Auth middleware error: {e}")
-                import traceback
-                traceback.print_exc()
-                request.is_authenticated = False
-                request.user_profile = None
-        else:
-            request.is_authenticated = False
-            request.user_profile = None
+        if self.async_mode:
+            return self.__acall__(request)
+
+        with timed('auth'):
+            self._authenticate(request)
 
         response = self.get_response(request)
         return response
+
+    async def __acall__(self, request):
+        with timed('auth'):
+            # 프로필 캐시 미스 시 DB 조회(get_or_create)가 있으므로 스레드에서 실행
+            await sync_to_async(self._authenticate)(request)
+
+        return await self.get_response(request)
+
+    def _authenticate(self, request):
+        """Bearer 토큰 검증 후 request.is_authenticated / request.user_profile 설정"""
+        request.is_authenticated = False
+        request.user_profile = None
+
+        # Authorization 헤더에서 JWT 토큰 추출 (API 외 경로는 JWT/프로필 조회 생략)
+        auth_header = request.META.get('HTTP_AUTHORIZATION', '') if is_api_request(request) else ''
+        if not auth_header.startswith('Bearer '):
+            return
+
+        token = auth_header.split(' ')[1]
+
+        try:
+            # JWT 토큰 디코드 (Supabase JWT Secret 사용)
+            jwt_secret = settings.SUPABASE_JWT_SECRET
+
+            if not jwt_secret or jwt_secret == 'your-jwt-secret-here':
+                print("⚠️  SUPABASE_JWT_SECRET이 설정되지 않았습니다.")
+                print("   Supabase Dashboard > Settings > API > JWT Settings에서 JWT Secret을 확인하세요.")
+                return
+
+            decoded = self._verify_token(token, jwt_secret)
+
+            user_id = decoded.get('sub')
+            user_email = decoded.get('email')
+
+            # 프로필 조회 또는 생성 (캐시 미스일 때만 DB 조회)
+            profile = profile_cache.get_or_load(
+                user_id,
+                lambda: ProfileRepository().get_or_create_by_id(user_id, user_email)
+            )
+
+            # request에 사용자 정보 저장
+            request.user_profile = profile
+            request.is_authenticated = True
+
+        except jwt.ExpiredSignatureError:
+            print("⚠️  JWT 토큰이 만료되었습니다.")
+        except jwt.InvalidTokenError as e:
+            print(f"⚠️  유효하지 않은 JWT 토큰: {e}")
+        except Exception as e:
+            print(f"❌ Auth middleware error: {e}")
+            import traceback
+            traceback.print_exc()
+
+    @staticmethod
+    def _verify_token(token, jwt_secret):
+        """
+        JWT 서명/만료 검증 후 claims 반환 (검증된 토큰은 exp까지 캐시)
+
+        Raises:
+            jwt.InvalidTokenError: 서명 오류 또는 만료
+        """
+        decoded = token_cache.get(token, jwt_secret)
+        if decoded is not None:
+            return decoded
+
+        started = time.perf_counter()
+        decoded = jwt.decode(
+            token,
+            jwt_secret,
+            algorithms=['HS256'],
+            options={'verify_aud': False},
+            leeway=10  # 10초의 시간 여유 허용 (시간 동기화 문제 대응)
+        )
+        token_cache.set(token, jwt_secret, decoded, time.perf_counter() - started)
+        return decoded
@@ -0,0 +1,126 @@
+"""
+인증 요청용 프로필 캐시
+
+미들웨어가 매 요청 Profile을 조회(get_or_create)하지 않도록 프로세스 메모리에
+TTL 동안 보관하고, 설정 시 워커 간 공유 캐시(Django cache)도 함께 사용한다.
+역할 등 프로필이 바뀌면 invalidate()로 즉시 제거해야 한다.
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Profile
+
+
+SHARED_KEY_PREFIX = 'auth:profile'
+
+
+class ProfileCache:
+    """
+    사용자 ID -> Profile TTL 캐시 (스레드 안전)
+
+    - 1차: 프로세스 메모리 (AUTH_PROFILE_CACHE_TTL 초, 최대 AUTH_PROFILE_CACHE_SIZE개)
+    - 2차: AUTH_PROFILE_CACHE_SHARED이면 Django cache (Redis 등 워커 간 공유)
+
+    invalidate()는 현재 프로세스와 공유 캐시에서 제거한다. 다른 워커의 1차 캐시에는
+    최대 AUTH_PROFILE_CACHE_TTL 동안 이전 값이 남을 수 있다.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @staticmethod
+    def _shared_key(user_id) -> str:
+        return f'{SHARED_KEY_PREFIX}:{user_id}'
+
+    def get_or_load(self, user_id, loader: Callable[[], Profile]) -> Profile:
+        """
+        캐시된 프로필 반환, 없으면 loader()로 조회해 저장
+
+        loader에서 발생한 예외는 그대로 전달하며 캐시하지 않는다.
+        """
+        ttl = settings.AUTH_PROFILE_CACHE_TTL
+        if ttl <= 0:
+            return loader()
+
+        key = str(user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry[1]:
+                self.hits += 1
+                return entry[0]
+
+        profile = None
+        if settings.AUTH_PROFILE_CACHE_SHARED:
+            profile = cache.get(self._shared_key(key))
+            if profile is not None:
+                with self._lock:
+                    self.shared_hits += 1
+
+        if profile is None:
+            with self._lock:
+                self.misses += 1
+            profile = loader()
+            if settings.AUTH_PROFILE_CACHE_SHARED:
+                cache.set(self._shared_key(key), profile, timeout=ttl)
+
+        self._store(key, profile, now + ttl)
+        return profile
+
+    def invalidate(self, user_id) -> None:
+        """프로필 변경(역할 변경/삭제) 시 캐시 제거"""
+        key = str(user_id)
+        with self._lock:
+            self._entries.pop(key, None)
+        if settings.AUTH_PROFILE_CACHE_SHARED:
+            cache.delete(self._shared_key(key))
+
+    def clear(self) -> None:
+        """프로세스 캐시 전체 제거"""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """캐시 통계 (hits: 프로세스 캐시, shared_hits: 공유 캐시, misses: DB 조회)"""
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'shared_hits': self.shared_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+    def _store(self, key: str, profile: Profile, expires_at: float) -> None:
+        max_size = settings.AUTH_PROFILE_CACHE_SIZE
+        with self._lock:
+            if len(self._entries) >= max_size and key not in self._entries:
+                # 만료된 항목을 먼저 정리하고 그래도 가득 차면 가장 먼저 만료될 항목 제거
+                now = time.monotonic()
+                for stale in [k for k, (_, expires) in self._entries.items() if expires <= now]:
+                    del self._entries[stale]
+                if len(self._entries) >= max_size:
+                    del self._entries[min(self._entries, key=lambda k: self._entries[k][1])]
+            self._entries[key] = (profile, expires_at)
+
+
+# 프로세스 단위 캐시 (워커마다 별도)
+profile_cache = ProfileCache()
+
+
+def invalidate_profile(user_id: Optional[object]) -> None:
+    """프로필 캐시 무효화 (역할 변경, 삭제 시 호출)"""
+    if user_id is not None:
+        profile_cache.invalidate(user_id)
@@ -65,3 +65,20 @@ class ProfileRepository(BaseRepository[Profile]):
             username=username,
             email=email
         )
+
+    def get_or_create_by_id(self, user_id: uuid.UUID, email: str = None) -> Profile:
+        """
+        사용자 ID로 프로필 조회, 없으면 생성 (처음 인증한 Supabase 사용자)
+
+        Args:
+            user_id: Supabase Auth 사용자 ID (UUID)
+            email: 생성 시 저장할 이메일
+
+        Returns:
+            Profile 객체
+        """
+        profile, created = self.model_class.objects.get_or_create(
+            id=user_id,
+            defaults={'email': email}
+        )
+        return profile
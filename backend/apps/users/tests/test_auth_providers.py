@@ -0,0 +1,112 @@
+import pytest
+import jwt
+from io import StringIO
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from apps.users.auth_providers import (
+    AuthProviderNotConfigured,
+    LocalAuthProvider,
+    SupabaseAuthProvider,
+    get_auth_provider,
+)
+from apps.users.models import Profile, UserRole
+
+
+LOGIN_URL = '/api/v1/auth/login/'
+
+
+@pytest.fixture
+def local_provider(settings, jwt_secret):
+    settings.AUTH_PROVIDER = 'local'
+    return LocalAuthProvider()
+
+
+@pytest.fixture
+def local_user(db):
+    return get_user_model().objects.create_user(
+        username='load@test.com', email='load@test.com', password='load-pass-1'
+    )
+
+
+class TestGetAuthProvider:
+    """AUTH_PROVIDER 설정별 제공자 선택"""
+
+    def test_default_is_supabase(self, settings):
+        settings.AUTH_PROVIDER = 'supabase'
+        assert isinstance(get_auth_provider(), SupabaseAuthProvider)
+
+    def test_unknown_provider(self, settings):
+        settings.AUTH_PROVIDER = 'ldap'
+        with pytest.raises(AuthProviderNotConfigured):
+            get_auth_provider()
+
+    def test_supabase_without_settings(self, settings):
+        settings.AUTH_PROVIDER = 'supabase'
+        with patch('apps.users.auth_providers.get_supabase_client', return_value=None):
+            with pytest.raises(AuthProviderNotConfigured):
+                get_auth_provider().sign_in('a@test.com', 'pw')
+
+
+@pytest.mark.django_db
+class TestLocalAuthProvider:
+    """local 제공자 단위 테스트"""
+
+    def test_sign_in_mints_supabase_style_token(self, local_provider, local_user, jwt_secret):
+        result = local_provider.sign_in('load@test.com', 'load-pass-1')
+
+        claims = jwt.decode(result.access_token, jwt_secret, algorithms=['HS256'], audience='authenticated')
+        assert claims['sub'] == result.user_id
+        assert claims['email'] == 'load@test.com'
+        assert claims['role'] == 'authenticated'
+        assert claims['exp'] > claims['iat']
+
+    def test_wrong_password(self, local_provider, local_user):
+        assert local_provider.sign_in('load@test.com', 'wrong') is None
+        assert local_provider.sign_in('nobody@test.com', 'load-pass-1') is None
+
+    def test_uses_existing_profile_id(self, local_provider, local_user):
+        profile = Profile.objects.create(email='load@test.com')
+
+        assert local_provider.sign_in('load@test.com', 'load-pass-1').user_id == str(profile.id)
+
+    def test_requires_jwt_secret(self, settings, local_user):
+        settings.SUPABASE_JWT_SECRET = ''
+        with pytest.raises(AuthProviderNotConfigured):
+            LocalAuthProvider().sign_in('load@test.com', 'load-pass-1')
+
+
+@pytest.mark.django_db
+class TestLocalLoginFlow:
+    """local 제공자로 로그인 후 실제 SupabaseAuthMiddleware 경로 사용"""
+
+    def test_login_then_authenticated_request(self, local_provider, local_user):
+        client = APIClient()
+        response = client.post(LOGIN_URL, {'email': 'load@test.com', 'password': 'load-pass-1'})
+
+        assert response.status_code == 200
+        assert response.data['user']['role'] == UserRole.GENERAL
+
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access_token']}")
+        profile = client.get('/api/v1/auth/profile/')
+        assert profile.status_code == 200
+        assert profile.data['email'] == 'load@test.com'
+
+    def test_invalid_credentials_returns_401(self, local_provider, local_user):
+        response = APIClient().post(LOGIN_URL, {'email': 'load@test.com', 'password': 'wrong-pass'})
+
+        assert response.status_code == 401
+        assert response.data['code'] == 'INVALID_CREDENTIALS'
+
+    def test_create_local_auth_user_command(self, local_provider, jwt_secret):
+        out = StringIO()
+        call_command('create_local_auth_user', 'perf@test.com', password='perf-pass-1',
+                     role='admin', print_token=True, stdout=out)
+
+        profile = Profile.objects.get(email='perf@test.com')
+        token = out.getvalue().strip().splitlines()[-1]
+        assert profile.role == UserRole.ADMIN
+        assert jwt.decode(token, jwt_secret, algorithms=['HS256'], audience='authenticated')['sub'] == str(profile.id)
+        assert local_provider.sign_in('perf@test.com', 'perf-pass-1').user_id == str(profile.id)
@@ -13,7 +13,7 @@ class TestLoginAPI:
         """API 클라이언트 fixture"""
         return APIClient()
 
-    @patch('apps.users.views.supabase')
+    @patch('apps.users.auth_providers.get_supabase_client')
     def test_login_success(self, mock_supabase, api_client):
         """로그인 성공 케이스"""
         # Arrange
@@ -25,7 +25,7 @@ class TestLoginAPI:
         mock_auth_response.session.access_token = 'mock-access-token'
         mock_auth_response.session.refresh_token = 'mock-refresh-token'
 
-        mock_supabase.auth.sign_in_with_password.return_value = mock_auth_response
+        mock_supabase.return_value.auth.sign_in_with_password.return_value = mock_auth_response
 
         # Act
         response = api_client.post('/api/v1/auth/login/', {
@@ -39,11 +39,11 @@ class TestLoginAPI:
         assert 'user' in response.data
         assert response.data['user']['email'] == 'test@example.com'
 
-    @patch('apps.users.views.supabase')
+    @patch('apps.users.auth_providers.get_supabase_client')
     def test_login_invalid_credentials(self, mock_supabase, api_client):
         """잘못된 자격 증명으로 로그인 실패"""
         # Arrange
-        mock_supabase.auth.sign_in_with_password.side_effect = Exception("Invalid credentials")
+        mock_supabase.return_value.auth.sign_in_with_password.side_effect = Exception("Invalid credentials")
 
         # Act
         response = api_client.post('/api/v1/auth/login/', {
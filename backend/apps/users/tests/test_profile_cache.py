@@ -0,0 +1,140 @@
+import pytest
+import jwt
+import time
+from unittest.mock import patch
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from apps.users.admin import ProfileAdmin
+from apps.users.models import Profile, UserRole
+from apps.users.profile_cache import ProfileCache, invalidate_profile, profile_cache
+from apps.users.token_cache import token_cache
+
+
+STATS_URL = '/api/v1/auth/cache-stats/'
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    profile_cache.clear()
+    profile_cache.reset_stats()
+    token_cache.clear()
+    cache.clear()
+    yield
+    profile_cache.clear()
+
+
+@pytest.fixture
+def admin_client(admin_profile, jwt_secret):
+    token = jwt.encode(
+        {'sub': str(admin_profile.id), 'email': admin_profile.email, 'exp': int(time.time()) + 3600},
+        jwt_secret,
+        algorithm='HS256',
+    )
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return client
+
+
+class TestProfileCache:
+    """프로필 TTL 캐시 단위 테스트"""
+
+    def test_loader_called_once_within_ttl(self):
+        cache_ = ProfileCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return Profile(email='a@test.com')
+
+        first = cache_.get_or_load('u1', loader)
+        second = cache_.get_or_load('u1', loader)
+
+        assert first is second
+        assert len(calls) == 1
+        assert cache_.stats()['hit_rate'] == 0.5
+
+    def test_expires_after_ttl(self, settings):
+        settings.AUTH_PROFILE_CACHE_TTL = 10
+        cache_ = ProfileCache()
+        cache_.get_or_load('u1', lambda: Profile())
+
+        with patch('apps.users.profile_cache.time.monotonic', return_value=time.monotonic() + 11):
+            cache_.get_or_load('u1', lambda: Profile())
+
+        assert cache_.stats()['misses'] == 2
+
+    def test_loader_error_is_not_cached(self):
+        cache_ = ProfileCache()
+
+        def failing():
+            raise ValueError('잘못된 사용자 ID')
+
+        with pytest.raises(ValueError):
+            cache_.get_or_load('u1', failing)
+        assert cache_.stats()['size'] == 0
+
+    def test_size_is_bounded(self, settings):
+        settings.AUTH_PROFILE_CACHE_SIZE = 2
+        cache_ = ProfileCache()
+        for user_id in ('u1', 'u2', 'u3'):
+            cache_.get_or_load(user_id, lambda: Profile())
+
+        assert cache_.stats()['size'] == 2
+
+    def test_shared_cache_serves_other_workers(self, settings, db):
+        """공유 캐시 사용 시 다른 워커(프로세스 캐시가 빈 상태)도 DB를 조회하지 않는다"""
+        settings.AUTH_PROFILE_CACHE_SHARED = True
+        profile = Profile.objects.create(email='shared@test.com')
+        ProfileCache().get_or_load(profile.id, lambda: Profile.objects.get(pk=profile.id))
+
+        other_worker = ProfileCache()
+        loaded = other_worker.get_or_load(profile.id, lambda: pytest.fail('DB 조회'))
+
+        assert loaded.email == 'shared@test.com'
+        assert other_worker.stats()['shared_hits'] == 1
+
+        invalidate_profile(profile.id)
+        assert cache.get(f'auth:profile:{profile.id}') is None
+
+
+@pytest.mark.django_db
+class TestMiddlewareProfileCache:
+    """SupabaseAuthMiddleware 프로필 캐시 적용 테스트"""
+
+    def test_cached_request_runs_no_auth_queries(self, admin_client, django_assert_num_queries):
+        assert admin_client.get(STATS_URL).status_code == 200
+
+        with django_assert_num_queries(0):
+            assert admin_client.get(STATS_URL).status_code == 200
+
+    def test_first_request_creates_profile(self, jwt_secret):
+        user_id = '5b0f4b3e-6a5e-4b8a-9d59-2a8c2d7f0a11'
+        token = jwt.encode(
+            {'sub': user_id, 'email': 'new@test.com', 'exp': int(time.time()) + 3600},
+            jwt_secret,
+            algorithm='HS256',
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        assert client.get('/api/v1/auth/profile/').status_code == 200
+        assert Profile.objects.filter(pk=user_id, email='new@test.com').exists()
+
+    def test_role_change_from_admin_is_applied_immediately(self, admin_client, admin_profile, rf):
+        assert admin_client.get(STATS_URL).status_code == 200
+
+        admin_profile.role = UserRole.GENERAL
+        ProfileAdmin(Profile, None).save_model(rf.post('/'), admin_profile, None, True)
+
+        assert admin_client.get(STATS_URL).status_code == 403
+
+    def test_stale_role_without_invalidation(self, admin_client, admin_profile):
+        """무효화 없이 DB만 바꾸면 TTL 동안 캐시된 역할을 사용한다 (invalidate 필요성)"""
+        assert admin_client.get(STATS_URL).status_code == 200
+
+        Profile.objects.filter(pk=admin_profile.pk).update(role=UserRole.GENERAL)
+        assert admin_client.get(STATS_URL).status_code == 200
+
+        invalidate_profile(admin_profile.pk)
+        assert admin_client.get(STATS_URL).status_code == 403
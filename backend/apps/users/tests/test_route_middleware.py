@@ -0,0 +1,73 @@
+import pytest
+from io import StringIO
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import Client
+
+from apps.core.middleware import is_api_request
+
+
+@pytest.fixture
+def plain_static_storage(settings):
+    """관리자 템플릿 렌더링용 (collectstatic manifest 없이 static URL 생성)"""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+
+
+class TestRouteAwareMiddleware:
+    """경로 기반 미들웨어 단축 실행 테스트"""
+
+    def test_is_api_request(self, rf):
+        assert is_api_request(rf.get('/api/v1/dashboard/students/'))
+        assert not is_api_request(rf.get('/dashboard/students/'))
+        assert not is_api_request(rf.get('/admin/'))
+
+    def test_api_request_skips_session_and_messages(self):
+        response = Client().get('/api/v1/auth/profile/')
+
+        request = response.wsgi_request
+        assert response.status_code in (401, 403)
+        assert not hasattr(request, 'session')
+        assert not hasattr(request, '_messages')
+        assert 'csrftoken' not in response.cookies
+
+    @pytest.mark.django_db
+    def test_api_request_still_authenticates_bearer(self, bearer_client):
+        response = bearer_client.get('/api/v1/auth/profile/')
+
+        assert response.status_code == 200
+        assert response.wsgi_request.is_authenticated
+
+    @pytest.mark.django_db
+    def test_non_api_path_skips_jwt(self, plain_static_storage):
+        client = Client()
+        with patch('apps.users.middleware.jwt.decode') as decode:
+            response = client.get('/admin/login/', HTTP_AUTHORIZATION='Bearer invalid-token')
+
+        decode.assert_not_called()
+        assert response.status_code == 200
+        assert response.wsgi_request.is_authenticated is False
+        assert response.wsgi_request.user_profile is None
+
+    @pytest.mark.django_db
+    def test_admin_login_keeps_session(self, plain_static_storage):
+        get_user_model().objects.create_superuser('admin', 'admin@test.com', 'pw-12345')
+        client = Client()
+
+        assert client.login(username='admin', password='pw-12345')
+        response = client.get('/admin/')
+
+        assert response.status_code == 200
+        assert response.wsgi_request.user.is_superuser
+
+
+def test_benchmark_middleware_command():
+    out = StringIO()
+    call_command('benchmark_middleware', requests=20, stdout=out)
+
+    output = out.getvalue()
+    assert 'api' in output and 'spa' in output
+    assert '✅' in output
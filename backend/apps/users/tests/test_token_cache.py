@@ -0,0 +1,151 @@
+import pytest
+import jwt
+import time
+from unittest.mock import patch
+from rest_framework.test import APIClient
+
+from apps.users.models import Profile, UserRole
+from apps.users.token_cache import VerifiedTokenCache, token_cache
+
+
+SECRET = 'test-jwt-secret'
+
+
+@pytest.fixture(autouse=True)
+def clean_token_cache():
+    token_cache.clear()
+    token_cache.reset_stats()
+    yield
+    token_cache.clear()
+
+
+def _token(profile, expires_in=3600, secret=SECRET):
+    return jwt.encode(
+        {'sub': str(profile.id), 'email': profile.email, 'exp': int(time.time()) + expires_in},
+        secret,
+        algorithm='HS256',
+    )
+
+
+class TestVerifiedTokenCache:
+    """검증된 토큰 캐시 단위 테스트"""
+
+    def test_hit_after_set(self):
+        cache = VerifiedTokenCache()
+        claims = {'sub': 'u1', 'exp': time.time() + 60}
+
+        assert cache.get('t1', SECRET) is None
+        cache.set('t1', SECRET, claims, verify_seconds=0.002)
+
+        assert cache.get('t1', SECRET) == claims
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['size']) == (1, 1, 1)
+        assert stats['hit_rate'] == 0.5
+        assert stats['time_saved_ms'] == pytest.approx(2.0)
+
+    def test_expired_token_is_not_served(self):
+        cache = VerifiedTokenCache()
+        cache.set('t1', SECRET, {'sub': 'u1', 'exp': time.time() + 60})
+
+        with patch('apps.users.token_cache.time.time', return_value=time.time() + 61):
+            assert cache.get('t1', SECRET) is None
+        assert cache.stats()['size'] == 0
+
+    def test_ttl_is_capped(self, settings):
+        settings.AUTH_TOKEN_CACHE_MAX_TTL = 10
+        cache = VerifiedTokenCache()
+        cache.set('t1', SECRET, {'sub': 'u1', 'exp': time.time() + 3600})
+
+        with patch('apps.users.token_cache.time.time', return_value=time.time() + 11):
+            assert cache.get('t1', SECRET) is None
+
+    def test_token_without_exp_is_not_cached(self):
+        cache = VerifiedTokenCache()
+        cache.set('t1', SECRET, {'sub': 'u1'})
+
+        assert cache.get('t1', SECRET) is None
+
+    def test_secret_rotation_misses(self):
+        cache = VerifiedTokenCache()
+        cache.set('t1', SECRET, {'sub': 'u1', 'exp': time.time() + 60})
+
+        assert cache.get('t1', 'rotated-secret') is None
+
+    def test_lru_eviction(self, settings):
+        settings.AUTH_TOKEN_CACHE_SIZE = 2
+        cache = VerifiedTokenCache()
+        for name in ('t1', 't2'):
+            cache.set(name, SECRET, {'sub': name, 'exp': time.time() + 60})
+        cache.get('t1', SECRET)
+        cache.set('t3', SECRET, {'sub': 't3', 'exp': time.time() + 60})
+
+        assert cache.get('t2', SECRET) is None
+        assert cache.get('t1', SECRET) is not None
+        assert cache.stats()['evictions'] == 1
+
+    def test_revoked_token_is_neither_served_nor_recached(self):
+        cache = VerifiedTokenCache()
+        claims = {'sub': 'u1', 'exp': time.time() + 60}
+        cache.set('t1', SECRET, claims)
+
+        cache.revoke('t1', SECRET)
+        cache.set('t1', SECRET, claims)
+
+        assert cache.get('t1', SECRET) is None
+
+
+@pytest.mark.django_db
+class TestMiddlewareTokenCache:
+    """SupabaseAuthMiddleware 토큰 캐시 적용 테스트"""
+
+    @pytest.fixture
+    def profile(self, jwt_secret):
+        return Profile.objects.create(role=UserRole.ADMIN, email='admin@test.com')
+
+    def test_signature_verified_once_per_token(self, profile):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {_token(profile)}')
+
+        with patch('apps.users.middleware.jwt.decode', wraps=jwt.decode) as decode:
+            for _ in range(3):
+                assert client.get('/api/v1/auth/cache-stats/').status_code == 200
+
+        assert decode.call_count == 1
+        assert token_cache.stats()['hits'] == 2
+
+    def test_invalid_signature_is_not_cached(self, profile):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {_token(profile, secret='wrong')}")
+
+        for _ in range(2):
+            assert client.get('/api/v1/auth/cache-stats/').status_code in (401, 403)
+
+        assert token_cache.stats()['size'] == 0
+
+    def test_token_past_exp_is_never_cached(self, profile):
+        """만료 직후 허용 오차(leeway) 안의 토큰은 매번 검증하고 캐시하지 않는다"""
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {_token(profile, expires_in=-5)}')
+
+        with patch('apps.users.middleware.jwt.decode', wraps=jwt.decode) as decode:
+            for _ in range(2):
+                assert client.get('/api/v1/auth/cache-stats/').status_code == 200
+
+        assert decode.call_count == 2
+        assert token_cache.stats()['size'] == 0
+
+    def test_logout_revokes_cached_token(self, profile):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {_token(profile)}')
+        client.get('/api/v1/auth/cache-stats/')
+
+        with patch('apps.users.auth_providers.get_supabase_client', return_value=None):
+            assert client.post('/api/v1/auth/logout/').status_code == 200
+
+        assert token_cache.stats()['size'] == 0
+
+    def test_stats_endpoint_requires_admin(self, general_profile, jwt_secret):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {_token(general_profile)}')
+
+        assert client.get('/api/v1/auth/cache-stats/').status_code == 403
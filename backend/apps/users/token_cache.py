@@ -0,0 +1,148 @@
+"""
+검증된 JWT claims 캐시
+
+대시보드 화면 하나가 같은 Bearer 토큰으로 여러 API를 동시에 호출하므로
+한 번 서명 검증한 토큰의 claims를 프로세스 메모리에 보관하여 재검증을 생략한다.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from django.conf import settings
+
+
+class VerifiedTokenCache:
+    """
+    검증된 토큰 claims의 LRU/TTL 캐시 (스레드 안전)
+
+    - 키: JWT Secret과 토큰의 SHA-256 digest (토큰 원문은 보관하지 않으며 Secret이 바뀌면 모두 미스)
+    - 만료: 토큰 exp와 AUTH_TOKEN_CACHE_MAX_TTL 중 이른 시각 (exp가 없는 토큰은 캐시하지 않음)
+    - 용량: AUTH_TOKEN_CACHE_SIZE 초과 시 가장 오래 사용하지 않은 항목부터 제거
+    - 폐기: revoke()한 토큰은 exp까지 캐시에서 반환하지도, 다시 저장하지도 않음
+    """
+
+    def __init__(self):
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._revoked = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @staticmethod
+    def _digest(token: str, secret: str) -> str:
+        return hashlib.sha256(f'{secret}\0{token}'.encode('utf-8')).hexdigest()
+
+    def get(self, token: str, secret: str) -> Optional[dict]:
+        """
+        캐시된 claims 조회 (없거나 만료/폐기된 경우 None)
+
+        None이면 호출한 쪽에서 서명을 검증한 뒤 set()으로 저장한다.
+        """
+        key = self._digest(token, secret)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                claims, expires_at = entry
+                if now < expires_at and key not in self._revoked:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return claims
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def set(self, token: str, secret: str, claims: dict, verify_seconds: float = 0.0) -> None:
+        """
+        서명 검증을 통과한 claims 저장
+
+        Args:
+            verify_seconds: 서명 검증에 걸린 시간 (절약 시간 통계용)
+        """
+        max_size = settings.AUTH_TOKEN_CACHE_SIZE
+        max_ttl = settings.AUTH_TOKEN_CACHE_MAX_TTL
+        key = self._digest(token, secret)
+        now = time.time()
+
+        with self._lock:
+            self.verify_count += 1
+            self.verify_seconds += verify_seconds
+
+            exp = claims.get('exp')
+            if max_size <= 0 or max_ttl <= 0 or not isinstance(exp, (int, float)):
+                return
+            self._purge_revoked(now)
+            if key in self._revoked:
+                return
+
+            expires_at = min(exp, now + max_ttl)
+            if expires_at <= now:
+                return
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def revoke(self, token: str, secret: str, expires_at: Optional[float] = None) -> None:
+        """
+        토큰 폐기 (로그아웃 등) - 캐시에서 제거하고 만료 시각까지 다시 캐시하지 않음
+
+        Args:
+            expires_at: 토큰 exp (모르면 AUTH_TOKEN_CACHE_MAX_TTL 동안 유지)
+        """
+        key = self._digest(token, secret)
+        now = time.time()
+        with self._lock:
+            self._entries.pop(key, None)
+            self._revoked[key] = expires_at or now + settings.AUTH_TOKEN_CACHE_MAX_TTL
+            self._purge_revoked(now)
+
+    def clear(self) -> None:
+        """전체 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.verify_count = 0
+        self.verify_seconds = 0.0
+
+    def stats(self) -> dict:
+        """
+        캐시 통계
+
+        Returns:
+            {
+                'size', 'hits', 'misses', 'evictions',
+                'hit_rate': 조회 중 캐시 적중 비율 (0~1),
+                'avg_verify_ms': 서명 검증 1회 평균 시간,
+                'time_saved_ms': 적중으로 생략한 검증 시간 추정치 (적중 수 × 평균 검증 시간)
+            }
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            avg_verify = self.verify_seconds / self.verify_count if self.verify_count else 0.0
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'avg_verify_ms': round(avg_verify * 1000, 4),
+                'time_saved_ms': round(self.hits * avg_verify * 1000, 3),
+            }
+
+    def _purge_revoked(self, now: float) -> None:
+        """만료 시각이 지난 폐기 기록 제거 (lock 안에서 호출)"""
+        expired = [key for key, expires_at in self._revoked.items() if expires_at <= now]
+        for key in expired:
+            del self._revoked[key]
+
+
+# 프로세스 단위 캐시 (워커마다 별도)
+token_cache = VerifiedTokenCache()
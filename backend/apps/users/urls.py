@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import LoginView, ProfileView, LogoutView
+from .views import LoginView, ProfileView, LogoutView, AuthCacheStatsView
 
 app_name = 'users'
 
@@ -7,4 +7,5 @@ urlpatterns = [
     path('login/', LoginView.as_view(), name='login'),
     path('profile/', ProfileView.as_view(), name='profile'),
     path('logout/', LogoutView.as_view(), name='logout'),
+    path('cache-stats/', AuthCacheStatsView.as_view(), name='cache-stats'),
 ]
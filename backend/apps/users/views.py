@@ -4,20 +4,11 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from .serializers import LoginSerializer, ProfileSerializer
 from .repositories import ProfileRepository
-from .permissions import IsAuthenticatedViaSupabase
-from supabase import create_client, Client
+from .permissions import IsAuthenticatedViaSupabase, IsAdmin
+from .profile_cache import profile_cache
+from .token_cache import token_cache
+from .auth_providers import AuthProviderNotConfigured, get_auth_provider
 from django.conf import settings
-import os
-
-# Supabase 클라이언트 생성
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-
-# Supabase 클라이언트가 존재하는 경우에만 초기화
-if SUPABASE_URL and SUPABASE_KEY:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-else:
-    supabase = None
 
 
 class LoginView(APIView):
@@ -41,26 +32,13 @@ class LoginView(APIView):
         password = serializer.validated_data['password']
 
         try:
-            # 2. Supabase Auth를 통한 인증
-            if supabase is None:
-                print("❌ Supabase 클라이언트가 초기화되지 않았습니다.")
-                print(f"   SUPABASE_URL: {SUPABASE_URL}")
-                print(f"   SUPABASE_KEY: {'설정됨' if SUPABASE_KEY else '없음'}")
-                return Response(
-                    {
-                        "message": "인증 서비스가 구성되지 않았습니다.",
-                        "code": "SERVER_ERROR"
-                    },
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
+            # 2. 인증 제공자(AUTH_PROVIDER: supabase/local)를 통한 인증
+            provider = get_auth_provider()
 
-            print(f"🔐 로그인 시도: {email}")
-            auth_response = supabase.auth.sign_in_with_password({
-                "email": email,
-                "password": password
-            })
+            print(f"🔐 로그인 시도: {email} ({provider.name})")
+            auth_result = provider.sign_in(email, password)
 
-            if not auth_response.user:
+            if auth_result is None:
                 print(f"❌ 로그인 실패: 사용자 없음")
                 return Response(
                     {
@@ -70,15 +48,15 @@ class LoginView(APIView):
                     status=status.HTTP_401_UNAUTHORIZED
                 )
 
-            print(f"✅ 로그인 성공: {auth_response.user.id}")
+            print(f"✅ 로그인 성공: {auth_result.user_id}")
 
             # 3. Profile 조회 또는 생성
             from .models import Profile
             profile, created = Profile.objects.get_or_create(
-                id=auth_response.user.id,
+                id=auth_result.user_id,
                 defaults={
-                    'email': auth_response.user.email,
-                    'username': auth_response.user.email.split('@')[0]
+                    'email': auth_result.email,
+                    'username': auth_result.email.split('@')[0]
                 }
             )
             if created:
@@ -88,16 +66,26 @@ class LoginView(APIView):
 
             # 4. 응답 데이터 구성
             return Response({
-                "access_token": auth_response.session.access_token,
-                "refresh_token": auth_response.session.refresh_token,
+                "access_token": auth_result.access_token,
+                "refresh_token": auth_result.refresh_token,
                 "user": {
-                    "id": str(auth_response.user.id),
-                    "email": auth_response.user.email,
+                    "id": auth_result.user_id,
+                    "email": auth_result.email,
                     "role": profile.role,
                     "username": profile.username
                 }
             }, status=status.HTTP_200_OK)
 
+        except AuthProviderNotConfigured as e:
+            print(f"❌ 인증 제공자가 구성되지 않았습니다: {e}")
+            return Response(
+                {
+                    "message": "인증 서비스가 구성되지 않았습니다.",
+                    "code": "SERVER_ERROR"
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
         except Exception as e:
             # 4. 예외 처리
             print(f"❌ 로그인 예외 발생: {type(e).__name__}: {str(e)}")
@@ -180,9 +168,15 @@ class LogoutView(APIView):
 
     def post(self, request):
         try:
-            # Supabase Auth 로그아웃 처리
-            if supabase:
-                supabase.auth.sign_out()
+            auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+            access_token = auth_header.split(' ')[1] if auth_header.startswith('Bearer ') else ''
+
+            # 인증 제공자 로그아웃 처리
+            get_auth_provider().sign_out(access_token)
+
+            # 검증된 토큰 캐시에서 제거 (로그아웃한 토큰은 다시 캐시하지 않음)
+            if access_token:
+                token_cache.revoke(access_token, settings.SUPABASE_JWT_SECRET)
 
             return Response(
                 {"message": "로그아웃되었습니다."},
@@ -196,3 +190,18 @@ class LogoutView(APIView):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class AuthCacheStatsView(APIView):
+    """
+    인증 캐시 통계 API (관리자 전용, 현재 워커 프로세스 기준)
+
+    GET /api/v1/auth/cache-stats/
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return Response(
+            {'token_cache': token_cache.stats(), 'profile_cache': profile_cache.stats()},
+            status=status.HTTP_200_OK
+        )
@@ -1,8 +1,14 @@
 import pytest
+import jwt
+from datetime import datetime, timedelta, timezone
+from django.apps import apps
+from django.db import connection
 from rest_framework.test import APIClient
 from apps.users.models import Profile, UserRole
 import uuid
 
+TEST_JWT_SECRET = 'test-jwt-secret'
+
 
 @pytest.fixture
 def admin_profile():
@@ -42,3 +48,45 @@ def authenticated_client(general_profile):
     mock_request.profile = general_profile
     client.handler._force_user = mock_request
     return client
+
+
+@pytest.fixture
+def jwt_secret(settings):
+    """테스트용 Supabase JWT Secret 설정"""
+    settings.SUPABASE_JWT_SECRET = TEST_JWT_SECRET
+    return TEST_JWT_SECRET
+
+
+@pytest.fixture
+def bearer_client(general_profile, jwt_secret):
+    """SupabaseAuthMiddleware를 실제로 통과하는 JWT 인증 API 클라이언트"""
+    token = jwt.encode(
+        {
+            'sub': str(general_profile.id),
+            'email': general_profile.email,
+            'exp': datetime.now(timezone.utc) + timedelta(hours=1),
+        },
+        jwt_secret,
+        algorithm='HS256',
+    )
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return client
+
+
+@pytest.fixture
+def dashboard_tables(transactional_db):
+    """
+    대시보드 모델 테이블 생성 (테스트 종료 시 삭제)
+
+    대시보드 스키마는 Supabase 마이그레이션으로 관리되어 테스트 DB에는 테이블이 없으므로
+    실제 쿼리가 필요한 테스트에서만 모델 정의(인덱스 포함)로 생성한다.
+    """
+    models = list(apps.get_app_config('dashboard').get_models())
+    with connection.schema_editor() as editor:
+        for model in models:
+            editor.create_model(model)
+    yield
+    with connection.schema_editor() as editor:
+        for model in reversed(models):
+            editor.delete_model(model)
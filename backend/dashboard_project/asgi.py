@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dashboard_project.settings')
+# ASGI에서는 동기 ORM 코드가 요청마다 다른 스레드에서 실행되어 스레드별 지속 연결이
+# 재사용되지 않고 남으므로 지속 연결을 사용하지 않는다 (Django 권장, 필요 시 pgbouncer 등 외부 풀 사용)
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
@@ -0,0 +1,38 @@
+"""
+gunicorn 운영 서버 프로필 (Dockerfile: gunicorn dashboard_project.wsgi -c gunicorn.conf.py)
+
+- gthread 워커: 프로세스당 GUNICORN_THREADS개 요청을 동시에 처리하므로 DB/Supabase 응답을
+  기다리는 동안에도 다른 요청을 받는다. 워커 수 기본값은 CPU 수 (최소 2).
+- preload_app: 앱을 마스터에서 한 번 로드한 뒤 fork (부팅 시간 단축, copy-on-write 메모리 공유)
+- DB 연결: 스레드마다 지속 연결(DB_CONN_MAX_AGE)을 재사용하므로 최대 연결 수는
+  workers × threads 이다. Supabase pooler 연결 한도 안에서 조정한다.
+- sync 워커 대비 측정 결과(PostgreSQL, DB 지연 유무별)는 DEPLOY.md 7장 참고.
+  DB 왕복 지연이 있는 운영 구성에서는 gthread가 같은 워커 수의 sync보다 처리량이 높다.
+- ASGI: GUNICORN_APP=dashboard_project.asgi, GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker로
+  실행하면 워커 하나가 이벤트 루프로 많은 동시 요청을 처리한다 (비동기 조회 API: /api/v1/dashboard/async/).
+  threads 설정은 사용하지 않으며, asgi.py에서 DB_CONN_MAX_AGE 기본값을 0으로 바꾼다.
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+workers = int(os.getenv('GUNICORN_WORKERS', max(2, os.cpu_count() or 1)))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True') == 'True'
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# 장시간 실행 시 메모리 증가 대비 워커 재시작 (동시에 재시작하지 않도록 jitter)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = max_requests // 10
+
+accesslog = '-'
+
+
+def post_fork(server, worker):
+    """preload 중 마스터에서 열린 DB 연결을 워커가 공유하지 않도록 정리"""
+    from django.db import connections
+    connections.close_all()
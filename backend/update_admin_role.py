@@ -11,6 +11,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dashboard_project.settings')
 django.setup()
 
 from apps.users.models import Profile
+from apps.users.profile_cache import invalidate_profile
 
 
 def update_admin_role():
@@ -31,6 +32,9 @@ def update_admin_role():
         profile.role = 'admin'
         profile.save()
 
+        # 인증 프로필 캐시 제거 (공유 캐시 사용 시 다른 워커에도 반영)
+        invalidate_profile(profile.id)
+
         print(f"\n✅ 업데이트 완료!")
         print(f"   - Email: {profile.email}")
         print(f"   - Role: {profile.role}")
@@ -2,10 +2,58 @@ import apiClient from './index';
 
 // ============= Generic CRUD Functions =============
 
+// 선택 목록(드롭다운) 한 번에 받는 최대 건수 (서버 max_page_size)
+const OPTIONS_PAGE_SIZE = 1000;
+
 const createCRUDAPI = (resourcePath) => ({
-  // 목록 조회
-  getAll: async () => {
-    const response = await apiClient.get(`/dashboard/${resourcePath}/`);
+  // 목록 한 페이지 조회 (커서 페이지네이션: { next, next_cursor, results })
+  // 다음 페이지는 params에 cursor: next_cursor를 넣어 같은 경로로 조회한다
+  getPage: async (params = {}) => {
+    const response = await apiClient.get(`/dashboard/${resourcePath}/`, {
+      params,
+    });
+    return response.data;
+  },
+
+  // 선택 목록용 조회 (한 페이지만, 최대 OPTIONS_PAGE_SIZE건 / search로 서버 필터링)
+  getOptions: async (params = {}) => {
+    const response = await apiClient.get(`/dashboard/${resourcePath}/`, {
+      params: { page_size: OPTIONS_PAGE_SIZE, ...params },
+    });
+    return response.data.results;
+  },
+
+  // 증분 동기화: cursor(이전 결과의 cursor, 처음이면 null) 이후 변경분 전체 수집
+  // reset이 true이면 로컬 데이터를 비우고 changed로 다시 채운 뒤 deleted를 제거한다
+  sync: async (cursor = null, params = {}) => {
+    const changed = [];
+    const deleted = [];
+    let reset = false;
+    let since = cursor ?? '';
+    let data;
+    do {
+      const response = await apiClient.get(`/dashboard/${resourcePath}/`, {
+        params: { ...params, since },
+      });
+      data = response.data;
+      if (data.reset) {
+        reset = true;
+        changed.length = 0;
+        deleted.length = 0;
+      }
+      changed.push(...data.changed);
+      deleted.push(...data.deleted);
+      since = data.cursor;
+    } while (data.has_more);
+    return { changed, deleted, reset, cursor: since };
+  },
+
+  // 파일 내보내기 (file_format: 'csv' | 'xlsx', 목록과 같은 필터 적용)
+  exportFile: async (params = {}) => {
+    const response = await apiClient.get(`/dashboard/${resourcePath}/export/`, {
+      params,
+      responseType: 'blob',
+    });
     return response.data;
   },
 
@@ -46,6 +94,33 @@ const createCRUDAPI = (resourcePath) => ({
     );
     return response.data;
   },
+
+  // 대량 생성 (항목별 결과 반환, 하나라도 오류면 전체 미반영)
+  bulkCreate: async (items) => {
+    const response = await apiClient.post(
+      `/dashboard/${resourcePath}/bulk/`,
+      items
+    );
+    return response.data;
+  },
+
+  // 대량 부분 수정 ([{ id, ...변경 필드 }])
+  bulkUpdate: async (items) => {
+    const response = await apiClient.patch(
+      `/dashboard/${resourcePath}/bulk/`,
+      items
+    );
+    return response.data;
+  },
+
+  // 대량 삭제
+  bulkDelete: async (ids) => {
+    const response = await apiClient.delete(
+      `/dashboard/${resourcePath}/bulk/`,
+      { data: { ids } }
+    );
+    return response.data;
+  },
 });
 
 // ============= Resource-specific APIs =============
@@ -54,6 +129,30 @@ export const collegeAPI = createCRUDAPI('colleges');
 export const departmentAPI = createCRUDAPI('departments');
 export const studentAPI = createCRUDAPI('students');
 export const kpiAPI = createCRUDAPI('kpis');
-export const publicationAPI = createCRUDAPI('publications');
-export const researchProjectAPI = createCRUDAPI('projects');
+export const publicationAPI = {
+  ...createCRUDAPI('publications'),
+
+  // 전문 검색 (제목/저널명/저자, 관련도 순 + <mark> 하이라이트)
+  search: async (q, params = {}) => {
+    const response = await apiClient.get('/dashboard/publications/search/', {
+      params: { q, ...params },
+    });
+    return response.data;
+  },
+
+  // 학과 × 연도별 Impact Factor 분석 (department, college, year_from, year_to, top_journals)
+  impact: async (params = {}) => {
+    const response = await apiClient.get('/dashboard/publications/impact/', { params });
+    return response.data;
+  },
+};
+export const researchProjectAPI = {
+  ...createCRUDAPI('projects'),
+
+  // 과제 집행 내역 (status, date_from, date_to, cursor, page_size)
+  getExpenses: async (id, params = {}) => {
+    const response = await apiClient.get(`/dashboard/projects/${id}/expenses/`, { params });
+    return response.data;
+  },
+};
 export const projectExpenseAPI = createCRUDAPI('expenses');
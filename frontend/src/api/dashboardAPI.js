@@ -3,9 +3,33 @@ import apiClient from './index';
 export const dashboardAPI = {
   /**
    * 대시보드 요약 데이터 조회
+   * @param {string[]} [sections] 조회할 섹션 (예: ['budget_execution']), 생략 시 전체
    */
-  getSummary: async () => {
-    const response = await apiClient.get('/dashboard/summary/');
+  getSummary: async (sections) => {
+    const params = sections?.length ? { sections: sections.join(',') } : undefined;
+    const response = await apiClient.get('/dashboard/summary/', { params });
+    return response.data;
+  },
+
+  /**
+   * 연구비 월별 번다운 데이터 조회
+   * @param {{ project_id?: number, department_id?: number }} params
+   */
+  getBurnDown: async (params) => {
+    const response = await apiClient.get('/dashboard/burn-down/', { params });
+    return response.data;
+  },
+
+  /**
+   * 범용 집계 조회 (허용된 그룹 기준/지표/필터만 사용 가능)
+   * @param {string} dataset 데이터셋 (예: 'students')
+   * @param {{ groupBy?: string[], metrics?: string[], filters?: Object }} [options]
+   */
+  aggregate: async (dataset, { groupBy = [], metrics = [], filters = {} } = {}) => {
+    const params = { ...filters, dataset };
+    if (groupBy.length) params.group_by = groupBy.join(',');
+    if (metrics.length) params.metric = metrics.join(',');
+    const response = await apiClient.get('/dashboard/aggregate/', { params });
     return response.data;
   },
 };
@@ -0,0 +1,38 @@
+import { useState, useCallback } from 'react';
+
+/**
+ * 커서 페이지네이션 목록 훅 (첫 페이지 조회 후 "더 보기"로 다음 페이지 추가)
+ * @param {Function} fetchPage - 페이지 조회 함수 (params => { next_cursor, results })
+ */
+const useCursorList = (fetchPage) => {
+  const [items, setItems] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  // 첫 페이지부터 다시 조회 (생성/수정/삭제 후 호출)
+  const reload = useCallback(async () => {
+    const data = await fetchPage();
+    setItems(data.results);
+    setNextCursor(data.next_cursor);
+  }, [fetchPage]);
+
+  // 다음 페이지를 이어 붙임
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const data = await fetchPage({ cursor: nextCursor });
+      setItems((prev) => [...prev, ...data.results]);
+      setNextCursor(data.next_cursor);
+    } catch (err) {
+      alert('다음 페이지를 불러오는데 실패했습니다.');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  return { items, hasMore: Boolean(nextCursor), loadingMore, reload, loadMore };
+};
+
+export default useCursorList;
@@ -6,10 +6,13 @@ import Input from '../components/common/Input';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ErrorMessage from '../components/common/ErrorMessage';
 import EmptyState from '../components/common/EmptyState';
+import useCursorList from '../hooks/useCursorList';
 import { collegeAPI } from '../api/crudAPI';
 
 const CollegePage = () => {
-  const [colleges, setColleges] = useState([]);
+  const {
+    items: colleges, hasMore, loadingMore, reload: reloadColleges, loadMore,
+  } = useCursorList(collegeAPI.getPage);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [isModalOpen, setIsModalOpen] = useState(false);
@@ -20,8 +23,7 @@ const CollegePage = () => {
   const fetchColleges = async () => {
     try {
       setLoading(true);
-      const data = await collegeAPI.getAll();
-      setColleges(data);
+      await reloadColleges();
       setError(null);
     } catch (err) {
       setError('단과대학 목록을 불러오는데 실패했습니다.');
@@ -145,6 +147,14 @@ const CollegePage = () => {
           </div>
         )}
 
+        {hasMore && (
+          <div className="load-more">
+            <Button onClick={loadMore} variant="secondary" loading={loadingMore}>
+              더 보기
+            </Button>
+          </div>
+        )}
+
         <Modal
           isOpen={isModalOpen}
           onClose={handleCloseModal}
@@ -185,6 +195,12 @@ const CollegePage = () => {
             margin: 0;
           }
 
+          .load-more {
+            display: flex;
+            justify-content: center;
+            margin-top: 1rem;
+          }
+
           .table-container {
             background: white;
             border-radius: 8px;
@@ -6,10 +6,13 @@ import Input from '../components/common/Input';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ErrorMessage from '../components/common/ErrorMessage';
 import EmptyState from '../components/common/EmptyState';
+import useCursorList from '../hooks/useCursorList';
 import { departmentAPI, collegeAPI } from '../api/crudAPI';
 
 const DepartmentPage = () => {
-  const [departments, setDepartments] = useState([]);
+  const {
+    items: departments, hasMore, loadingMore, reload: reloadDepartments, loadMore,
+  } = useCursorList(departmentAPI.getPage);
   const [colleges, setColleges] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
@@ -21,11 +24,10 @@ const DepartmentPage = () => {
   const fetchData = async () => {
     try {
       setLoading(true);
-      const [departmentsData, collegesData] = await Promise.all([
-        departmentAPI.getAll(),
-        collegeAPI.getAll(),
+      const [, collegesData] = await Promise.all([
+        reloadDepartments(),
+        collegeAPI.getOptions({ fields: 'id,name' }),
       ]);
-      setDepartments(departmentsData);
       setColleges(collegesData);
       setError(null);
     } catch (err) {
@@ -155,6 +157,14 @@ const DepartmentPage = () => {
           </div>
         )}
 
+        {hasMore && (
+          <div className="load-more">
+            <Button onClick={loadMore} variant="secondary" loading={loadingMore}>
+              더 보기
+            </Button>
+          </div>
+        )}
+
         <Modal
           isOpen={isModalOpen}
           onClose={handleCloseModal}
@@ -215,6 +225,12 @@ const DepartmentPage = () => {
             margin: 0;
           }
 
+          .load-more {
+            display: flex;
+            justify-content: center;
+            margin-top: 1rem;
+          }
+
           .table-container {
             background: white;
             border-radius: 8px;
@@ -6,10 +6,13 @@ import Input from '../components/common/Input';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ErrorMessage from '../components/common/ErrorMessage';
 import EmptyState from '../components/common/EmptyState';
+import useCursorList from '../hooks/useCursorList';
 import { kpiAPI, departmentAPI } from '../api/crudAPI';
 
 const KPIPage = () => {
-  const [kpis, setKpis] = useState([]);
+  const {
+    items: kpis, hasMore, loadingMore, reload: reloadKpis, loadMore,
+  } = useCursorList(kpiAPI.getPage);
   const [departments, setDepartments] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
@@ -26,11 +29,10 @@ const KPIPage = () => {
   const fetchData = async () => {
     try {
       setLoading(true);
-      const [kpisData, departmentsData] = await Promise.all([
-        kpiAPI.getAll(),
-        departmentAPI.getAll(),
+      const [, departmentsData] = await Promise.all([
+        reloadKpis(),
+        departmentAPI.getOptions({ fields: 'id,name,college_name' }),
       ]);
-      setKpis(kpisData);
       setDepartments(departmentsData);
       setError(null);
     } catch (err) {
@@ -157,6 +159,14 @@ const KPIPage = () => {
           </div>
         )}
 
+        {hasMore && (
+          <div className="load-more">
+            <Button onClick={loadMore} variant="secondary" loading={loadingMore}>
+              더 보기
+            </Button>
+          </div>
+        )}
+
         <Modal isOpen={isModalOpen} onClose={handleCloseModal} title={editingKPI ? 'KPI 수정' : '새 KPI'}>
           <form onSubmit={handleSubmit}>
             <div className="form-group">
@@ -183,6 +193,7 @@ const KPIPage = () => {
           .page-container { padding: 2rem; }
           .page-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 2rem; }
           .page-header h1 { font-size: 2rem; font-weight: 700; margin: 0; }
+          .load-more { display: flex; justify-content: center; margin-top: 1rem; }
           .table-container { background: white; border-radius: 8px; box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1); overflow-x: auto; }
           .data-table { width: 100%; border-collapse: collapse; }
           .data-table thead { background-color: #f9fafb; }
@@ -6,10 +6,13 @@ import Input from '../components/common/Input';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ErrorMessage from '../components/common/ErrorMessage';
 import EmptyState from '../components/common/EmptyState';
+import useCursorList from '../hooks/useCursorList';
 import { projectExpenseAPI, researchProjectAPI } from '../api/crudAPI';
 
 const ProjectExpensePage = () => {
-  const [expenses, setExpenses] = useState([]);
+  const {
+    items: expenses, hasMore, loadingMore, reload: reloadExpenses, loadMore,
+  } = useCursorList(projectExpenseAPI.getPage);
   const [projects, setProjects] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
@@ -27,11 +30,10 @@ const ProjectExpensePage = () => {
   const fetchData = async () => {
     try {
       setLoading(true);
-      const [expensesData, projectsData] = await Promise.all([
-        projectExpenseAPI.getAll(),
-        researchProjectAPI.getAll(),
+      const [, projectsData] = await Promise.all([
+        reloadExpenses(),
+        researchProjectAPI.getOptions({ fields: 'id,project_number,name' }),
       ]);
-      setExpenses(expensesData);
       setProjects(projectsData);
       setError(null);
     } catch (err) {
@@ -141,6 +143,14 @@ const ProjectExpensePage = () => {
           </div>
         )}
 
+        {hasMore && (
+          <div className="load-more">
+            <Button onClick={loadMore} variant="secondary" loading={loadingMore}>
+              더 보기
+            </Button>
+          </div>
+        )}
+
         <Modal isOpen={isModalOpen} onClose={() => setIsModalOpen(false)} title={editingExpense ? '집행내역 수정' : '새 집행내역'}>
           <form onSubmit={handleSubmit}>
             <Input label="집행ID" value={formData.execution_id} onChange={(e) => setFormData({ ...formData, execution_id: e.target.value })} required />
@@ -175,6 +185,7 @@ const ProjectExpensePage = () => {
           .page-container { padding: 2rem; }
           .page-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 2rem; }
           .page-header h1 { font-size: 2rem; font-weight: 700; margin: 0; }
+          .load-more { display: flex; justify-content: center; margin-top: 1rem; }
           .table-container { background: white; border-radius: 8px; box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1); overflow-x: auto; }
           .data-table { width: 100%; border-collapse: collapse; }
           .data-table thead { background-color: #f9fafb; }
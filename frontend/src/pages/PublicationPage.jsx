@@ -6,10 +6,13 @@ import Input from '../components/common/Input';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ErrorMessage from '../components/common/ErrorMessage';
 import EmptyState from '../components/common/EmptyState';
+import useCursorList from '../hooks/useCursorList';
 import { publicationAPI, departmentAPI } from '../api/crudAPI';
 
 const PublicationPage = () => {
-  const [publications, setPublications] = useState([]);
+  const {
+    items: publications, hasMore, loadingMore, reload: reloadPublications, loadMore,
+  } = useCursorList(publicationAPI.getPage);
   const [departments, setDepartments] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
@@ -26,11 +29,10 @@ const PublicationPage = () => {
   const fetchData = async () => {
     try {
       setLoading(true);
-      const [publicationsData, departmentsData] = await Promise.all([
-        publicationAPI.getAll(),
-        departmentAPI.getAll(),
+      const [, departmentsData] = await Promise.all([
+        reloadPublications(),
+        departmentAPI.getOptions({ fields: 'id,name,college_name' }),
       ]);
-      setPublications(publicationsData);
       setDepartments(departmentsData);
       setError(null);
     } catch (err) {
@@ -137,6 +139,14 @@ const PublicationPage = () => {
           </div>
         )}
 
+        {hasMore && (
+          <div className="load-more">
+            <Button onClick={loadMore} variant="secondary" loading={loadingMore}>
+              더 보기
+            </Button>
+          </div>
+        )}
+
         <Modal isOpen={isModalOpen} onClose={() => setIsModalOpen(false)} title={editingPublication ? '논문 수정' : '새 논문'}>
           <form onSubmit={handleSubmit}>
             <Input label="게재일" type="date" value={formData.publication_date} onChange={(e) => setFormData({ ...formData, publication_date: e.target.value })} required />
@@ -163,6 +173,7 @@ const PublicationPage = () => {
           .page-container { padding: 2rem; }
           .page-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 2rem; }
           .page-header h1 { font-size: 2rem; font-weight: 700; margin: 0; }
+          .load-more { display: flex; justify-content: center; margin-top: 1rem; }
           .table-container { background: white; border-radius: 8px; box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1); overflow-x: auto; }
           .data-table { width: 100%; border-collapse: collapse; }
           .data-table thead { background-color: #f9fafb; }
@@ -6,10 +6,13 @@ import Input from '../components/common/Input';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ErrorMessage from '../components/common/ErrorMessage';
 import EmptyState from '../components/common/EmptyState';
+import useCursorList from '../hooks/useCursorList';
 import { researchProjectAPI, departmentAPI } from '../api/crudAPI';
 
 const ResearchProjectPage = () => {
-  const [projects, setProjects] = useState([]);
+  const {
+    items: projects, hasMore, loadingMore, reload: reloadProjects, loadMore,
+  } = useCursorList(researchProjectAPI.getPage);
   const [departments, setDepartments] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
@@ -27,11 +30,10 @@ const ResearchProjectPage = () => {
   const fetchData = async () => {
     try {
       setLoading(true);
-      const [projectsData, departmentsData] = await Promise.all([
-        researchProjectAPI.getAll(),
-        departmentAPI.getAll(),
+      const [, departmentsData] = await Promise.all([
+        reloadProjects(),
+        departmentAPI.getOptions({ fields: 'id,name,college_name' }),
       ]);
-      setProjects(projectsData);
       setDepartments(departmentsData);
       setError(null);
     } catch (err) {
@@ -145,6 +147,14 @@ const ResearchProjectPage = () => {
           </div>
         )}
 
+        {hasMore && (
+          <div className="load-more">
+            <Button onClick={loadMore} variant="secondary" loading={loadingMore}>
+              더 보기
+            </Button>
+          </div>
+        )}
+
         <Modal isOpen={isModalOpen} onClose={() => setIsModalOpen(false)} title={editingProject ? '연구과제 수정' : '새 연구과제'}>
           <form onSubmit={handleSubmit}>
             <Input label="과제번호" value={formData.project_number} onChange={(e) => setFormData({ ...formData, project_number: e.target.value })} required />
@@ -172,6 +182,7 @@ const ResearchProjectPage = () => {
           .page-container { padding: 2rem; }
           .page-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 2rem; }
           .page-header h1 { font-size: 2rem; font-weight: 700; margin: 0; }
+          .load-more { display: flex; justify-content: center; margin-top: 1rem; }
           .table-container { background: white; border-radius: 8px; box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1); overflow-x: auto; }
           .data-table { width: 100%; border-collapse: collapse; }
           .data-table thead { background-color: #f9fafb; }
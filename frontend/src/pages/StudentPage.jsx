@@ -6,10 +6,13 @@ import Input from '../components/common/Input';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ErrorMessage from '../components/common/ErrorMessage';
 import EmptyState from '../components/common/EmptyState';
+import useCursorList from '../hooks/useCursorList';
 import { studentAPI, departmentAPI } from '../api/crudAPI';
 
 const StudentPage = () => {
-  const [students, setStudents] = useState([]);
+  const {
+    items: students, hasMore, loadingMore, reload: reloadStudents, loadMore,
+  } = useCursorList(studentAPI.getPage);
   const [departments, setDepartments] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
@@ -27,11 +30,10 @@ const StudentPage = () => {
   const fetchData = async () => {
     try {
       setLoading(true);
-      const [studentsData, departmentsData] = await Promise.all([
-        studentAPI.getAll(),
-        departmentAPI.getAll(),
+      const [, departmentsData] = await Promise.all([
+        reloadStudents(),
+        departmentAPI.getOptions({ fields: 'id,name,college_name' }),
       ]);
-      setStudents(studentsData);
       setDepartments(departmentsData);
       setError(null);
     } catch (err) {
@@ -164,6 +166,14 @@ const StudentPage = () => {
           </div>
         )}
 
+        {hasMore && (
+          <div className="load-more">
+            <Button onClick={loadMore} variant="secondary" loading={loadingMore}>
+              더 보기
+            </Button>
+          </div>
+        )}
+
         <Modal
           isOpen={isModalOpen}
           onClose={handleCloseModal}
@@ -238,6 +248,7 @@ const StudentPage = () => {
           .page-container { padding: 2rem; }
           .page-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 2rem; }
           .page-header h1 { font-size: 2rem; font-weight: 700; margin: 0; }
+          .load-more { display: flex; justify-content: center; margin-top: 1rem; }
           .table-container { background: white; border-radius: 8px; box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1); overflow-x: auto; }
           .data-table { width: 100%; border-collapse: collapse; }
           .data-table thead { background-color: #f9fafb; }
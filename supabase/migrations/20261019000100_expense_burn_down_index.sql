@@ -0,0 +1,9 @@
+-- =============================================================================
+-- 연구비 번다운 시계열 조회용 인덱스
+-- =============================================================================
+-- 작성일: 2026-10-19
+-- 설명: 과제별 월 단위 집행 집계(TruncMonth + 누적 합계)를 위한 복합 인덱스
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_project_expenses_project_date
+    ON public.project_expenses (project_id, execution_date);
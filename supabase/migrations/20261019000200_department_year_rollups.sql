@@ -0,0 +1,39 @@
+-- =============================================================================
+-- 학과 × 연도 집계 (팩트) 테이블
+-- =============================================================================
+-- 작성일: 2026-10-19
+-- 설명: 추이 차트가 원본 테이블을 매번 연도별로 그룹 집계하지 않도록
+--       Import 시 변경된 학과만 다시 계산하여 저장하는 집계 테이블
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.department_year_rollups (
+    id bigserial PRIMARY KEY,
+    department_id bigint NOT NULL REFERENCES public.departments(id) ON DELETE CASCADE,
+    year integer NOT NULL,
+    publication_count integer NOT NULL DEFAULT 0,
+    avg_impact_factor numeric(6, 3),
+    students_admitted integer NOT NULL DEFAULT 0,
+    project_count integer NOT NULL DEFAULT 0,
+    total_funding bigint NOT NULL DEFAULT 0,
+    total_expenses bigint NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    CONSTRAINT unique_department_year_rollup UNIQUE (department_id, year)
+);
+
+COMMENT ON TABLE public.department_year_rollups IS '학과×연도 집계 (Import 시 갱신)';
+COMMENT ON COLUMN public.department_year_rollups.publication_count IS '게재 논문 수';
+COMMENT ON COLUMN public.department_year_rollups.avg_impact_factor IS '평균 임팩트 팩터';
+COMMENT ON COLUMN public.department_year_rollups.students_admitted IS '입학년도 기준 학생 수';
+COMMENT ON COLUMN public.department_year_rollups.project_count IS '첫 집행 연도 기준 연구 과제 수';
+COMMENT ON COLUMN public.department_year_rollups.total_funding IS '첫 집행 연도 기준 총 연구비 (원)';
+COMMENT ON COLUMN public.department_year_rollups.total_expenses IS '집행완료 금액 (원)';
+
+CREATE INDEX IF NOT EXISTS idx_department_year_rollups_year
+    ON public.department_year_rollups (year);
+
+ALTER TABLE public.department_year_rollups ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Authenticated users can view department_year_rollups" ON public.department_year_rollups
+    FOR SELECT
+    TO authenticated
+    USING (true);
@@ -0,0 +1,32 @@
+-- =============================================================================
+-- 목록 API 키셋 페이지네이션용 복합 인덱스
+-- =============================================================================
+-- 작성일: 2026-10-19
+-- 설명: CRUD 목록 API가 (정렬 필드, id) 커서로 다음 페이지를 조회하므로
+--       OFFSET 없이 인덱스 범위 검색이 가능하도록 복합 인덱스 추가
+--       (내림차순 조회는 인덱스 역방향 스캔 사용)
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_colleges_created_at_id
+    ON public.colleges (created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_departments_created_at_id
+    ON public.departments (created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_students_created_at_id
+    ON public.students (created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_department_kpis_year_id
+    ON public.department_kpis (evaluation_year, id);
+
+CREATE INDEX IF NOT EXISTS idx_research_projects_created_at_id
+    ON public.research_projects (created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_project_expenses_date_id
+    ON public.project_expenses (execution_date, id);
+
+-- publication_date 단일 인덱스는 (publication_date, id) 인덱스로 대체
+CREATE INDEX IF NOT EXISTS idx_publications_date_id
+    ON public.publications (publication_date, id);
+
+DROP INDEX IF EXISTS public.idx_publications_date;
@@ -0,0 +1,47 @@
+-- =============================================================================
+-- 목록 API 서버 필터/검색용 인덱스
+-- =============================================================================
+-- 작성일: 2026-10-19
+-- 설명: CRUD 목록 API의 필터(학과, 상태, 과정, 입학년도, 게재일/집행일 범위,
+--       저널 등급) + 커서 정렬 조합과 이름/제목 부분 검색(?search=)을 위한 인덱스
+-- =============================================================================
+
+-- 학생: 학과 필터 + (created_at, id) 커서 정렬
+CREATE INDEX IF NOT EXISTS idx_students_dept_created
+    ON public.students (department_id, created_at, id);
+
+-- 학생: 학적 상태 / 과정 필터
+CREATE INDEX IF NOT EXISTS idx_students_status_level
+    ON public.students (status, program_level);
+
+-- 학생: 입학년도 필터
+CREATE INDEX IF NOT EXISTS idx_students_admission_year
+    ON public.students (admission_year);
+
+-- 논문: 학과 필터 + 게재일 범위 + (publication_date, id) 커서 정렬
+CREATE INDEX IF NOT EXISTS idx_pubs_dept_date
+    ON public.publications (department_id, publication_date, id);
+
+-- 논문: 저널 등급 필터 + 게재일 범위
+CREATE INDEX IF NOT EXISTS idx_pubs_rank_date
+    ON public.publications (journal_rank, publication_date);
+
+-- 집행내역: 상태 필터 + 집행일 범위 + (execution_date, id) 커서 정렬
+CREATE INDEX IF NOT EXISTS idx_expenses_status_date
+    ON public.project_expenses (status, execution_date, id);
+
+-- =============================================================================
+-- 부분 검색 (Django icontains -> UPPER(col::text) LIKE UPPER('%검색어%'))
+-- =============================================================================
+-- 트라이그램 GIN 인덱스는 PostgreSQL 전용이므로 Django 모델 Meta에는 선언하지 않음
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_students_name_trgm
+    ON public.students USING gin (upper(name::text) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_research_projects_name_trgm
+    ON public.research_projects USING gin (upper(name) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_publications_title_trgm
+    ON public.publications USING gin (upper(title) gin_trgm_ops);
@@ -0,0 +1,23 @@
+-- =============================================================================
+-- 논문 전문 검색 (제목/저널명/저자)
+-- =============================================================================
+-- 작성일: 2026-10-19
+-- 설명: GET /api/v1/dashboard/publications/search/?q= 에서 사용하는
+--       tsvector 생성 컬럼과 GIN 인덱스 (관련도 순위 + 하이라이트)
+--
+-- 한국어 형태소 분석 사전이 없으므로 'simple' 설정(소문자화 + 공백 분리)을
+-- 사용하고, 검색어는 단어별 접두어 일치(term:*)로 조사가 붙은 단어도 찾는다.
+-- 가중치: 제목(A) > 저널명(B) > 저자(C)
+-- =============================================================================
+
+ALTER TABLE public.publications
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(journal_name, '')), 'B') ||
+        setweight(to_tsvector('simple',
+            coalesce(primary_author, '') || ' ' || coalesce(contributing_authors, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_publications_search_vector
+    ON public.publications USING gin (search_vector);
@@ -0,0 +1,77 @@
+-- =============================================================================
+-- 목록 API 증분 동기화 (?since=)
+-- =============================================================================
+-- 작성일: 2026-10-19
+-- 설명: 클라이언트가 마지막 동기화 이후 생성/수정/삭제된 행만 받을 수 있도록
+--       각 테이블에 updated_at + (updated_at, id) 인덱스를 추가하고
+--       삭제된 행 ID를 기록하는 deleted_records(tombstone) 테이블 생성
+--
+-- updated_at은 Django(auto_now, 대량 수정 포함)가 갱신하고 삭제 기록은 API/관리자
+-- 삭제 시 Django가 남긴다. SQL로 직접 수정/삭제한 데이터는 추적되지 않는다.
+-- =============================================================================
+
+ALTER TABLE public.colleges
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS idx_colleges_updated_at_id
+    ON public.colleges (updated_at, id);
+
+ALTER TABLE public.departments
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS idx_departments_updated_at_id
+    ON public.departments (updated_at, id);
+
+ALTER TABLE public.students
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS idx_students_updated_at_id
+    ON public.students (updated_at, id);
+
+ALTER TABLE public.department_kpis
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS idx_department_kpis_updated_at_id
+    ON public.department_kpis (updated_at, id);
+
+ALTER TABLE public.publications
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS idx_publications_updated_at_id
+    ON public.publications (updated_at, id);
+
+ALTER TABLE public.research_projects
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS idx_research_projects_updated_at_id
+    ON public.research_projects (updated_at, id);
+
+ALTER TABLE public.project_expenses
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS idx_project_expenses_updated_at_id
+    ON public.project_expenses (updated_at, id);
+
+-- =============================================================================
+-- 삭제 기록 (tombstone)
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.deleted_records (
+    id bigserial PRIMARY KEY,
+    table_name varchar(100) NOT NULL,
+    record_id bigint,
+    deleted_at timestamptz NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE public.deleted_records IS '삭제된 행 기록 (목록 API 증분 동기화용)';
+COMMENT ON COLUMN public.deleted_records.record_id IS '삭제된 행 ID (NULL이면 Import로 테이블 전체 교체)';
+
+CREATE INDEX IF NOT EXISTS idx_deleted_records_table_deleted_at
+    ON public.deleted_records (table_name, deleted_at);
+
+ALTER TABLE public.deleted_records ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Authenticated users can view deleted_records" ON public.deleted_records
+    FOR SELECT
+    TO authenticated
+    USING (true);
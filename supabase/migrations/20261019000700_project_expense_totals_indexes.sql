@@ -0,0 +1,18 @@
+-- =============================================================================
+-- 과제 하위 집행내역 목록 / 과제별 집행 금액 집계용 인덱스
+-- =============================================================================
+-- 작성일: 2026-10-19
+-- 설명: /projects/{id}/expenses/ 커서 정렬과 과제 목록의 상태별 집행 금액
+--       (집행완료/처리중 합계, 잔액, 집행률) JOIN + GROUP BY 집계를 위한 인덱스
+-- =============================================================================
+
+-- 과제 하위 집행내역: 과제 필터 + (execution_date, id) 커서 정렬
+CREATE INDEX IF NOT EXISTS idx_expenses_project_date_id
+    ON public.project_expenses (project_id, execution_date, id);
+
+-- (project_id, execution_date) 인덱스(번다운 집계용)는 위 인덱스의 앞부분과 같으므로 대체
+DROP INDEX IF EXISTS public.idx_project_expenses_project_date;
+
+-- 과제별 상태별 집행 금액 합계 (amount까지 포함하여 테이블 조회 없이 집계)
+CREATE INDEX IF NOT EXISTS idx_expenses_project_status
+    ON public.project_expenses (project_id, status, amount);
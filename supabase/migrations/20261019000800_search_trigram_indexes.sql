@@ -0,0 +1,24 @@
+-- =============================================================================
+-- 목록 부분 검색(?search=) 트라이그램 인덱스 보완
+-- =============================================================================
+-- 작성일: 2026-10-19
+-- 설명: SearchFilter는 search_fields의 각 컬럼 icontains 조건을 OR로 묶는다.
+--       OR 조건의 컬럼 중 하나라도 인덱스가 없으면 BitmapOr를 만들 수 없어
+--       순차 스캔이 되므로, 검색 대상 컬럼 전부에 트라이그램 GIN 인덱스를 둔다.
+--       (학생: 이름 OR 학번, 과제: 과제명 OR 과제번호, 집행내역: 항목)
+--       이름/과제명/논문 제목 인덱스는 20261019000400_list_filter_indexes.sql 참고
+-- =============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 학생: 학번 부분 검색 (이름 인덱스와 BitmapOr)
+CREATE INDEX IF NOT EXISTS idx_students_id_number_trgm
+    ON public.students USING gin (upper(student_id_number::text) gin_trgm_ops);
+
+-- 연구과제: 과제번호 부분 검색 (과제명 인덱스와 BitmapOr)
+CREATE INDEX IF NOT EXISTS idx_research_projects_number_trgm
+    ON public.research_projects USING gin (upper(project_number::text) gin_trgm_ops);
+
+-- 집행내역: 항목 부분 검색
+CREATE INDEX IF NOT EXISTS idx_project_expenses_item_trgm
+    ON public.project_expenses USING gin (upper(item::text) gin_trgm_ops);